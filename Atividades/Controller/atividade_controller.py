@@ -1,12 +1,29 @@
+from datetime import date
+
 from flask import Blueprint, request, jsonify
 from Models.Atividade import Atividade, db
-import requests
+from gerenciamento_client import gerenciamento, GerenciamentoIndisponivel
+from filtros import ler_filtros
+from versoes import condicional
+from consultas import orcamento_consultas
 
 atividade_bp = Blueprint("atividade_bp", __name__)
 
-GERENCIAMENTO_URL = "http://localhost:5000"  # serviço de gerenciamento
+
+def ler_data(valor, campo):
+    """Converte `valor` (AAAA-MM-DD) em `date`. Lança ValueError com a mensagem de erro."""
+    try:
+        return date.fromisoformat(valor)
+    except (TypeError, ValueError):
+        raise ValueError(f"Campo '{campo}' inválido: {valor!r}. Use o formato AAAA-MM-DD.") from None
+
+
+@atividade_bp.errorhandler(GerenciamentoIndisponivel)
+def gerenciamento_indisponivel(e):
+    return jsonify({"erro": "Serviço de gerenciamento indisponível"}), 503
 
 @atividade_bp.route("/atividades", methods=["POST"])
+@orcamento_consultas(1)
 def criar_atividade():
     """
 Cria uma nova atividade após validar a existência de turma e professor associados
@@ -47,13 +64,19 @@ responses:
 """
 
     data = request.json
-    r_turma = requests.get(f"{GERENCIAMENTO_URL}/turmas/{data['turma_id']}")
-    if r_turma.status_code != 200:
-        return jsonify({"erro": "Turma não encontrada"}), 400
-    
-    r_prof = requests.get(f"{GERENCIAMENTO_URL}/professores/{data['professor_id']}")
-    if r_prof.status_code != 200:
-        return jsonify({"erro": "Professor não encontrado"}), 400
+    if not isinstance(data, dict):
+        return jsonify({"erro": "Envie um objeto JSON."}), 400
+    try:
+        data["data_entrega"] = ler_data(data.get("data_entrega"), "data_entrega")
+    except ValueError as e:
+        return jsonify({"erro": str(e)}), 400
+
+    erro = gerenciamento.verificar([
+        ("turmas", data['turma_id'], "Turma não encontrada"),
+        ("professores", data['professor_id'], "Professor não encontrado"),
+    ])
+    if erro:
+        return jsonify({"erro": erro}), 400
     
     atividade = Atividade(**data)
     db.session.add(atividade)
@@ -62,13 +85,24 @@ responses:
     return jsonify({"message": "Atividade criada com sucesso"}), 201
 
 @atividade_bp.route("/atividades", methods=["GET"])
+@condicional("atividades")
+@orcamento_consultas(1)
 def listar_atividades():
     """
-    Listar todas as atividades
+    Listar as atividades, com filtros opcionais aplicados direto no banco
     ---
 
     tags:
         - Atividades
+    parameters:
+        - name: turma_id
+          in: query
+          type: integer
+          required: false
+        - name: professor_id
+          in: query
+          type: integer
+          required: false
     responses:
         200:
             description: Lista de atividades
@@ -99,15 +133,29 @@ def listar_atividades():
                         professor_id:
                             type: integer
                             example: 4040
+        400:
+            description: Filtro inválido
         404:
             description: Nenhuma atividade encontrada
     """
-    atividades = Atividade.query.all()
+    try:
+        filtros = ler_filtros({"turma_id": int, "professor_id": int})
+    except ValueError as e:
+        return jsonify({"erro": str(e)}), 400
+
+    query = db.session.query(*Atividade.projecao)
+    if "turma_id" in filtros:
+        query = query.filter(Atividade.turma_id == filtros["turma_id"])
+    if "professor_id" in filtros:
+        query = query.filter(Atividade.professor_id == filtros["professor_id"])
+    atividades = query.all()
     if not atividades:
         return jsonify({"mensagem": "Nenhuma atividade encontrada"}), 404
-    return jsonify([atv.to_dict() for atv in atividades]), 200
+    return jsonify([Atividade.linha_to_dict(atv) for atv in atividades]), 200
 
 @atividade_bp.route("/atividades/<int:id>", methods=["GET"])
+@condicional("atividades")
+@orcamento_consultas(1)
 def obter_atividade(id):
     """
     Obter uma atividade específica através do ID
@@ -132,6 +180,7 @@ def obter_atividade(id):
     return jsonify(atividade.to_dict()),200
 
 @atividade_bp.route("/atividades/<int:id>", methods=["PUT"])
+@orcamento_consultas(3)
 def atualizar_atividade(id):
     """
     Atualizar uma atividade existente através do seu ID
@@ -171,37 +220,55 @@ def atualizar_atividade(id):
     responses:
         200:
             description: Atividade atualizada com sucesso
+            schema:
+                type: object
+                properties:
+                    mensagem:
+                        type: string
+                        example: Atividade atualizada com sucesso
+                    atividade:
+                        type: object
+                        description: A atividade com os dados atualizados (data_entrega em AAAA-MM-DD)
         400:
             description: Dados inválidos
         404:
             description: Atividade não encontrada
     """
     data = request.json
+    if not isinstance(data, dict):
+        return jsonify({"erro": "Envie um objeto JSON."}), 400
     atividade = Atividade.query.get(id)
     if not atividade:
         return jsonify({"erro": "Atividade não encontrada"}),404
-    
+
+    if "data_entrega" in data:
+        try:
+            data["data_entrega"] = ler_data(data["data_entrega"], "data_entrega")
+        except ValueError as e:
+            return jsonify({"erro": str(e)}), 400
+
+    verificacoes = []
     if "turma_id" in data:
-        r_turma = requests.get(f"{GERENCIAMENTO_URL}/turmas/{data['turma_id']}")
-        if r_turma.status_code != 200:
-            return jsonify({"erro": "Turma não encontrada"}), 400
-        atividade.turma_id = data["turma_id"]
-    
+        verificacoes.append(("turmas", data["turma_id"], "Turma não encontrada"))
     if "professor_id" in data:
-        r_prof = requests.get(f"{GERENCIAMENTO_URL}/professores/{data['professor_id']}")
-        if r_prof.status_code != 200:
-            return jsonify({"erro": "Professor não encontrado"}), 400
-        atividade.professor_id = data["professor_id"]
-
-        atividade.nome_atividade = data.get("nome_atividade", atividade.nome_atividade)
-        atividade.descricao = data.get("descricao", atividade.descricao)
-        atividade.peso_porcento = data.get("peso_porcento", atividade.peso_porcento)
-        atividade.data_entrega = data.get("data_entrega", atividade.data_entrega)
-        
-        db.session.commit()
-        return jsonify(f"Atividade atualizada com sucesso: {atividade.to_dict()}"),200
+        verificacoes.append(("professores", data["professor_id"], "Professor não encontrado"))
+
+    erro = gerenciamento.verificar(verificacoes)
+    if erro:
+        return jsonify({"erro": erro}), 400
+
+    atividade.turma_id = data.get("turma_id", atividade.turma_id)
+    atividade.professor_id = data.get("professor_id", atividade.professor_id)
+    atividade.nome_atividade = data.get("nome_atividade", atividade.nome_atividade)
+    atividade.descricao = data.get("descricao", atividade.descricao)
+    atividade.peso_porcento = data.get("peso_porcento", atividade.peso_porcento)
+    atividade.data_entrega = data.get("data_entrega", atividade.data_entrega)
+    
+    db.session.commit()
+    return jsonify({"mensagem": "Atividade atualizada com sucesso", "atividade": atividade.to_dict()}), 200
 
 @atividade_bp.route("/atividades/<int:id>", methods=["DELETE"])
+@orcamento_consultas(2)
 def deletar_atividade(id):
     """
     Deletar uma atividade através do seu ID
@@ -0,0 +1,142 @@
+from flask import Blueprint, jsonify
+from sqlalchemy import select
+from Models.Atividade import Atividade, db
+from Models.Nota import Nota
+from filtros import ler_filtros
+from versoes import condicional
+from consultas import orcamento_consultas
+
+estatistica_bp = Blueprint("estatistica_bp", __name__)
+
+PERCENTIS = (10, 25, 50, 75, 90)
+NOTA_MAXIMA = 10.0
+FAIXAS_MAXIMAS = 100
+
+
+def carregar_notas(turma_id=None, atividade_id=None):
+    """
+    Lê apenas a coluna `notas.nota` direto para um array NumPy, sem criar
+    objetos do ORM.
+
+    A consulta roda pelo Core (connection.execute) e as linhas são lidas do
+    cursor DBAPI, sem passar pelo processamento de Row do SQLAlchemy.
+    """
+    stmt = select(Nota.nota)
+    if turma_id is not None:
+        stmt = stmt.join(Atividade, Atividade.id == Nota.atividade_id).where(Atividade.turma_id == turma_id)
+    if atividade_id is not None:
+        stmt = stmt.where(Nota.atividade_id == atividade_id)
+
+    import numpy as np  # só as estatísticas usam o NumPy; fica fora da partida do serviço
+
+    resultado = db.session.connection().execute(stmt)
+    try:
+        return np.fromiter((linha[0] for linha in resultado.cursor), dtype=np.float64)
+    finally:
+        resultado.close()
+
+
+def calcular_estatisticas(notas, limite_aprovacao, faixas):
+    import numpy as np
+
+    inicio = min(0.0, float(notas.min()))
+    fim = max(NOTA_MAXIMA, float(notas.max()))
+    contagens, bordas = np.histogram(notas, bins=faixas, range=(inicio, fim))
+    valores_percentis = np.percentile(notas, PERCENTIS)
+
+    return {
+        "quantidade": int(notas.size),
+        "media": float(notas.mean()),
+        "mediana": float(np.median(notas)),
+        "desvio_padrao": float(notas.std()),
+        "minimo": float(notas.min()),
+        "maximo": float(notas.max()),
+        "percentis": {f"p{p}": float(v) for p, v in zip(PERCENTIS, valores_percentis)},
+        "histograma": [
+            {"de": float(bordas[i]), "ate": float(bordas[i + 1]), "quantidade": int(contagens[i])}
+            for i in range(len(contagens))
+        ],
+        "limite_aprovacao": limite_aprovacao,
+        "taxa_aprovacao": float(np.count_nonzero(notas >= limite_aprovacao) / notas.size)
+    }
+
+
+@estatistica_bp.route("/notas/estatisticas", methods=["GET"])
+@condicional("notas", "atividades")
+@orcamento_consultas(1)
+def estatisticas_notas():
+    """
+    Estatísticas de distribuição das notas
+    ---
+    tags:
+      - Notas
+    description: Calcula média, mediana, desvio padrão (populacional), percentis, histograma e taxa de aprovação das notas, opcionalmente restritas a uma turma e/ou atividade.
+    parameters:
+      - in: query
+        name: turma_id
+        type: integer
+        required: false
+      - in: query
+        name: atividade_id
+        type: integer
+        required: false
+      - in: query
+        name: aprovacao
+        type: number
+        required: false
+        description: Nota mínima para aprovação, de 0 a 10 (padrão 6.0)
+      - in: query
+        name: faixas
+        type: integer
+        required: false
+        description: Quantidade de faixas do histograma, de 1 a 100 (padrão 10)
+    responses:
+      200:
+        description: Estatísticas calculadas
+        schema:
+          type: object
+          properties:
+            quantidade:
+              type: integer
+              example: 40
+            media:
+              type: number
+              example: 7.1
+            mediana:
+              type: number
+              example: 7.5
+            desvio_padrao:
+              type: number
+              example: 1.8
+            percentis:
+              type: object
+            histograma:
+              type: array
+              items:
+                type: object
+            taxa_aprovacao:
+              type: number
+              example: 0.85
+      400:
+        description: Filtro inválido
+      404:
+        description: Nenhuma nota encontrada
+    """
+    try:
+        filtros = ler_filtros({"turma_id": int, "atividade_id": int, "aprovacao": float, "faixas": int})
+    except ValueError as e:
+        return jsonify({"erro": str(e)}), 400
+
+    faixas = filtros.get("faixas", 10)
+    if not 1 <= faixas <= FAIXAS_MAXIMAS:
+        return jsonify({"erro": f"Parâmetro 'faixas' deve estar entre 1 e {FAIXAS_MAXIMAS}"}), 400
+    aprovacao = filtros.get("aprovacao", 6.0)
+    if not 0 <= aprovacao <= NOTA_MAXIMA:
+        return jsonify({"erro": f"Parâmetro 'aprovacao' deve ser um número entre 0 e {NOTA_MAXIMA:g}"}), 400
+
+    notas = carregar_notas(filtros.get("turma_id"), filtros.get("atividade_id"))
+    if notas.size == 0:
+        return jsonify({"erro": "Nenhuma nota encontrada"}), 404
+
+    estatisticas = calcular_estatisticas(notas, aprovacao, faixas)
+    return jsonify(estatisticas), 200
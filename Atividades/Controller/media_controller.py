@@ -0,0 +1,147 @@
+from flask import Blueprint, jsonify
+from sqlalchemy import func, select
+from Models.Atividade import Atividade, db
+from Models.Nota import Nota
+from filtros import ler_filtros
+from versoes import condicional
+from consultas import orcamento_consultas
+
+media_bp = Blueprint("media_bp", __name__)
+
+
+def _consulta_medias():
+    """
+    SELECT aluno_id, SUM(nota * peso) / SUM(peso) ... FROM notas JOIN atividades
+    agrupado por aluno. Os filtros (turma/aluno) são adicionados por quem chama.
+    """
+    peso_total = func.sum(Atividade.peso_porcento)
+    return (
+        select(
+            Nota.aluno_id,
+            (func.sum(Nota.nota * Atividade.peso_porcento) / peso_total).label("media"),
+            func.count(Nota.id).label("atividades_avaliadas"),
+            peso_total.label("peso_total"),
+        )
+        .join(Atividade, Atividade.id == Nota.atividade_id)
+        .group_by(Nota.aluno_id)
+        .order_by(Nota.aluno_id)
+    )
+
+
+def _linha_para_dict(linha):
+    return {
+        "aluno_id": linha.aluno_id,
+        "media": linha.media,
+        "atividades_avaliadas": linha.atividades_avaliadas,
+        "peso_total": linha.peso_total
+    }
+
+
+@media_bp.route("/turmas/<int:turma_id>/medias", methods=["GET"])
+@condicional("notas", "atividades")
+@orcamento_consultas(1)
+def medias_da_turma(turma_id):
+    """
+    Média final ponderada de cada aluno de uma turma
+    ---
+    tags:
+      - Médias
+    description: Calcula SUM(nota * peso_porcento) / SUM(peso_porcento) por aluno, considerando as atividades da turma, em uma única consulta agrupada.
+    parameters:
+      - in: path
+        name: turma_id
+        type: integer
+        required: true
+    responses:
+      200:
+        description: Médias da turma
+        schema:
+          type: object
+          properties:
+            turma_id:
+              type: integer
+              example: 1
+            medias:
+              type: array
+              items:
+                type: object
+                properties:
+                  aluno_id:
+                    type: integer
+                    example: 3039
+                  media:
+                    type: number
+                    format: float
+                    example: 7.85
+                  atividades_avaliadas:
+                    type: integer
+                    example: 4
+                  peso_total:
+                    type: integer
+                    example: 100
+      404:
+        description: Nenhuma nota encontrada para a turma
+    """
+    stmt = _consulta_medias().where(Atividade.turma_id == turma_id)
+    linhas = db.session.execute(stmt).all()
+    if not linhas:
+        return jsonify({"erro": "Nenhuma nota encontrada para a turma"}), 404
+    return jsonify({"turma_id": turma_id, "medias": [_linha_para_dict(l) for l in linhas]}), 200
+
+
+@media_bp.route("/alunos/<int:aluno_id>/media", methods=["GET"])
+@condicional("notas", "atividades")
+@orcamento_consultas(1)
+def media_do_aluno(aluno_id):
+    """
+    Média final ponderada de um aluno
+    ---
+    tags:
+      - Médias
+    description: Calcula SUM(nota * peso_porcento) / SUM(peso_porcento) sobre as notas do aluno. Use turma_id para restringir às atividades de uma turma.
+    parameters:
+      - in: path
+        name: aluno_id
+        type: integer
+        required: true
+      - in: query
+        name: turma_id
+        type: integer
+        required: false
+    responses:
+      200:
+        description: Média do aluno
+        schema:
+          type: object
+          properties:
+            aluno_id:
+              type: integer
+              example: 3039
+            media:
+              type: number
+              format: float
+              example: 7.85
+            atividades_avaliadas:
+              type: integer
+              example: 4
+            peso_total:
+              type: integer
+              example: 100
+      400:
+        description: Filtro inválido
+      404:
+        description: Nenhuma nota encontrada para o aluno
+    """
+    try:
+        filtros = ler_filtros({"turma_id": int})
+    except ValueError as e:
+        return jsonify({"erro": str(e)}), 400
+
+    stmt = _consulta_medias().where(Nota.aluno_id == aluno_id)
+    if "turma_id" in filtros:
+        stmt = stmt.where(Atividade.turma_id == filtros["turma_id"])
+
+    linha = db.session.execute(stmt).first()
+    if not linha:
+        return jsonify({"erro": "Nenhuma nota encontrada para o aluno"}), 404
+    return jsonify(_linha_para_dict(linha)), 200
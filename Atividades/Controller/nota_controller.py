@@ -1,12 +1,20 @@
 from flask import Blueprint, request, jsonify
 from Models.Nota import Nota, db
-import requests
+from Models.Atividade import Atividade
+from gerenciamento_client import gerenciamento, GerenciamentoIndisponivel
+from filtros import ler_filtros
+from versoes import condicional
+from consultas import orcamento_consultas
 
 notatividade_bp = Blueprint("notatividade_bp", __name__)
 
-GERENCIAMENTO_URL = "http://localhost:5000"
+
+@notatividade_bp.errorhandler(GerenciamentoIndisponivel)
+def gerenciamento_indisponivel(e):
+    return jsonify({"erro": "Serviço de gerenciamento indisponível"}), 503
 
 @notatividade_bp.route("/notas", methods=["POST"])
+@orcamento_consultas(2)
 def criar_nota():
     """
     Criar uma nova nota
@@ -50,8 +58,8 @@ def criar_nota():
         description: Dados inválidos
     """
     data = request.json
-    r_atividade = requests.get(f"{GERENCIAMENTO_URL}/atividades/{data['atividade_id']}")
-    if r_atividade.status_code != 200:
+    # Atividades pertencem a este serviço: valida direto no banco local
+    if Atividade.query.get(data['atividade_id']) is None:
         return jsonify({"erro":"Atividade não encontrada"}), 400
     
     nota = Nota(**data)
@@ -62,12 +70,33 @@ def criar_nota():
 
 
 @notatividade_bp.route("/notas", methods=["GET"])
+@condicional("notas")
+@orcamento_consultas(1)
 def listar_notas():
     """
-    Listar todas as notas
+    Listar as notas, com filtros opcionais aplicados direto no banco
     ---
     tags:
       - Notas
+    parameters:
+      - in: query
+        name: aluno_id
+        type: integer
+        required: false
+      - in: query
+        name: atividade_id
+        type: integer
+        required: false
+      - in: query
+        name: min
+        type: number
+        required: false
+        description: Nota mínima (inclusive)
+      - in: query
+        name: max
+        type: number
+        required: false
+        description: Nota máxima (inclusive)
     responses:
       200:
         description: Lista de notas
@@ -89,17 +118,35 @@ def listar_notas():
               atividade_id:
                 type: integer
                 example: 4040
+      400:
+        description: Filtro inválido
       404:
         description: Nenhuma nota encontrada
     """
-    notas = Nota.query.all()
+    try:
+        filtros = ler_filtros({"aluno_id": int, "atividade_id": int, "min": float, "max": float})
+    except ValueError as e:
+        return jsonify({"erro": str(e)}), 400
+
+    query = db.session.query(*Nota.projecao)
+    if "aluno_id" in filtros:
+        query = query.filter(Nota.aluno_id == filtros["aluno_id"])
+    if "atividade_id" in filtros:
+        query = query.filter(Nota.atividade_id == filtros["atividade_id"])
+    if "min" in filtros:
+        query = query.filter(Nota.nota >= filtros["min"])
+    if "max" in filtros:
+        query = query.filter(Nota.nota <= filtros["max"])
+    notas = query.all()
 
     if not notas:
         return jsonify({"erro":"Nenhuma nota encontrada"}), 404
-    return jsonify([nt.to_dict() for nt in notas]), 200
+    return jsonify([Nota.linha_to_dict(nt) for nt in notas]), 200
 
 
 @notatividade_bp.route("/notas/<int:id>", methods=["GET"])
+@condicional("notas")
+@orcamento_consultas(1)
 def obter_nota(id):
     """
     Obter uma nota específica através do seu ID
@@ -140,6 +187,7 @@ def obter_nota(id):
 
 
 @notatividade_bp.route("/notas/<int:id>", methods=["PUT"])
+@orcamento_consultas(4)
 def atualizar_nota(id):
     """
     Atualizar uma nota existente através do ID
@@ -195,14 +243,12 @@ def atualizar_nota(id):
         return jsonify({"erro":"Nota não encontrada"}), 404
     
     if "aluno_id" in data:
-        r_aluno = requests.get(f"{GERENCIAMENTO_URL}/alunos/{data['aluno_id']}")
-        if r_aluno.status_code != 200:
+        if not gerenciamento.existe("alunos", data['aluno_id']):
             return jsonify({"erro":"Aluno não encontrado"}), 400
         nota.aluno_id = data["aluno_id"]
     
     if "atividade_id" in data:
-        r_atividade = requests.get(f"{GERENCIAMENTO_URL}/atividades/{data['atividade_id']}")
-        if r_atividade.status_code != 200:
+        if Atividade.query.get(data['atividade_id']) is None:
             return jsonify({"erro":"Atividade não encontrada"}), 400
         nota.atividade_id = data["atividade_id"]
 
@@ -213,6 +259,7 @@ def atualizar_nota(id):
 
 
 @notatividade_bp.route("/notas/<int:id>", methods=["DELETE"])
+@orcamento_consultas(2)
 def deletar_nota(id):
     """
     Deletar uma nota através do ID
@@ -2,7 +2,9 @@ from flask_sqlalchemy import SQLAlchemy
 from sqlalchemy import String, Integer, DATE
 from sqlalchemy.orm import Mapped, mapped_column
 from config import db
+from serializacao import serializavel
 
+@serializavel
 class Atividade(db.Model):
     __tablename__ = "atividades"
 
@@ -11,17 +13,5 @@ class Atividade(db.Model):
     descricao: Mapped[str] = mapped_column(String(255), nullable=True)
     peso_porcento: Mapped[int] = mapped_column(Integer, nullable=False)
     data_entrega: Mapped[DATE] = mapped_column(DATE, nullable=False)
-    turma_id: Mapped[int] = mapped_column(Integer, nullable=False)
-    professor_id: Mapped[int] = mapped_column(Integer, nullable=False)
-
-    def to_dict(self):
-        return {
-            "id": self.id,
-            "nome_atividade": self.nome_atividade,
-            "descricao": self.descricao,
-            "peso_porcento": self.peso_porcento,
-            "data_entrega": self.data_entrega.isoformat(),
-            "turma_id": self.turma_id,
-            "professor_id": self.professor_id
-        }
-
+    turma_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    professor_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
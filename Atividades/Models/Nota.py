@@ -2,19 +2,16 @@ from flask_sqlalchemy import SQLAlchemy
 from sqlalchemy import String, Integer, DATE
 from sqlalchemy.orm import Mapped, mapped_column
 from config import db
+from serializacao import serializavel
 
+@serializavel
 class Nota(db.Model):
     __tablename__ = "notas"
+    __table_args__ = (
+        db.Index("ix_notas_aluno_id_atividade_id", "aluno_id", "atividade_id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     nota: Mapped[float] = mapped_column(db.Float, nullable=False)
     aluno_id: Mapped[int] = mapped_column(Integer, nullable=False)
-    atividade_id: Mapped[int] = mapped_column(Integer, nullable=False)
-
-    def to_dict(self):
-        return {
-            "id": self.id,
-            "nota": self.nota,
-            "aluno_id": self.aluno_id,
-            "atividade_id": self.atividade_id
-        }
\ No newline at end of file
+    atividade_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
@@ -0,0 +1,19 @@
+"""
+Passo de build: gera Atividades/apispec.json, a especificação OpenAPI
+pré-compilada das docstrings, carregada pelo create_app() (ver apispec.py).
+
+    cd Atividades
+    python compilar_apispec.py [arquivo]
+"""
+import os
+import sys
+
+from run import create_app
+from apispec import ARQUIVO_PADRAO, gravar_apispec
+from config import swagger
+
+if __name__ == "__main__":
+    # banco em memória: o build não deve criar nem tocar no banco real
+    app = create_app({"SQLALCHEMY_DATABASE_URI": "sqlite://", "APISPEC_ARQUIVO": ""})
+    caminho = sys.argv[1] if len(sys.argv) > 1 else os.path.join(app.root_path, ARQUIVO_PADRAO)
+    print(gravar_apispec(app, swagger, caminho))
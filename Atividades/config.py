@@ -1,7 +1,57 @@
+import os
+
 from flask_sqlalchemy import SQLAlchemy
-from flask_migrate import Migrate
 from flasgger import Swagger
+from sqlalchemy import event
 
 db = SQLAlchemy()
-migrate = Migrate()
-swagger = Swagger()
\ No newline at end of file
+swagger = Swagger()
+
+# PRAGMAs aplicados a cada nova conexão SQLite. Cada valor pode ser
+# sobrescrito pela variável de ambiente SQLITE_<NOME> (ex: SQLITE_SYNCHRONOUS=FULL)
+# ou por app.config["SQLITE_PRAGMAS"].
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",          # leitores não bloqueiam o escritor
+    "synchronous": "NORMAL",        # seguro com WAL, evita fsync a cada commit
+    "mmap_size": 268435456,         # 256 MB
+    "cache_size": -64000,           # ~64 MB (valor negativo = KB)
+    "busy_timeout": 5000,           # ms esperando o lock antes de "database is locked"
+}
+
+
+def sqlite_pragmas(app):
+    pragmas = {}
+    for nome, padrao in SQLITE_PRAGMAS.items():
+        pragmas[nome] = os.environ.get(f"SQLITE_{nome.upper()}", padrao)
+    pragmas.update(app.config.get("SQLITE_PRAGMAS", {}))
+    return pragmas
+
+
+def aplicar_pragmas(dbapi_connection, pragmas):
+    cursor = dbapi_connection.cursor()
+    for nome, valor in pragmas.items():
+        cursor.execute(f"PRAGMA {nome}={valor}")
+    cursor.close()
+
+
+def configurar_banco(app, uri_padrao):
+    """
+    Configura o SQLAlchemy do app: URI (DATABASE_URL), opções do engine e os
+    PRAGMAs de SQLite aplicados no momento da conexão.
+    """
+    uri = app.config.setdefault("SQLALCHEMY_DATABASE_URI", os.environ.get("DATABASE_URL", uri_padrao))
+    sqlite = uri.startswith("sqlite")
+
+    if sqlite and ":memory:" not in uri and uri != "sqlite://":
+        app.config.setdefault("SQLALCHEMY_ENGINE_OPTIONS", {
+            "pool_size": int(os.environ.get("DB_POOL_SIZE", "10")),
+            "max_overflow": int(os.environ.get("DB_MAX_OVERFLOW", "20")),
+        })
+
+    db.init_app(app)
+
+    if sqlite:
+        pragmas = sqlite_pragmas(app)
+        with app.app_context():
+            event.listen(db.engine, "connect",
+                         lambda dbapi_connection, _: aplicar_pragmas(dbapi_connection, pragmas))
@@ -0,0 +1,170 @@
+import logging
+import os
+import threading
+import time
+
+from flask import current_app, request
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+EXTENSAO = "consultas"
+
+PADROES = {
+    "CONSULTAS_REPETIDAS": 5,   # execuções da mesma instrução numa requisição para avisar de N+1 (0 desliga)
+    "CONSULTAS_LENTA_MS": 200,  # instruções mais lentas vão para o log com o plano de execução (0 desliga)
+    "CONSULTAS_ESTRITO": 0,     # 1: estourar o orçamento levanta OrcamentoExcedido; N+1, ConsultasRepetidas
+}
+
+
+class OrcamentoExcedido(Exception):
+    """A requisição executou mais instruções SQL que o orçamento da rota."""
+
+
+class ConsultasRepetidas(Exception):
+    """A mesma instrução SQL rodou CONSULTAS_REPETIDAS vezes ou mais na requisição (N+1)."""
+
+
+def orcamento_consultas(maximo):
+    """
+    Declara quantas instruções SQL a view pode executar por requisição.
+    Usar abaixo do @route (e de @condicional):
+
+        @alunos_bp.route("/alunos/<int:aluno_id>", methods=["GET"])
+        @condicional("alunos")
+        @orcamento_consultas(1)
+        def obter_aluno(aluno_id):
+    """
+    def decorador(view):
+        view.orcamento_consultas = maximo
+        return view
+    return decorador
+
+
+class _Requisicao:
+    __slots__ = ("instrucoes", "repeticoes")
+
+    def __init__(self):
+        self.instrucoes = 0
+        self.repeticoes = {}
+
+
+class Consultas:
+    """
+    Acompanha as instruções SQL de cada requisição pelos eventos do engine:
+
+    - conta as instruções e compara com o orçamento declarado na view com
+      @orcamento_consultas; estourar gera um aviso no log ou, com
+      CONSULTAS_ESTRITO=1, um OrcamentoExcedido (nos testes, o test client
+      propaga a exceção e o teste falha);
+    - avisa quando a mesma instrução (mesmo SQL, parâmetros quaisquer) roda
+      CONSULTAS_REPETIDAS vezes ou mais na mesma requisição, o padrão N+1
+      (lotes de executemany não contam); com CONSULTAS_ESTRITO=1, levanta
+      ConsultasRepetidas;
+    - registra no log as instruções acima de CONSULTAS_LENTA_MS junto com o
+      plano de execução (EXPLAIN QUERY PLAN no SQLite), dentro ou fora de
+      requisições.
+
+    A contagem vai até o after_request: instruções de respostas em streaming
+    (NDJSON), executadas enquanto o corpo é enviado, ficam de fora.
+    """
+
+    def __init__(self, app, db):
+        self.config = {}
+        for nome, padrao in PADROES.items():
+            self.config[nome] = int(app.config.get(nome, os.environ.get(nome, padrao)))
+        self._local = threading.local()
+
+        with app.app_context():
+            engine = db.engine
+            self._explicar = "EXPLAIN QUERY PLAN " if engine.dialect.name == "sqlite" else "EXPLAIN "
+            event.listen(engine, "before_cursor_execute", self._antes_sql)
+            event.listen(engine, "after_cursor_execute", self._depois_sql)
+
+        app.before_request(self._antes)
+        app.after_request(self._conferir)
+        app.teardown_request(self._depois)
+
+    def _antes(self):
+        self._local.requisicao = _Requisicao()
+
+    def _depois(self, exc):
+        self._local.requisicao = None
+
+    def _antes_sql(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info["consultas_inicio"] = time.perf_counter()
+
+    def _depois_sql(self, conn, cursor, statement, parameters, context, executemany):
+        segundos = time.perf_counter() - conn.info.pop("consultas_inicio", time.perf_counter())
+        req = getattr(self._local, "requisicao", None)
+        if req is not None:
+            req.instrucoes += 1
+            # executemany (importação em lotes) é a solução do N+1, não o problema
+            if not executemany:
+                req.repeticoes[statement] = req.repeticoes.get(statement, 0) + 1
+
+        limite = self.config["CONSULTAS_LENTA_MS"]
+        if limite and segundos * 1000 >= limite and not executemany:
+            logger.warning("Instrução lenta (%.0f ms)%s:\n%s\nParâmetros: %r\nPlano:\n%s",
+                           segundos * 1000, self._rota(), statement, parameters,
+                           self.plano(conn, statement, parameters))
+
+    @staticmethod
+    def _rota():
+        return f" em {request.method} {request.path}" if request else ""
+
+    def plano(self, conn, statement, parameters):
+        """Plano de execução da instrução, numa conexão (e transação) já aberta."""
+        cursor = conn.connection.cursor()
+        try:
+            cursor.execute(self._explicar + statement, parameters)
+            linhas = cursor.fetchall()
+        except Exception as e:
+            return f"(indisponível: {e})"
+        finally:
+            cursor.close()
+        if self._explicar == "EXPLAIN QUERY PLAN ":
+            # (id, pai, _, detalhe): indenta pelo nível na árvore
+            niveis = {0: -1}
+            saida = []
+            for id, pai, _, detalhe in linhas:
+                niveis[id] = niveis.get(pai, -1) + 1
+                saida.append(f"{'  ' * niveis[id]}{detalhe}")
+        else:
+            saida = [" ".join(str(coluna) for coluna in linha) for linha in linhas]
+        return "\n".join(saida) or "(sem plano)"
+
+    def _conferir(self, resposta):
+        req = getattr(self._local, "requisicao", None)
+        if req is None:
+            return resposta
+
+        limite = self.config["CONSULTAS_REPETIDAS"]
+        if limite:
+            for statement, vezes in req.repeticoes.items():
+                if vezes >= limite:
+                    mensagem = (f"Possível N+1 em {request.method} {request.path}: "
+                                f"{vezes} execuções de\n{statement}")
+                    if self.config["CONSULTAS_ESTRITO"]:
+                        raise ConsultasRepetidas(mensagem)
+                    logger.warning(mensagem)
+
+        view = current_app.view_functions.get(request.endpoint)
+        maximo = getattr(view, "orcamento_consultas", None)
+        if maximo is not None and req.instrucoes > maximo:
+            mensagem = (f"{request.method} {request.path} ({request.endpoint}) executou "
+                        f"{req.instrucoes} instruções SQL; orçamento: {maximo}")
+            if self.config["CONSULTAS_ESTRITO"]:
+                raise OrcamentoExcedido(mensagem)
+            logger.warning(mensagem)
+        return resposta
+
+    def instrucoes(self):
+        """Instruções executadas até agora na requisição atual (None fora de requisições)."""
+        req = getattr(self._local, "requisicao", None)
+        return None if req is None else req.instrucoes
+
+
+def registrar_consultas(app, db):
+    app.extensions[EXTENSAO] = Consultas(app, db)
+    return app.extensions[EXTENSAO]
@@ -0,0 +1,25 @@
+import math
+
+from flask import request
+
+
+def ler_filtros(tipos):
+    """
+    Lê da query string os filtros declarados em `tipos` ({nome: tipo}).
+
+    Retorna apenas os filtros presentes, já convertidos. Lança ValueError com
+    uma mensagem legível se algum valor não puder ser convertido ou, nos
+    filtros float, não for finito (nan, inf), que o SQL compararia sem erro.
+    """
+    filtros = {}
+    for nome, tipo in tipos.items():
+        valor = request.args.get(nome)
+        if valor is None or valor == "":
+            continue
+        try:
+            filtros[nome] = tipo(valor)
+        except ValueError:
+            raise ValueError(f"Parâmetro '{nome}' inválido: {valor!r}")
+        if tipo is float and not math.isfinite(filtros[nome]):
+            raise ValueError(f"Parâmetro '{nome}' inválido: {valor!r}")
+    return filtros
@@ -0,0 +1,396 @@
+import ctypes
+import multiprocessing
+import operator
+import os
+import threading
+import time
+import weakref
+from bisect import bisect_left
+
+from flask import Response, request
+from sqlalchemy import event
+
+EXTENSAO = "metricas"
+MIMETYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+PADROES = {
+    "METRICAS": 1,                  # 0 desliga a instrumentação e a rota /metrics
+    "METRICAS_SLOTS": 256,          # áreas de contadores (uma por thread de cada processo)
+}
+
+# limites dos histogramas: segundos e quantidade de consultas por requisição
+LIMITES_SEGUNDOS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+LIMITES_CONSULTAS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+CLASSES_STATUS = ("1xx", "2xx", "3xx", "4xx", "5xx")
+RECURSOS_GERENCIAMENTO = ("alunos", "professores", "turmas")
+OPERACOES_GERENCIAMENTO = ("existe",)
+ERROS_GERENCIAMENTO = ("indisponivel", "http_4xx", "http_5xx")
+EVENTOS_POOL = ("connect", "close", "checkout", "checkin")
+
+_instancias = weakref.WeakSet()
+
+
+def _apos_fork():
+    # cada processo filho (worker do gunicorn) reserva os próprios slots
+    for metricas in list(_instancias):
+        metricas._local = threading.local()
+
+
+os.register_at_fork(after_in_child=_apos_fork)
+
+
+def _escapar(valor):
+    return str(valor).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _rotulos(**rotulos):
+    return ",".join(f'{nome}="{_escapar(valor)}"' for nome, valor in rotulos.items())
+
+
+def _numero(valor):
+    return str(int(valor)) if float(valor).is_integer() else repr(valor)
+
+
+def _vivo(pid):
+    if pid <= 0:
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class _Requisicao:
+    __slots__ = ("rota", "inicio", "status", "consultas", "tempo_sql", "inicio_sql")
+
+    def __init__(self, rota):
+        self.rota = rota
+        self.inicio = time.perf_counter()
+        self.status = 500
+        self.consultas = 0
+        self.tempo_sql = 0.0
+        self.inicio_sql = None
+
+
+class Metricas:
+    """
+    Métricas do app no formato de texto do Prometheus, em GET /metrics.
+
+    Todos os contadores ficam num único bloco de memória compartilhada
+    (RawArray) criado no create_app(): com o serve.py (preload_app) isso
+    acontece no processo mestre, antes do fork, e a rota /metrics de qualquer
+    worker soma os valores de todos. O bloco é dividido em slots; cada thread
+    de cada processo reserva o seu na primeira medição (um lock, uma vez só) e
+    daí em diante escreve nele sem lock, pois é a única a escrever ali. Se os
+    slots acabarem, as threads excedentes dividem um slot protegido por lock.
+
+    As séries de cada rota, das consultas ao gerenciamento e do pool vêm de
+    conjuntos fixos de rótulos conhecidos no create_app, para caberem no
+    bloco. Gauges (requisições em andamento, conexões do pool) consideram só
+    slots de processos vivos; contadores somam todos, e continuam crescendo
+    quando um worker é reiniciado.
+    """
+
+    def __init__(self, app, db, slots):
+        app.add_url_rule("/metrics", "metrics", self.rota_metricas, methods=["GET"])
+
+        # rotas: índice 0 agrupa requisições sem rota (404/405)
+        self.rotas = [_rotulos(blueprint="", route="", method="")]
+        self._indices_rotas = {}
+        for regra in sorted(app.url_map.iter_rules(), key=lambda r: (r.rule, r.endpoint)):
+            for metodo in sorted(regra.methods - {"HEAD", "OPTIONS"}):
+                self._indices_rotas[(regra.endpoint, metodo)] = len(self.rotas)
+                blueprint = regra.endpoint.rpartition(".")[0]
+                self.rotas.append(_rotulos(blueprint=blueprint, route=regra.rule, method=metodo))
+
+        compressao = app.extensions.get("compressao")
+        self.codificacoes = ["identity", *(compressao.codificacoes if compressao else ())]
+        self.chamadas = [(recurso, operacao) for recurso in RECURSOS_GERENCIAMENTO
+                         for operacao in OPERACOES_GERENCIAMENTO]
+
+        # deslocamentos de cada métrica dentro de um slot
+        self.largura = 0
+        rotas, chamadas = len(self.rotas), len(self.chamadas)
+        self._latencia = self._reservar(rotas, len(LIMITES_SEGUNDOS) + 2)
+        self._em_andamento = self._reservar(rotas, 1)
+        self._respostas = self._reservar(rotas, len(CLASSES_STATUS))
+        self._consultas = self._reservar(rotas, len(LIMITES_CONSULTAS) + 2)
+        self._tempo_sql = self._reservar(rotas, len(LIMITES_SEGUNDOS) + 2)
+        self._gerenciamento = self._reservar(chamadas, len(LIMITES_SEGUNDOS) + 2)
+        self._erros_gerenciamento = self._reservar(chamadas, len(ERROS_GERENCIAMENTO))
+        self._pool = self._reservar(1, len(EVENTOS_POOL))
+        self._compressao = self._reservar(len(self.codificacoes), 3)
+
+        self.slots = max(slots, 2)
+        self._valores = multiprocessing.RawArray(ctypes.c_double, self.slots * self.largura)
+        self._donos = multiprocessing.RawArray(ctypes.c_long, self.slots)
+        self._usados = multiprocessing.RawValue(ctypes.c_long, 0)
+        self._lock = multiprocessing.Lock()
+        self._compartilhado = (self.slots - 1) * self.largura
+        self._local = threading.local()
+        _instancias.add(self)
+
+        self._tamanho_pool = None
+        with app.app_context():
+            engine = db.engine
+            self._tamanho_pool = getattr(engine.pool, "size", lambda: None)()
+            event.listen(engine, "before_cursor_execute", self._antes_sql)
+            event.listen(engine, "after_cursor_execute", self._depois_sql)
+            for evento, indice in zip(EVENTOS_POOL, range(self._pool, self._pool + len(EVENTOS_POOL))):
+                event.listen(engine, evento, lambda *args, indice=indice: self._somar(((indice, 1.0),)))
+
+        app.before_request_funcs.setdefault(None, []).insert(0, self._antes)
+        app.after_request(self._resposta)
+        app.teardown_request(self._depois)
+        if compressao:
+            compressao.observadores.append(self.observar_compressao)
+            compressao.totais = self.totais_compressao
+
+    def _reservar(self, series, largura):
+        inicio = self.largura
+        self.largura += series * largura
+        return inicio
+
+    # -- escrita ------------------------------------------------------------
+
+    def _slot(self):
+        with self._lock:
+            slot = self._usados.value
+            if slot < self.slots - 1:
+                self._usados.value = slot + 1
+                self._donos[slot] = os.getpid()
+        base = slot * self.largura if slot < self.slots - 1 else self._compartilhado
+        self._local.base = base
+        return base
+
+    def _somar(self, incrementos):
+        """Aplica `(índice, valor)` no slot da thread atual."""
+        base = getattr(self._local, "base", None)
+        if base is None:
+            base = self._slot()
+        valores = self._valores
+        if base == self._compartilhado:
+            with self._lock:
+                for indice, valor in incrementos:
+                    valores[base + indice] += valor
+        else:
+            for indice, valor in incrementos:
+                valores[base + indice] += valor
+
+    @staticmethod
+    def _histograma(inicio, limites, valor):
+        # bucket do valor (não acumulado; o acúmulo é feito ao exportar) e soma
+        return (inicio + bisect_left(limites, valor), 1.0), (inicio + len(limites) + 1, valor)
+
+    def indice_rota(self, endpoint, metodo):
+        return self._indices_rotas.get((endpoint, metodo), 0)
+
+    def iniciar(self, rota):
+        """Marca o início de uma requisição da rota `rota` (ver indice_rota)."""
+        self._somar(((self._em_andamento + rota, 1.0),))
+        return _Requisicao(rota)
+
+    def finalizar(self, req):
+        rota = req.rota
+        largura_segundos = len(LIMITES_SEGUNDOS) + 2
+        self._somar((
+            (self._em_andamento + rota, -1.0),
+            (self._respostas + rota * len(CLASSES_STATUS) + min(max(req.status // 100, 1), 5) - 1, 1.0),
+            *self._histograma(self._latencia + rota * largura_segundos, LIMITES_SEGUNDOS,
+                              time.perf_counter() - req.inicio),
+            *self._histograma(self._consultas + rota * (len(LIMITES_CONSULTAS) + 2), LIMITES_CONSULTAS,
+                              req.consultas),
+            *self._histograma(self._tempo_sql + rota * largura_segundos, LIMITES_SEGUNDOS, req.tempo_sql),
+        ))
+
+    def _antes(self):
+        rota = self.indice_rota(request.url_rule.endpoint, request.method) if request.url_rule else 0
+        self._local.requisicao = self.iniciar(rota)
+
+    def _resposta(self, resposta):
+        req = getattr(self._local, "requisicao", None)
+        if req is not None:
+            req.status = resposta.status_code
+        return resposta
+
+    def _depois(self, exc):
+        req = getattr(self._local, "requisicao", None)
+        if req is None:
+            return
+        self._local.requisicao = None
+        self.finalizar(req)
+
+    def _antes_sql(self, conn, cursor, statement, parameters, context, executemany):
+        req = getattr(self._local, "requisicao", None)
+        if req is not None:
+            req.inicio_sql = time.perf_counter()
+
+    def _depois_sql(self, conn, cursor, statement, parameters, context, executemany):
+        req = getattr(self._local, "requisicao", None)
+        if req is not None and req.inicio_sql is not None:
+            req.consultas += 1
+            req.tempo_sql += time.perf_counter() - req.inicio_sql
+            req.inicio_sql = None
+
+    def observar_gerenciamento(self, operacao, recurso, segundos, erro=None):
+        """Observador do GerenciamentoClient: latência e erros de cada chamada."""
+        try:
+            chamada = self.chamadas.index((recurso, operacao))
+        except ValueError:
+            return
+        incrementos = self._histograma(self._gerenciamento + chamada * (len(LIMITES_SEGUNDOS) + 2),
+                                       LIMITES_SEGUNDOS, segundos)
+        if erro in ERROS_GERENCIAMENTO:
+            incrementos += ((self._erros_gerenciamento + chamada * len(ERROS_GERENCIAMENTO)
+                             + ERROS_GERENCIAMENTO.index(erro), 1.0),)
+        self._somar(incrementos)
+
+    def observar_compressao(self, codificacao, bytes_originais, bytes_enviados):
+        """Observador da Compressao: respostas e bytes antes/depois por codificação."""
+        if codificacao in self.codificacoes:
+            inicio = self._compressao + self.codificacoes.index(codificacao) * 3
+            self._somar(((inicio, 1.0), (inicio + 1, bytes_originais), (inicio + 2, bytes_enviados)))
+
+    # -- leitura ------------------------------------------------------------
+
+    def totais_compressao(self):
+        """Contadores de GET /compressao, somados entre os workers."""
+        todos, _ = self.somas()
+        totais = {}
+        for i, codificacao in enumerate(self.codificacoes):
+            respostas, originais, enviados = todos[self._compressao + i * 3:self._compressao + i * 3 + 3]
+            if respostas:
+                totais[codificacao] = {"respostas": int(respostas), "bytes_originais": int(originais),
+                                       "bytes_enviados": int(enviados)}
+        return totais
+
+    def somas(self):
+        """Soma dos slots: `(todos, só de processos vivos)`."""
+        usados = list(range(min(self._usados.value, self.slots - 1))) + [self.slots - 1]
+        todos = [0.0] * self.largura
+        vivos = [0.0] * self.largura
+        for slot in usados:
+            base = slot * self.largura
+            linha = self._valores[base:base + self.largura]
+            todos = list(map(operator.add, todos, linha))
+            if slot == self.slots - 1 or _vivo(self._donos[slot]):
+                vivos = list(map(operator.add, vivos, linha))
+        return todos, vivos
+
+    def _exportar_histograma(self, linhas, nome, rotulos, valores, inicio, limites):
+        separador = "," if rotulos else ""
+        acumulado = 0.0
+        for i, limite in enumerate(limites):
+            acumulado += valores[inicio + i]
+            linhas.append(f'{nome}_bucket{{{rotulos}{separador}le="{_numero(limite)}"}} {_numero(acumulado)}')
+        acumulado += valores[inicio + len(limites)]
+        linhas.append(f'{nome}_bucket{{{rotulos}{separador}le="+Inf"}} {_numero(acumulado)}')
+        linhas.append(f"{nome}_sum{{{rotulos}}} {_numero(valores[inicio + len(limites) + 1])}")
+        linhas.append(f"{nome}_count{{{rotulos}}} {_numero(acumulado)}")
+
+    def exportar(self):
+        todos, vivos = self.somas()
+        linhas = []
+
+        def cabecalho(nome, tipo, ajuda):
+            linhas.append(f"# HELP {nome} {ajuda}")
+            linhas.append(f"# TYPE {nome} {tipo}")
+
+        largura_segundos = len(LIMITES_SEGUNDOS) + 2
+        largura_consultas = len(LIMITES_CONSULTAS) + 2
+        # só rotas que já receberam requisições
+        rotas = [(i, rotulos) for i, rotulos in enumerate(self.rotas)
+                 if todos[self._latencia + i * largura_segundos + len(LIMITES_SEGUNDOS) + 1]
+                 or vivos[self._em_andamento + i]
+                 or any(todos[self._respostas + i * len(CLASSES_STATUS):
+                              self._respostas + (i + 1) * len(CLASSES_STATUS)])]
+
+        cabecalho("http_requests_in_flight", "gauge", "Requisições em andamento.")
+        for i, rotulos in rotas:
+            linhas.append(f"http_requests_in_flight{{{rotulos}}} {_numero(vivos[self._em_andamento + i])}")
+        cabecalho("http_request_duration_seconds", "histogram",
+                  "Latência das requisições, do before_request ao teardown.")
+        for i, rotulos in rotas:
+            self._exportar_histograma(linhas, "http_request_duration_seconds", rotulos, todos,
+                                      self._latencia + i * largura_segundos, LIMITES_SEGUNDOS)
+        cabecalho("http_responses_total", "counter", "Respostas por classe de status.")
+        for i, rotulos in rotas:
+            for j, classe in enumerate(CLASSES_STATUS):
+                valor = todos[self._respostas + i * len(CLASSES_STATUS) + j]
+                if valor:
+                    linhas.append(f'http_responses_total{{{rotulos},status="{classe}"}} {_numero(valor)}')
+        cabecalho("db_statements_per_request", "histogram", "Comandos SQL executados por requisição.")
+        for i, rotulos in rotas:
+            self._exportar_histograma(linhas, "db_statements_per_request", rotulos, todos,
+                                      self._consultas + i * largura_consultas, LIMITES_CONSULTAS)
+        cabecalho("db_statement_seconds_per_request", "histogram", "Tempo total em SQL por requisição.")
+        for i, rotulos in rotas:
+            self._exportar_histograma(linhas, "db_statement_seconds_per_request", rotulos, todos,
+                                      self._tempo_sql + i * largura_segundos, LIMITES_SEGUNDOS)
+
+        cabecalho("gerenciamento_request_duration_seconds", "histogram",
+                  "Latência das chamadas ao serviço de gerenciamento.")
+        for i, (recurso, operacao) in enumerate(self.chamadas):
+            inicio = self._gerenciamento + i * largura_segundos
+            if todos[inicio + len(LIMITES_SEGUNDOS) + 1] or any(todos[inicio:inicio + len(LIMITES_SEGUNDOS) + 1]):
+                self._exportar_histograma(linhas, "gerenciamento_request_duration_seconds",
+                                          _rotulos(resource=recurso, operation=operacao), todos, inicio,
+                                          LIMITES_SEGUNDOS)
+        cabecalho("gerenciamento_errors_total", "counter",
+                  "Chamadas ao gerenciamento que falharam (indisponível ou status inesperado).")
+        for i, (recurso, operacao) in enumerate(self.chamadas):
+            for j, erro in enumerate(ERROS_GERENCIAMENTO):
+                valor = todos[self._erros_gerenciamento + i * len(ERROS_GERENCIAMENTO) + j]
+                if valor:
+                    linhas.append(f"gerenciamento_errors_total{{{_rotulos(resource=recurso, operation=operacao, error=erro)}}} "
+                                  f"{_numero(valor)}")
+
+        conectadas, fechadas, retiradas, devolvidas = (vivos[self._pool + i] for i in range(len(EVENTOS_POOL)))
+        cabecalho("db_pool_connections", "gauge", "Conexões abertas nos pools dos processos vivos.")
+        linhas.append(f"db_pool_connections {_numero(conectadas - fechadas)}")
+        cabecalho("db_pool_checked_out", "gauge", "Conexões do pool em uso.")
+        linhas.append(f"db_pool_checked_out {_numero(retiradas - devolvidas)}")
+        cabecalho("db_pool_checkouts_total", "counter", "Conexões retiradas do pool.")
+        linhas.append(f"db_pool_checkouts_total {_numero(todos[self._pool + 2])}")
+        cabecalho("db_pool_connects_total", "counter", "Conexões abertas com o banco.")
+        linhas.append(f"db_pool_connects_total {_numero(todos[self._pool])}")
+        if self._tamanho_pool is not None:
+            cabecalho("db_pool_size", "gauge", "Tamanho configurado do pool, por processo.")
+            linhas.append(f"db_pool_size {_numero(self._tamanho_pool)}")
+
+        for sufixo, deslocamento, ajuda in (("responses_total", 0, "Respostas por codificação."),
+                                            ("original_bytes_total", 1, "Bytes antes da compressão."),
+                                            ("sent_bytes_total", 2, "Bytes enviados (após a compressão).")):
+            cabecalho(f"http_compression_{sufixo}", "counter", ajuda)
+            for i, codificacao in enumerate(self.codificacoes):
+                valor = todos[self._compressao + i * 3 + deslocamento]
+                linhas.append(f'http_compression_{sufixo}{{encoding="{codificacao}"}} {_numero(valor)}')
+
+        cabecalho("metrics_slots", "gauge", "Slots de métricas em uso e capacidade.")
+        linhas.append(f'metrics_slots{{state="used"}} {min(self._usados.value, self.slots - 1)}')
+        linhas.append(f'metrics_slots{{state="capacity"}} {self.slots - 1}')
+        return "\n".join(linhas) + "\n"
+
+    def rota_metricas(self):
+        return Response(self.exportar(), content_type=MIMETYPE)
+
+
+def registrar_metricas(app, db, clientes=()):
+    """
+    Instrumenta o app e expõe GET /metrics. Chamar no fim do create_app(),
+    depois de todas as rotas registradas (inclusive a de compressão), para que
+    todas tenham suas séries. `clientes` são os clientes do gerenciamento
+    cujas chamadas devem ser medidas. Com METRICAS=0 não faz nada.
+    """
+    config = {nome: int(app.config.get(nome, os.environ.get(nome, padrao))) for nome, padrao in PADROES.items()}
+    if not config["METRICAS"]:
+        return None
+    metricas = Metricas(app, db, config["METRICAS_SLOTS"])
+    for cliente in clientes:
+        cliente.observadores.append(metricas.observar_gerenciamento)
+    app.extensions[EXTENSAO] = metricas
+    return metricas
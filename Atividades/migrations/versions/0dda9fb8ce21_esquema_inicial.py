@@ -0,0 +1,49 @@
+"""esquema inicial
+
+Cria as tabelas apenas se ainda não existirem, para que bancos criados
+anteriormente com db.create_all() possam entrar no controle de migrations.
+
+Revision ID: 0dda9fb8ce21
+Revises: 
+Create Date: 2026-10-18 08:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0dda9fb8ce21'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    tabelas = sa.inspect(op.get_bind()).get_table_names()
+
+    if 'atividades' not in tabelas:
+        op.create_table('atividades',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('nome_atividade', sa.String(length=100), nullable=False),
+        sa.Column('descricao', sa.String(length=255), nullable=True),
+        sa.Column('peso_porcento', sa.Integer(), nullable=False),
+        sa.Column('data_entrega', sa.DATE(), nullable=False),
+        sa.Column('turma_id', sa.Integer(), nullable=False),
+        sa.Column('professor_id', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'notas' not in tabelas:
+        op.create_table('notas',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('nota', sa.Float(), nullable=False),
+        sa.Column('aluno_id', sa.Integer(), nullable=False),
+        sa.Column('atividade_id', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+        )
+
+
+def downgrade():
+    op.drop_table('notas')
+    op.drop_table('atividades')
@@ -0,0 +1,31 @@
+"""índices de chaves estrangeiras
+
+Revision ID: d20c9e2eef62
+Revises: 0dda9fb8ce21
+Create Date: 2026-10-18 08:31:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd20c9e2eef62'
+down_revision = '0dda9fb8ce21'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_atividades_turma_id', 'atividades', ['turma_id'], unique=False, if_not_exists=True)
+    op.create_index('ix_atividades_professor_id', 'atividades', ['professor_id'], unique=False, if_not_exists=True)
+    # (aluno_id, atividade_id) também atende buscas só por aluno_id
+    op.create_index('ix_notas_aluno_id_atividade_id', 'notas', ['aluno_id', 'atividade_id'], unique=False, if_not_exists=True)
+    op.create_index('ix_notas_atividade_id', 'notas', ['atividade_id'], unique=False, if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index('ix_notas_atividade_id', table_name='notas')
+    op.drop_index('ix_notas_aluno_id_atividade_id', table_name='notas')
+    op.drop_index('ix_atividades_professor_id', table_name='atividades')
+    op.drop_index('ix_atividades_turma_id', table_name='atividades')
@@ -1,28 +1,57 @@
-from flask import Flask
-from flasgger import Swagger
-from config import db, migrate, swagger
+import os
+from flask import Flask, jsonify
+from config import db, swagger, configurar_banco
 from Controller.atividade_controller import atividade_bp
 from Controller.nota_controller import notatividade_bp
+from Controller.media_controller import media_bp
+from Controller.estatistica_controller import estatistica_bp
+from gerenciamento_client import gerenciamento
+from versoes import registrar_versoes
+from compressao import registrar_compressao
+from metricas import registrar_metricas
+from consultas import registrar_consultas
+from serializacao import registrar_json
+from apispec import carregar_apispec
+from esquema import garantir_esquema, registrar_migrations
 
-def create_app():
+def create_app(config=None):
     app = Flask(__name__)
-    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///atividade.db'
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    if config:
+        app.config.update(config)
+    registrar_json(app)
 
-    db.init_app(app)
-    migrate.init_app(app, db)
+    configurar_banco(app, 'sqlite:///atividade.db')
+    registrar_migrations(app, db, os.path.join(app.root_path, 'migrations'))
     swagger.init_app(app)
 
     app.register_blueprint(atividade_bp)
     app.register_blueprint(notatividade_bp)
+    app.register_blueprint(media_bp)
+    app.register_blueprint(estatistica_bp)
+    registrar_versoes(app, db)
+    registrar_compressao(app)
+    registrar_consultas(app, db)
 
     @app.route('/')
     def home():
         return "Atividades API!"
+
+    @app.route('/cache/gerenciamento', methods=['GET'])
+    def cache_gerenciamento():
+        return jsonify(gerenciamento.cache.estatisticas()), 200
+
+    @app.route('/cache/gerenciamento', methods=['DELETE'])
+    def limpar_cache_gerenciamento():
+        gerenciamento.cache.limpar()
+        return jsonify({"mensagem": "Cache limpo com sucesso em todos os workers"}), 200
     
-    with app.app_context():
-        db.create_all()
+    # confere a revisão do esquema; migrations só rodam se houver pendentes
+    # (ou se o banco for novo)
+    garantir_esquema(app)
 
+    registrar_metricas(app, db, clientes=[gerenciamento])
+    carregar_apispec(app, swagger)
     return app
 if __name__ == '__main__':
     app=create_app()
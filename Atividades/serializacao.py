@@ -0,0 +1,156 @@
+from datetime import date, datetime
+
+from flask.json.provider import DefaultJSONProvider
+from sqlalchemy import inspect
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _padrao(obj):
+    # datas saem em ISO 8601 (AAAA-MM-DD), como o orjson já faz nativamente;
+    # o provider padrão do Flask usaria o formato de data HTTP.
+    if isinstance(obj, date):
+        return obj.isoformat()
+    return DefaultJSONProvider.default(obj)
+
+
+class ProvedorJson(DefaultJSONProvider):
+    """
+    Provider JSON do app (`app.json`), usado por jsonify, request.get_json e
+    current_app.json.dumps/loads.
+
+    Com o orjson instalado, serializa direto para bytes em C: datas, numpy,
+    dataclasses e chaves não-string são tratados nativamente, e o
+    `default` só é chamado para os tipos restantes (Decimal, UUID...). Sem o
+    orjson, cai no json da biblioteca padrão com o mesmo `default`.
+    """
+
+    default = staticmethod(_padrao)
+
+    def _opcoes(self, indentar=False):
+        opcoes = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if self.sort_keys:
+            opcoes |= orjson.OPT_SORT_KEYS
+        if indentar:
+            opcoes |= orjson.OPT_INDENT_2
+        return opcoes
+
+    def dumps_bytes(self, obj, indentar=False):
+        if orjson is None:
+            return super().dumps(obj, indent=2 if indentar else None).encode()
+        return orjson.dumps(obj, default=self.default, option=self._opcoes(indentar))
+
+    def dumps(self, obj, **kwargs):
+        if orjson is None or kwargs:
+            return super().dumps(obj, **kwargs)
+        return self.dumps_bytes(obj).decode()
+
+    def loads(self, s, **kwargs):
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        if orjson is None:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        # mesma regra do provider padrão: JSON indentado só em modo debug
+        indentar = self.compact is False or (self.compact is None and self._app.debug)
+        return self._app.response_class(self.dumps_bytes(obj, indentar), mimetype=self.mimetype)
+
+
+def registrar_json(app):
+    app.json = ProvedorJson(app)
+    return app.json
+
+
+def _iso(valor):
+    return None if valor is None else valor.isoformat()
+
+
+def _compilar(model, nome, codigo):
+    namespace = {"_iso": _iso}
+    exec(compile(codigo, f"<{nome} {model.__name__}>", "exec"), namespace)
+    funcao = namespace["serializar"]
+    funcao.__qualname__ = f"{model.__name__}.{nome}"
+    return funcao
+
+
+def _campos(model):
+    return [atributo.key for atributo in inspect(model).column_attrs]
+
+
+def _eh_data(model, campo):
+    try:
+        tipo = inspect(model).column_attrs[campo].columns[0].type.python_type
+    except NotImplementedError:
+        return False
+    return issubclass(tipo, (date, datetime))
+
+
+def _valor(model, campo, expressao):
+    # colunas de data saem em ISO 8601 já no dict, não só no JSON
+    return f"_iso({expressao})" if _eh_data(model, campo) else expressao
+
+
+def compilar_serializador(model):
+    """
+    Gera `serializar(obj) -> dict` para `model`, com uma chave por coluna
+    mapeada (nome do atributo). O corpo da função é montado uma única vez,
+    como um literal de dict, sem loop nem getattr por campo a cada registro.
+
+    Os valores já carregados são lidos direto do `__dict__` da instância,
+    sem passar pelos descriptors do ORM; se algum atributo estiver expirado
+    ou adiado (ex: logo após um commit), cai no acesso normal, que o carrega.
+    Colunas de data saem como texto ISO 8601 (AAAA-MM-DD).
+    """
+    campos = _campos(model)
+    direto = ", ".join(f"{campo!r}: {_valor(model, campo, f'd[{campo!r}]')}" for campo in campos)
+    por_atributo = ", ".join(f"{campo!r}: {_valor(model, campo, f'obj.{campo}')}" for campo in campos)
+    codigo = (
+        "def serializar(obj):\n"
+        "    d = obj.__dict__\n"
+        "    try:\n"
+        f"        return {{{direto}}}\n"
+        "    except KeyError:\n"
+        f"        return {{{por_atributo}}}\n"
+    )
+    serializar = _compilar(model, "to_dict", codigo)
+    serializar.campos = tuple(campos)
+    return serializar
+
+
+def compilar_serializador_linha(model):
+    """
+    Como `compilar_serializador`, mas para as linhas (tuplas) de
+    `select(*model.projecao)`: desempacota a tupla e monta o dict, sem
+    instanciar o model, sem identity map e sem controle de alterações. O
+    dict resultante é o mesmo do `to_dict`.
+    """
+    campos = _campos(model)
+    variaveis = [f"v{i}" for i in range(len(campos))]
+    corpo = ", ".join(f"{campo!r}: {_valor(model, campo, v)}" for campo, v in zip(campos, variaveis))
+    codigo = (
+        "def serializar(linha):\n"
+        f"    {', '.join(variaveis)}, = linha\n"
+        f"    return {{{corpo}}}\n"
+    )
+    return _compilar(model, "linha_to_dict", codigo)
+
+
+def serializavel(model):
+    """
+    Decorator de model. Define:
+
+    - `to_dict(obj)`: serializador compilado das instâncias;
+    - `projecao`: as colunas do model, para `select(*Model.projecao)`;
+    - `linha_to_dict(linha)`: serializador das linhas dessa projeção, usado
+      pelas listagens, que não precisam de instâncias do ORM.
+    """
+    model.to_dict = compilar_serializador(model)
+    model.projecao = tuple(getattr(model, campo) for campo in _campos(model))
+    model.linha_to_dict = staticmethod(compilar_serializador_linha(model))
+    return model
@@ -0,0 +1,41 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from run import create_app
+
+
+@pytest.fixture
+def app(tmp_path):
+    return create_app({
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'atividade.db'}",
+        "APISPEC_ARQUIVO": "",
+        "CONSULTAS_ESTRITO": 1,
+        "TESTING": True,
+    })
+
+
+ATIVIDADES = [(1, 1, 40), (2, 1, 60), (3, 2, 50)]  # (id, turma_id, peso_porcento)
+NOTAS = [(1, 1, 5.0), (1, 2, 10.0), (1, 3, 4.0), (2, 1, 7.0)]  # (aluno_id, atividade_id, nota)
+
+
+@pytest.fixture
+def notas(app):
+    """Atividades de pesos diferentes em duas turmas e as notas de dois alunos."""
+    from datetime import date
+
+    from config import db
+    from Models.Atividade import Atividade
+    from Models.Nota import Nota
+
+    with app.app_context():
+        db.session.add_all(Atividade(id=id, nome_atividade=f"Atividade {id}", peso_porcento=peso,
+                                     data_entrega=date(2025, 3, id), turma_id=turma_id, professor_id=1)
+                           for id, turma_id, peso in ATIVIDADES)
+        db.session.add_all(Nota(aluno_id=aluno_id, atividade_id=atividade_id, nota=nota)
+                           for aluno_id, atividade_id, nota in NOTAS)
+        db.session.commit()
+    return app.test_client()
@@ -0,0 +1,35 @@
+import pytest
+
+from gerenciamento_client import gerenciamento
+
+ATIVIDADE = {"nome_atividade": "Prova 1", "descricao": "Capítulos 1 a 3", "peso_porcento": 40,
+             "data_entrega": "2025-03-10", "turma_id": 1, "professor_id": 1}
+
+
+@pytest.fixture
+def cliente(app, monkeypatch):
+    # turma e professor existem no gerenciamento
+    monkeypatch.setattr(gerenciamento, "verificar", lambda verificacoes: None)
+    return app.test_client()
+
+
+def test_criar_e_atualizar_com_data_entrega(cliente):
+    assert cliente.post("/atividades", json=ATIVIDADE).status_code == 201
+    assert cliente.get("/atividades/1").get_json()["data_entrega"] == "2025-03-10"
+
+    resposta = cliente.put("/atividades/1", json={"data_entrega": "2025-04-01"})
+    assert resposta.status_code == 200
+    assert resposta.get_json()["atividade"] == ATIVIDADE | {"id": 1, "data_entrega": "2025-04-01"}
+    assert cliente.get("/atividades/1").get_json()["data_entrega"] == "2025-04-01"
+
+
+@pytest.mark.parametrize("data_entrega", ["10/03/2025", "2025-02-30", "", None, 20250310])
+def test_data_entrega_invalida(cliente, data_entrega):
+    resposta = cliente.post("/atividades", json=ATIVIDADE | {"data_entrega": data_entrega})
+    assert resposta.status_code == 400
+    assert "data_entrega" in resposta.get_json()["erro"]
+
+    assert cliente.post("/atividades", json=ATIVIDADE).status_code == 201
+    resposta = cliente.put("/atividades/1", json={"data_entrega": data_entrega})
+    assert resposta.status_code == 400
+    assert cliente.get("/atividades/1").get_json()["data_entrega"] == "2025-03-10"
@@ -0,0 +1,23 @@
+import pytest
+
+from Controller.estatistica_controller import FAIXAS_MAXIMAS
+
+
+def test_estatisticas(notas):
+    estatisticas = notas.get("/notas/estatisticas?turma_id=1&aprovacao=7&faixas=5").get_json()
+    assert estatisticas["quantidade"] == 3
+    assert estatisticas["media"] == pytest.approx(22 / 3)
+    assert estatisticas["taxa_aprovacao"] == pytest.approx(2 / 3)
+    assert [f["quantidade"] for f in estatisticas["histograma"]] == [0, 0, 1, 1, 1]
+
+
+@pytest.mark.parametrize("faixas, status", [(0, 400), (-1, 400), (FAIXAS_MAXIMAS + 1, 400), (10 ** 8, 400),
+                                            (1, 200), (FAIXAS_MAXIMAS, 200)])
+def test_limites_de_faixas(notas, faixas, status):
+    assert notas.get(f"/notas/estatisticas?faixas={faixas}").status_code == status
+
+
+@pytest.mark.parametrize("aprovacao, status", [("nan", 400), ("inf", 400), ("-inf", 400), (-1, 400), (10.5, 400),
+                                               (0, 200), (10, 200)])
+def test_limites_de_aprovacao(notas, aprovacao, status):
+    assert notas.get(f"/notas/estatisticas?aprovacao={aprovacao}").status_code == status
@@ -0,0 +1,14 @@
+import pytest
+
+
+@pytest.mark.parametrize("filtro", ["min=nan", "max=inf", "min=-inf", "max=NaN", "min=Infinity", "min=abc"])
+def test_filtro_float_nao_finito(notas, filtro):
+    resposta = notas.get(f"/notas?{filtro}")
+    assert resposta.status_code == 400
+    assert "inválido" in resposta.get_json()["erro"]
+
+
+def test_filtro_float_finito(notas):
+    resposta = notas.get("/notas?min=5&max=7.5")
+    assert sorted(n["nota"] for n in resposta.get_json()) == [5.0, 7.0]
+    assert notas.get("/notas?min=1e1").status_code == 200
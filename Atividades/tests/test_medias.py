@@ -0,0 +1,22 @@
+import pytest
+
+
+def test_medias_ponderadas_da_turma(notas):
+    resposta = notas.get("/turmas/1/medias")
+    assert resposta.status_code == 200
+    assert resposta.get_json() == {"turma_id": 1, "medias": [
+        # (5 * 40 + 10 * 60) / 100 e 7 * 40 / 40
+        {"aluno_id": 1, "media": 8.0, "atividades_avaliadas": 2, "peso_total": 100},
+        {"aluno_id": 2, "media": 7.0, "atividades_avaliadas": 1, "peso_total": 40},
+    ]}
+    assert notas.get("/turmas/9/medias").status_code == 404
+
+
+def test_media_ponderada_do_aluno(notas):
+    media = notas.get("/alunos/1/media").get_json()
+    # (5 * 40 + 10 * 60 + 4 * 50) / 150
+    assert media["media"] == pytest.approx(1000 / 150)
+    assert media["peso_total"] == 150
+    assert notas.get("/alunos/1/media?turma_id=1").get_json()["media"] == 8.0
+    assert notas.get("/alunos/1/media?turma_id=um").status_code == 400
+    assert notas.get("/alunos/3/media").status_code == 404
@@ -1,13 +1,142 @@
+from datetime import datetime
+
 from flask import Blueprint, request, jsonify
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
 from Models.Reserva import Reserva, db
-import requests
+from Models.ConfiguracaoReserva import ConfiguracaoReserva
+from gerenciamento_client import gerenciamento, GerenciamentoIndisponivel
+from versoes import condicional
+from consultas import orcamento_consultas
 
 reserva_bp = Blueprint('reserva_bp', __name__)
 
-GERENCIAMENTO_URL = "http://localhost:5000"  # serviço de gerenciamento
+# AAAA-MM-DD é o formato canônico; DD/MM/AAAA continua aceito no corpo das
+# requisições por compatibilidade com os clientes antigos.
+FORMATOS_DATA = ("%Y-%m-%d", "%d/%m/%Y")
+
+CAMPOS_ID = ("turma_id", "professor_id")
+CAMPOS_TEXTO = ("professor_nome", "materia")
+CAMPOS = CAMPOS_ID + CAMPOS_TEXTO + ("data_reserva",)
+TAMANHO_TEXTO = 100
+
+# mensagem do RAISE(ABORT) dos triggers de capacidade (ver migrations)
+MENSAGEM_CAPACIDADE = "capacidade de reservas excedida"
+
+
+def validar_campos(data, obrigatorios=True):
+    """
+    Mensagem de erro para o corpo de criação/atualização, ou None se válido.
+    Com `obrigatorios` (criação) todos os campos precisam estar presentes;
+    sem (atualização), só os enviados são conferidos. `data_reserva` só é
+    conferida quanto à presença; o formato fica com `ler_data`.
+    """
+    desconhecidos = sorted(set(data) - set(CAMPOS))
+    if desconhecidos:
+        return f"Campos desconhecidos: {', '.join(desconhecidos)}"
+    for campo in CAMPOS:
+        if campo not in data:
+            if obrigatorios:
+                return f"Campo '{campo}' é obrigatório."
+            continue
+        valor = data[campo]
+        if valor is None:
+            return f"Campo '{campo}' é obrigatório."
+        if campo in CAMPOS_ID and (not isinstance(valor, int) or isinstance(valor, bool)):
+            return f"Campo '{campo}' deve ser um número inteiro."
+        if campo in CAMPOS_TEXTO and (not isinstance(valor, str) or not valor.strip()
+                                      or len(valor) > TAMANHO_TEXTO):
+            return f"Campo '{campo}' deve ser um texto de 1 a {TAMANHO_TEXTO} caracteres."
+    return None
+
+
+def ler_data(valor, campo):
+    """Converte `valor` em `date`. Lança ValueError com a mensagem de erro."""
+    if isinstance(valor, str):
+        for formato in FORMATOS_DATA:
+            try:
+                return datetime.strptime(valor.strip(), formato).date()
+            except ValueError:
+                continue
+    raise ValueError(f"Campo '{campo}' inválido: {valor!r}. Use o formato AAAA-MM-DD.")
+
+
+@reserva_bp.errorhandler(GerenciamentoIndisponivel)
+def gerenciamento_indisponivel(e):
+    return jsonify({"erro": "Serviço de gerenciamento indisponível"}), 503
+
+
+def _conflito(turma_id, data_reserva):
+    """Corpo e status 409 com as reservas que já ocupam a turma na data."""
+    existentes = Reserva.query.filter_by(turma_id=turma_id, data_reserva=data_reserva).all()
+    return {
+        "erro": "A turma já atingiu a capacidade de reservas nesta data",
+        "capacidade": ConfiguracaoReserva.capacidade(),
+        "conflitos": [r.to_dict() for r in existentes]
+    }, 409
+
+
+def _erro_integridade(e, turma_id, data_reserva):
+    """
+    Só a violação dos triggers de capacidade é um conflito (409); as demais
+    (NOT NULL, tipos...) são dados inválidos e voltam com a mensagem do banco.
+    """
+    if MENSAGEM_CAPACIDADE in str(e.orig):
+        return _conflito(turma_id, data_reserva)
+    return {"erro": f"Dados inválidos: {e.orig}"}, 400
+
+
+# As funções abaixo separam as etapas de criação/atualização (validação local,
+# verificações no gerenciamento e gravação no banco) para serem reutilizadas
+# pelas views síncronas deste blueprint e pela variante assíncrona (asgi.py).
+# As de banco retornam `(corpo, status)` e precisam de um app context.
+
+def verificacoes_criacao(data):
+    return [
+        ("turmas", data['turma_id'], "Turma não encontrada"),
+        ("professores", data['professor_id'], "Professor não encontrado"),
+    ]
+
+
+def verificacoes_atualizacao(data):
+    verificacoes = []
+    if 'turma_id' in data:
+        verificacoes.append(("turmas", data['turma_id'], "Turma inválida"))
+    if 'professor_id' in data:
+        verificacoes.append(("professores", data['professor_id'], "Professor inválido"))
+    return verificacoes
+
+
+def gravar_reserva(data):
+    reserva = Reserva(**data)
+    db.session.add(reserva)
+    try:
+        db.session.commit()
+    except IntegrityError as e:
+        db.session.rollback()
+        return _erro_integridade(e, data['turma_id'], data['data_reserva'])
+    return {"mensagem": "Reserva criada com sucesso"}, 201
+
+
+def aplicar_atualizacao(reserva, data):
+    reserva.turma_id = data.get('turma_id', reserva.turma_id)
+    reserva.professor_id = data.get('professor_id', reserva.professor_id)
+
+    reserva.professor_nome = data.get('professor_nome', reserva.professor_nome)
+    reserva.materia = data.get('materia', reserva.materia)
+    reserva.data_reserva = data.get('data_reserva', reserva.data_reserva)
+
+    turma_id, data_reserva = reserva.turma_id, reserva.data_reserva
+    try:
+        db.session.commit()
+    except IntegrityError as e:
+        db.session.rollback()
+        return _erro_integridade(e, turma_id, data_reserva)
+    return reserva.to_dict(), 200
 
 
 @reserva_bp.route('/reservas', methods=['POST'])
+@orcamento_consultas(3)
 def criar_reserva():
     """
     Criar uma reserva
@@ -31,36 +160,62 @@ def criar_reserva():
               type: string
             data_reserva:
               type: string
+              format: date
+              example: "2023-12-31"
     responses:
       201:
         description: Reserva criada com sucesso
       400:
         description: Dados inválidos
+      409:
+        description: A turma já atingiu a capacidade de reservas nesta data; o corpo lista as reservas conflitantes em "conflitos"
     """
     data = request.json
+    if not isinstance(data, dict):
+        return jsonify({"erro": "Corpo da requisição deve ser um objeto JSON"}), 400
+    erro = validar_campos(data)
+    if erro:
+        return jsonify({"erro": erro}), 400
+    try:
+        data['data_reserva'] = ler_data(data.get('data_reserva'), 'data_reserva')
+    except ValueError as e:
+        return jsonify({"erro": str(e)}), 400
 
-    r_turma = requests.get(f"{GERENCIAMENTO_URL}/turmas/{data['turma_id']}")
-    if r_turma.status_code != 200:
-        return jsonify({"erro": "Turma não encontrada"}), 400
-
-    r_prof = requests.get(f"{GERENCIAMENTO_URL}/professores/{data['professor_id']}")
-    if r_prof.status_code != 200:
-        return jsonify({"erro": "Professor não encontrado"}), 400
-
-    reserva = Reserva(**data)
-    db.session.add(reserva)
-    db.session.commit()
+    erro = gerenciamento.verificar(verificacoes_criacao(data))
+    if erro:
+        return jsonify({"erro": erro}), 400
 
-    return jsonify({"mensagem": "Reserva criada com sucesso"}), 201
+    corpo, status = gravar_reserva(data)
+    return jsonify(corpo), status
 
 
 @reserva_bp.route('/reservas', methods=['GET'])
+@condicional('reservas')
+@orcamento_consultas(1)
 def listar_reservas():
     """
-    Listar todas as reservas
+    Listar reservas
     ---
     tags:
       - Reservas
+    description: Lista as reservas ordenadas por data, opcionalmente restritas a um intervalo de datas (inclusivo) e/ou a uma turma. Os filtros usam os índices (turma_id, data_reserva) e (data_reserva).
+    parameters:
+      - in: query
+        name: de
+        type: string
+        format: date
+        required: false
+        description: Data inicial (AAAA-MM-DD)
+      - in: query
+        name: ate
+        type: string
+        format: date
+        required: false
+        description: Data final (AAAA-MM-DD)
+      - in: query
+        name: turma_id
+        type: integer
+        required: false
     responses:
       200:
         description: Lista de reservas
@@ -81,13 +236,94 @@ def listar_reservas():
                 type: string
               data_reserva:
                 type: string
+                format: date
+      400:
+        description: Filtro inválido
+    """
+    stmt = select(*Reserva.projecao).order_by(Reserva.data_reserva, Reserva.id)
+
+    if 'turma_id' in request.args:
+        turma_id = request.args['turma_id']
+        if not turma_id.isdigit():
+            return jsonify({"erro": f"Parâmetro 'turma_id' inválido: {turma_id!r}"}), 400
+        stmt = stmt.where(Reserva.turma_id == int(turma_id))
+
+    try:
+        de = ler_data(request.args['de'], 'de') if 'de' in request.args else None
+        ate = ler_data(request.args['ate'], 'ate') if 'ate' in request.args else None
+    except ValueError as e:
+        return jsonify({"erro": str(e)}), 400
+    if de and ate and de > ate:
+        return jsonify({"erro": "Parâmetro 'de' deve ser anterior ou igual a 'ate'"}), 400
+
+    if de:
+        stmt = stmt.where(Reserva.data_reserva >= de)
+    if ate:
+        stmt = stmt.where(Reserva.data_reserva <= ate)
 
+    linhas = db.session.execute(stmt)
+    return jsonify([Reserva.linha_to_dict(linha) for linha in linhas]), 200
+
+
+@reserva_bp.route('/reservas/conflitos', methods=['GET'])
+@condicional('reservas', 'reservas_configuracao')
+@orcamento_consultas(2)
+def listar_conflitos():
     """
-    reservas = Reserva.query.all()
-    return jsonify([r.to_dict() for r in reservas]), 200
+    Listar datas em que uma turma tem mais reservas do que a capacidade
+    ---
+    tags:
+      - Reservas
+    responses:
+      200:
+        description: Turmas/datas acima da capacidade (padrão 1, ou seja, reservas duplicadas)
+        schema:
+          type: array
+          items:
+            type: object
+            properties:
+              turma_id:
+                type: integer
+                example: 3039
+              data_reserva:
+                type: string
+                format: date
+                example: "2023-12-31"
+              quantidade:
+                type: integer
+                example: 2
+              reserva_ids:
+                type: array
+                items:
+                  type: integer
+                example: [4, 9]
+    """
+    stmt = (
+        select(
+            Reserva.turma_id,
+            Reserva.data_reserva,
+            func.count(Reserva.id).label("quantidade"),
+            func.group_concat(Reserva.id).label("reserva_ids"),
+        )
+        .group_by(Reserva.turma_id, Reserva.data_reserva)
+        .having(func.count(Reserva.id) > ConfiguracaoReserva.capacidade())
+        .order_by(Reserva.data_reserva, Reserva.turma_id)
+    )
+    conflitos = [
+        {
+            "turma_id": linha.turma_id,
+            "data_reserva": linha.data_reserva.isoformat(),
+            "quantidade": linha.quantidade,
+            "reserva_ids": sorted(int(id) for id in linha.reserva_ids.split(","))
+        }
+        for linha in db.session.execute(stmt)
+    ]
+    return jsonify(conflitos), 200
 
 
 @reserva_bp.route('/reservas/<int:id>', methods=['GET'])
+@condicional('reservas')
+@orcamento_consultas(1)
 def buscar_reserva(id):
     """
     Buscar reserva por ID
@@ -134,6 +370,7 @@ def buscar_reserva(id):
 
 
 @reserva_bp.route('/reservas/<int:id>', methods=['PUT'])
+@orcamento_consultas(4)
 def atualizar_reserva(id):
     """
     Atualizar uma reserva
@@ -160,6 +397,8 @@ def atualizar_reserva(id):
               type: string
             data_reserva:
               type: string
+              format: date
+              example: "2023-12-31"
     responses:
       200:
         description: Reserva atualizada
@@ -185,36 +424,41 @@ def atualizar_reserva(id):
               type: string
               format: date
               example: "2023-12-31"
+      400:
+        description: Dados inválidos
       404:
         description: Reserva não encontrada
+      409:
+        description: A turma já atingiu a capacidade de reservas nesta data; o corpo lista as reservas conflitantes em "conflitos"
     """
     data = request.json
+    if not isinstance(data, dict):
+        return jsonify({"erro": "Corpo da requisição deve ser um objeto JSON"}), 400
     reserva = Reserva.query.get(id)
 
     if not reserva:
         return jsonify({"erro": "Reserva não encontrada"}), 404
 
-    if 'turma_id' in data:
-        r_turma = requests.get(f"{GERENCIAMENTO_URL}/turmas/{data['turma_id']}")
-        if r_turma.status_code != 200:
-            return jsonify({"erro": "Turma inválida"}), 400
-        reserva.turma_id = data['turma_id']
+    erro = validar_campos(data, obrigatorios=False)
+    if erro:
+        return jsonify({"erro": erro}), 400
 
-    if 'professor_id' in data:
-        r_prof = requests.get(f"{GERENCIAMENTO_URL}/professores/{data['professor_id']}")
-        if r_prof.status_code != 200:
-            return jsonify({"erro": "Professor inválido"}), 400
-        reserva.professor_id = data['professor_id']
+    if 'data_reserva' in data:
+        try:
+            data['data_reserva'] = ler_data(data['data_reserva'], 'data_reserva')
+        except ValueError as e:
+            return jsonify({"erro": str(e)}), 400
 
-    reserva.professor_nome = data.get('professor_nome', reserva.professor_nome)
-    reserva.materia = data.get('materia', reserva.materia)
-    reserva.data_reserva = data.get('data_reserva', reserva.data_reserva)
+    erro = gerenciamento.verificar(verificacoes_atualizacao(data))
+    if erro:
+        return jsonify({"erro": erro}), 400
 
-    db.session.commit()
-    return jsonify(reserva.to_dict()), 200
+    corpo, status = aplicar_atualizacao(reserva, data)
+    return jsonify(corpo), status
 
 
 @reserva_bp.route('/reservas/<int:id>', methods=['DELETE'])
+@orcamento_consultas(2)
 def deletar_reserva(id):
     """
     Deletar uma reserva
@@ -0,0 +1,31 @@
+from sqlalchemy import Integer
+from sqlalchemy.orm import Mapped, mapped_column
+from config import db
+
+
+class ConfiguracaoReserva(db.Model):
+    """
+    Linha única (id=1) com a capacidade de reservas por turma e data.
+
+    Os triggers `reservas_capacidade_insert`/`reservas_capacidade_update`
+    (ver migrations) leem este valor e abortam o INSERT/UPDATE que exceder a
+    capacidade, de modo que o limite é garantido pelo próprio banco.
+    """
+    __tablename__ = "reservas_configuracao"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    capacidade_por_data: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+
+    @staticmethod
+    def capacidade():
+        configuracao = db.session.get(ConfiguracaoReserva, 1)
+        return configuracao.capacidade_por_data if configuracao else 1
+
+    @staticmethod
+    def definir_capacidade(capacidade):
+        configuracao = db.session.get(ConfiguracaoReserva, 1)
+        if configuracao is None:
+            db.session.add(ConfiguracaoReserva(id=1, capacidade_por_data=capacidade))
+        elif configuracao.capacidade_por_data != capacidade:
+            configuracao.capacidade_por_data = capacidade
+        db.session.commit()
@@ -1,25 +1,22 @@
+from datetime import date
+
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import String, Integer
+from sqlalchemy import String, Integer, Date
 from sqlalchemy.orm import Mapped, mapped_column
 from config import db
+from serializacao import serializavel
 
 
+@serializavel
 class Reserva(db.Model):
     __tablename__ = "reservas"
+    __table_args__ = (
+        db.Index("ix_reservas_turma_id_data_reserva", "turma_id", "data_reserva"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     turma_id: Mapped[int] = mapped_column(Integer, nullable=False)
-    professor_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    professor_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
     professor_nome: Mapped[str] = mapped_column(String(100), nullable=False)
     materia: Mapped[str] = mapped_column(String(100), nullable=False)
-    data_reserva: Mapped[str] = mapped_column(String(10), nullable=False)  
-
-    def to_dict(self):
-        return {
-            "id": self.id,
-            "turma_id": self.turma_id,
-            "professor_id": self.professor_id,
-            "professor_nome": self.professor_nome,
-            "materia": self.materia,
-            "data_reserva": self.data_reserva
-        }
\ No newline at end of file
+    data_reserva: Mapped[date] = mapped_column(Date, nullable=False, index=True)
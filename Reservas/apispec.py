@@ -0,0 +1,89 @@
+import hashlib
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+ARQUIVO_PADRAO = "apispec.json"
+
+
+def _nome(obj):
+    # callables da config do flasgger (rule_filter, model_filter...) entram
+    # pelo nome, não pelo repr com endereço de memória
+    return getattr(obj, "__qualname__", type(obj).__name__)
+
+
+def _documentacao(view):
+    partes = [view.__doc__ or ""]
+    classe = getattr(view, "view_class", None)
+    if classe is not None:
+        for metodo in sorted(getattr(classe, "methods", None) or ()):
+            partes.append(getattr(getattr(classe, metodo.lower(), None), "__doc__", None) or "")
+    return "\n".join(partes)
+
+
+def impressao_digital(app, swagger):
+    """
+    Hash das rotas do app (regra, métodos, docstring da view) e da
+    configuração do flasgger: tudo de que a especificação gerada depende.
+    Calculá-lo não exige interpretar o YAML das docstrings.
+    """
+    h = hashlib.sha256()
+    for regra in sorted(app.url_map.iter_rules(), key=lambda r: (r.rule, r.endpoint)):
+        h.update(f"{regra.rule} {sorted(regra.methods)} {regra.endpoint}\n".encode())
+        h.update(_documentacao(app.view_functions[regra.endpoint]).encode())
+    h.update(json.dumps([swagger.config, swagger.template], sort_keys=True, default=_nome).encode())
+    return h.hexdigest()
+
+
+def caminho_apispec(app):
+    """Caminho do artefato (APISPEC_ARQUIVO; vazio desliga o uso do artefato)."""
+    padrao = os.path.join(app.root_path, ARQUIVO_PADRAO)
+    return app.config.get("APISPEC_ARQUIVO", os.environ.get("APISPEC_ARQUIVO", padrao))
+
+
+def compilar_apispec(app, swagger):
+    """Gera as especificações (uma por spec do flasgger) a partir das docstrings."""
+    specs = {}
+    with app.test_request_context():
+        for spec in swagger.config["specs"]:
+            swagger.apispecs.pop(spec["endpoint"], None)
+            specs[spec["endpoint"]] = swagger.get_apispecs(spec["endpoint"])
+    return {"impressao_digital": impressao_digital(app, swagger), "specs": specs}
+
+
+def gravar_apispec(app, swagger, caminho):
+    # app.json: o mesmo provider que serve /apispec_1.json (as datas dos
+    # exemplos no YAML viram `date` e saem em AAAA-MM-DD)
+    conteudo = app.json.dumps(compilar_apispec(app, swagger))
+    temporario = f"{caminho}.tmp"
+    with open(temporario, "w", encoding="utf-8") as f:
+        f.write(conteudo)
+    os.replace(temporario, caminho)
+    return caminho
+
+
+def carregar_apispec(app, swagger):
+    """
+    Carrega a especificação pré-compilada (ver compilar_apispec.py) no cache
+    do flasgger, que então serve /apispec_1.json sem interpretar nenhuma
+    docstring. Chamar no fim do create_app(), com todas as rotas registradas.
+
+    Sem o artefato, ou se ele não corresponde mais às rotas/docstrings atuais
+    (impressão digital diferente), nada é carregado e o flasgger gera a
+    especificação das docstrings como antes. Em modo debug o flasgger ignora
+    o cache e sempre relê as docstrings.
+    """
+    caminho = caminho_apispec(app)
+    if not caminho or not os.path.exists(caminho):
+        return False
+
+    with open(caminho, encoding="utf-8") as f:
+        dados = json.load(f)
+    if dados.get("impressao_digital") != impressao_digital(app, swagger):
+        logger.warning("%s desatualizado em relação às rotas; gerando a especificação das docstrings", caminho)
+        return False
+
+    swagger.apispecs.update(dados["specs"])
+    return True
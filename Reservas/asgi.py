@@ -0,0 +1,194 @@
+"""
+Variante assíncrona (ASGI) do serviço de reservas.
+
+POST /reservas e PUT /reservas/<id> — as rotas que esperam o gerenciamento —
+rodam nativamente em asyncio: as verificações usam o
+`AsyncGerenciamentoClient` (aiohttp, pool de conexões) e o trabalho de banco vai
+para um pool limitado de threads (RESERVAS_DB_THREADS). Enquanto o
+gerenciamento não responde, a requisição não ocupa nenhuma thread, então um
+único processo sustenta milhares de reservas em andamento.
+
+As demais rotas (listagens, Swagger, cache...) continuam sendo servidas pelo
+app Flask, via a2wsgi, num pool próprio de threads (RESERVAS_WSGI_THREADS).
+As duas rotas nativas também entram em GET /metrics (latência, status e
+requisições em andamento), com os mesmos rótulos da versão Flask.
+
+    cd Reservas
+    python asgi.py                      # ou: uvicorn asgi:app --port 5001
+
+Usa SERVER_BIND e LOG_LEVEL como o serve.py.
+"""
+import asyncio
+import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+from a2wsgi import WSGIMiddleware
+
+from Controller.reserva_controller import (
+    aplicar_atualizacao,
+    gravar_reserva,
+    ler_data,
+    reserva_bp,
+    validar_campos,
+    verificacoes_atualizacao,
+    verificacoes_criacao,
+)
+from Models.Reserva import Reserva, db
+from gerenciamento_client import GerenciamentoIndisponivel
+from gerenciamento_client_async import AsyncGerenciamentoClient
+from run import create_app
+
+DB_THREADS = int(os.environ.get("RESERVAS_DB_THREADS", os.environ.get("DB_POOL_SIZE", "10")))
+WSGI_THREADS = int(os.environ.get("RESERVAS_WSGI_THREADS", "10"))
+
+ROTA_RESERVA = re.compile(r"^/reservas/(\d+)$")
+
+logger = logging.getLogger(__name__)
+
+
+class RespostaErro(Exception):
+    def __init__(self, corpo, status):
+        self.corpo = corpo
+        self.status = status
+
+
+class ReservasAsgi:
+    def __init__(self, flask_app, cliente=None, db_threads=DB_THREADS, wsgi_threads=WSGI_THREADS):
+        self.flask_app = flask_app
+        self.wsgi = WSGIMiddleware(flask_app, workers=wsgi_threads)
+        self.cliente = cliente or AsyncGerenciamentoClient()
+        self.executor = ThreadPoolExecutor(max_workers=db_threads, thread_name_prefix="reservas-db")
+        self.metricas = flask_app.extensions.get("metricas")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            return await self._lifespan(receive, send)
+
+        if scope["type"] == "http":
+            metodo, caminho = scope["method"], scope["path"]
+            if metodo == "POST" and caminho == "/reservas":
+                return await self._responder(self.criar_reserva, metodo, receive, send)
+            rota = ROTA_RESERVA.match(caminho)
+            if metodo == "PUT" and rota:
+                return await self._responder(self.atualizar_reserva, metodo, receive, send, int(rota.group(1)))
+
+        await self.wsgi(scope, receive, send)
+
+    async def _lifespan(self, receive, send):
+        while True:
+            mensagem = await receive()
+            if mensagem["type"] == "lifespan.startup":
+                self.cliente.abrir()
+                await send({"type": "lifespan.startup.complete"})
+            elif mensagem["type"] == "lifespan.shutdown":
+                await self.cliente.fechar()
+                self.executor.shutdown(wait=True)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def no_banco(self, funcao, *args):
+        """Executa `funcao(*args)` no pool de threads do banco, com app context."""
+        def executar():
+            with self.flask_app.app_context():
+                return funcao(*args)
+        return await asyncio.get_running_loop().run_in_executor(self.executor, executar)
+
+    async def _responder(self, handler, metodo, receive, send, *args):
+        medicao = None
+        if self.metricas is not None:
+            medicao = self.metricas.iniciar(
+                self.metricas.indice_rota(f"{reserva_bp.name}.{handler.__name__}", metodo))
+        try:
+            try:
+                data = await self._ler_json(receive)
+                corpo, status = await handler(data, *args)
+            except RespostaErro as e:
+                corpo, status = e.corpo, e.status
+            except GerenciamentoIndisponivel:
+                corpo, status = {"erro": "Serviço de gerenciamento indisponível"}, 503
+            except Exception:
+                logger.exception("Erro ao processar %s", handler.__name__)
+                corpo, status = {"erro": "Erro interno"}, 500
+            if medicao is not None:
+                medicao.status = status
+
+            conteudo = self.flask_app.json.dumps(corpo).encode()
+            await send({
+                "type": "http.response.start",
+                "status": status,
+                "headers": [(b"content-type", b"application/json"),
+                            (b"content-length", str(len(conteudo)).encode())],
+            })
+            await send({"type": "http.response.body", "body": conteudo})
+        finally:
+            # também com o cliente desconectado (send falhou) ou a tarefa
+            # cancelada: senão a requisição ficaria "em andamento" para sempre
+            if medicao is not None:
+                self.metricas.finalizar(medicao)
+
+    async def _ler_json(self, receive):
+        partes = []
+        while True:
+            mensagem = await receive()
+            partes.append(mensagem.get("body", b""))
+            if not mensagem.get("more_body"):
+                break
+        try:
+            data = self.flask_app.json.loads(b"".join(partes))
+        except ValueError:
+            data = None
+        if not isinstance(data, dict):
+            raise RespostaErro({"erro": "Corpo da requisição deve ser um objeto JSON"}, 400)
+        return data
+
+    def _ler_data_reserva(self, data):
+        try:
+            data['data_reserva'] = ler_data(data.get('data_reserva'), 'data_reserva')
+        except ValueError as e:
+            raise RespostaErro({"erro": str(e)}, 400)
+
+    async def criar_reserva(self, data):
+        erro = validar_campos(data)
+        if erro:
+            return {"erro": erro}, 400
+        self._ler_data_reserva(data)
+
+        erro = await self.cliente.verificar(verificacoes_criacao(data))
+        if erro:
+            return {"erro": erro}, 400
+
+        return await self.no_banco(gravar_reserva, data)
+
+    async def atualizar_reserva(self, data, id):
+        if not await self.no_banco(lambda: db.session.get(Reserva, id) is not None):
+            return {"erro": "Reserva não encontrada"}, 404
+        erro = validar_campos(data, obrigatorios=False)
+        if erro:
+            return {"erro": erro}, 400
+        if 'data_reserva' in data:
+            self._ler_data_reserva(data)
+
+        erro = await self.cliente.verificar(verificacoes_atualizacao(data))
+        if erro:
+            return {"erro": erro}, 400
+
+        def atualizar():
+            # a reserva pode ter sido removida enquanto o gerenciamento respondia
+            reserva = db.session.get(Reserva, id)
+            if reserva is None:
+                return {"erro": "Reserva não encontrada"}, 404
+            return aplicar_atualizacao(reserva, data)
+
+        return await self.no_banco(atualizar)
+
+
+app = ReservasAsgi(create_app())
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    host, _, porta = os.environ.get("SERVER_BIND", "0.0.0.0:5001").rpartition(":")
+    uvicorn.run(app, host=host, port=int(porta), log_level=os.environ.get("LOG_LEVEL", "info"))
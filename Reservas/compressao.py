@@ -0,0 +1,211 @@
+import os
+import threading
+import zlib
+
+from flask import jsonify, request
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Tipos que valem a pena comprimir; imagens/arquivos já comprimidos ficam de fora.
+MIMETYPES_COMPRIMIVEIS = {
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+}
+
+PADROES = {
+    "COMPRESSAO_MINIMO": 1024,       # bytes; respostas menores saem sem compressão
+    "COMPRESSAO_NIVEL": 6,           # gzip (1-9)
+    "COMPRESSAO_NIVEL_BROTLI": 4,    # brotli (0-11)
+    "COMPRESSAO_NIVEL_ZSTD": 3,      # zstd (1-22)
+}
+
+
+class _Identidade:
+    def comprimir(self, dados):
+        return dados
+
+    def finalizar(self):
+        return b""
+
+
+class _Gzip:
+    def __init__(self, nivel):
+        self._obj = zlib.compressobj(nivel, zlib.DEFLATED, 31)  # 31 = cabeçalho gzip
+
+    def comprimir(self, dados):
+        return self._obj.compress(dados)
+
+    def finalizar(self):
+        return self._obj.flush()
+
+
+class _Brotli:
+    def __init__(self, nivel):
+        self._obj = brotli.Compressor(quality=nivel)
+
+    def comprimir(self, dados):
+        return self._obj.process(dados)
+
+    def finalizar(self):
+        return self._obj.finish()
+
+
+class _Zstd:
+    def __init__(self, nivel):
+        self._obj = zstandard.ZstdCompressor(level=nivel).compressobj()
+
+    def comprimir(self, dados):
+        return self._obj.compress(dados)
+
+    def finalizar(self):
+        return self._obj.flush()
+
+
+def codificacoes_disponiveis():
+    """Codificações suportadas, em ordem de preferência para empates de q."""
+    disponiveis = {}
+    if zstandard is not None:
+        disponiveis["zstd"] = (_Zstd, "COMPRESSAO_NIVEL_ZSTD")
+    if brotli is not None:
+        disponiveis["br"] = (_Brotli, "COMPRESSAO_NIVEL_BROTLI")
+    disponiveis["gzip"] = (_Gzip, "COMPRESSAO_NIVEL")
+    return disponiveis
+
+
+class Compressao:
+    """
+    Compressão negociada (Accept-Encoding) das respostas do app.
+
+    Respostas com corpo em memória só são comprimidas a partir de
+    `COMPRESSAO_MINIMO` bytes e apenas se ficarem menores. Respostas em
+    streaming (ex: NDJSON) são comprimidas pedaço a pedaço, sem nunca juntar o
+    corpo inteiro em memória.
+
+    Funções em `observadores` recebem cada registro `(codificacao,
+    bytes_originais, bytes_enviados)`. Com as métricas ligadas, é o
+    metricas.py quem guarda os contadores, em memória compartilhada, e
+    preenche `totais`: GET /compressao soma então todos os workers. Sem
+    elas, os contadores ficam neste processo e a rota responde só por ele.
+    """
+
+    def __init__(self, app):
+        self.config = {}
+        for nome, padrao in PADROES.items():
+            self.config[nome] = int(app.config.get(nome, os.environ.get(nome, padrao)))
+        self.codificacoes = codificacoes_disponiveis()
+        self._lock = threading.Lock()
+        self._contadores = {}
+        self.observadores = []
+        self.totais = None
+
+        app.after_request(self.comprimir)
+        app.add_url_rule("/compressao", "compressao", self.rota_estatisticas, methods=["GET"])
+
+    def _compressor(self, codificacao):
+        classe, chave_nivel = self.codificacoes[codificacao]
+        return classe(self.config[chave_nivel])
+
+    def registrar(self, codificacao, bytes_originais, bytes_enviados):
+        if self.totais is None:
+            with self._lock:
+                contador = self._contadores.setdefault(
+                    codificacao, {"respostas": 0, "bytes_originais": 0, "bytes_enviados": 0})
+                contador["respostas"] += 1
+                contador["bytes_originais"] += bytes_originais
+                contador["bytes_enviados"] += bytes_enviados
+        for observador in self.observadores:
+            observador(codificacao, bytes_originais, bytes_enviados)
+
+    def estatisticas(self):
+        if self.totais is not None:
+            por_codificacao, escopo = self.totais(), "todos os workers"
+        else:
+            with self._lock:
+                por_codificacao = {c: dict(v) for c, v in self._contadores.items()}
+            escopo = "processo"
+        return {
+            "codificacoes": list(self.codificacoes),
+            "minimo": self.config["COMPRESSAO_MINIMO"],
+            "escopo": escopo,
+            "por_codificacao": por_codificacao,
+        }
+
+    def rota_estatisticas(self):
+        return jsonify(self.estatisticas()), 200
+
+    @staticmethod
+    def _comprimivel(resposta):
+        if resposta.status_code < 200 or resposta.status_code in (204, 206, 304):
+            return False
+        if request.method == "HEAD" or "Content-Encoding" in resposta.headers:
+            return False
+        mimetype = resposta.mimetype or ""
+        return mimetype in MIMETYPES_COMPRIMIVEIS or mimetype.startswith("text/")
+
+    def comprimir(self, resposta):
+        if not self._comprimivel(resposta):
+            return resposta
+
+        resposta.vary.add("Accept-Encoding")
+        codificacao = request.accept_encodings.best_match(list(self.codificacoes))
+        if codificacao is None:
+            return self._sem_compressao(resposta)
+
+        if resposta.is_streamed:
+            resposta.response = self._comprimir_stream(resposta.iter_encoded(), codificacao)
+            resposta.headers.pop("Content-Length", None)
+        else:
+            dados = resposta.get_data()
+            if len(dados) < self.config["COMPRESSAO_MINIMO"]:
+                return self._sem_compressao(resposta)
+            compressor = self._compressor(codificacao)
+            comprimido = compressor.comprimir(dados) + compressor.finalizar()
+            if len(comprimido) >= len(dados):
+                return self._sem_compressao(resposta)
+            resposta.set_data(comprimido)
+            self.registrar(codificacao, len(dados), len(comprimido))
+
+        resposta.headers["Content-Encoding"] = codificacao
+        return resposta
+
+    def _sem_compressao(self, resposta):
+        if resposta.is_streamed:
+            resposta.response = self._comprimir_stream(resposta.iter_encoded(), "identity")
+        else:
+            tamanho = resposta.calculate_content_length() or 0
+            self.registrar("identity", tamanho, tamanho)
+        return resposta
+
+    def _comprimir_stream(self, pedacos, codificacao):
+        """Comprime (ou só contabiliza, se `codificacao` é identity) um corpo em streaming."""
+        compressor = _Identidade() if codificacao == "identity" else self._compressor(codificacao)
+        originais = enviados = 0
+        try:
+            for pedaco in pedacos:
+                originais += len(pedaco)
+                saida = compressor.comprimir(pedaco)
+                if saida:
+                    enviados += len(saida)
+                    yield saida
+            saida = compressor.finalizar()
+            if saida:
+                enviados += len(saida)
+                yield saida
+        finally:
+            self.registrar(codificacao, originais, enviados)
+
+
+def registrar_compressao(app):
+    app.extensions["compressao"] = Compressao(app)
+    return app.extensions["compressao"]
@@ -0,0 +1,234 @@
+import ctypes
+import multiprocessing
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+GERENCIAMENTO_URL = os.environ.get("GERENCIAMENTO_URL", "http://localhost:5000")
+POOL_SIZE = int(os.environ.get("GERENCIAMENTO_POOL_SIZE", "10"))
+CONNECT_TIMEOUT = float(os.environ.get("GERENCIAMENTO_CONNECT_TIMEOUT", "2"))
+READ_TIMEOUT = float(os.environ.get("GERENCIAMENTO_READ_TIMEOUT", "5"))
+CACHE_SIZE = int(os.environ.get("GERENCIAMENTO_CACHE_SIZE", "4096"))
+CACHE_TTL = float(os.environ.get("GERENCIAMENTO_CACHE_TTL", "60"))
+CACHE_TTL_NEGATIVO = float(os.environ.get("GERENCIAMENTO_CACHE_TTL_NEGATIVO", "5"))
+MAX_WORKERS = int(os.environ.get("GERENCIAMENTO_MAX_WORKERS", "8"))
+
+
+class GerenciamentoIndisponivel(Exception):
+    """O serviço de gerenciamento não respondeu (conexão recusada, timeout...)."""
+
+
+def erro_de_status(status):
+    """Classe de erro de uma resposta inesperada do gerenciamento, para os observadores."""
+    return "http_5xx" if status >= 500 else "http_4xx"
+
+
+class CacheExistencia:
+    """
+    Cache LRU com TTL para o resultado de "o ID existe no gerenciamento?".
+
+    Entradas positivas vivem `ttl` segundos; entradas negativas (404) vivem
+    `ttl_negativo`, bem mais curto, para que um registro recém-criado passe a
+    ser aceito rapidamente. Com `tamanho=0` o cache fica desligado.
+
+    As entradas ficam na memória de cada processo, mas a limpeza vale para
+    todos: `limpar()` incrementa uma geração em memória compartilhada
+    (RawValue, criada antes do fork com o preload_app do serve.py) e cada
+    worker descarta as próprias entradas ao ver a geração mudar. Tamanho,
+    hits e misses de `estatisticas()` são do processo que responde.
+    """
+
+    def __init__(self, tamanho=CACHE_SIZE, ttl=CACHE_TTL, ttl_negativo=CACHE_TTL_NEGATIVO,
+                 relogio=time.monotonic):
+        self.tamanho = tamanho
+        self.ttl = ttl
+        self.ttl_negativo = ttl_negativo
+        self._relogio = relogio
+        self._dados = OrderedDict()
+        self._lock = threading.Lock()
+        self._geracao = multiprocessing.RawValue(ctypes.c_uint64, 0)
+        self._lock_geracao = multiprocessing.Lock()
+        self._geracao_vista = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _conferir_geracao(self):
+        # chamado com self._lock: outro worker limpou o cache
+        geracao = self._geracao.value
+        if geracao != self._geracao_vista:
+            self._dados.clear()
+            self.hits = 0
+            self.misses = 0
+            self._geracao_vista = geracao
+
+    def obter(self, chave):
+        """Retorna True/False se a chave está em cache e válida, senão None."""
+        with self._lock:
+            self._conferir_geracao()
+            entrada = self._dados.get(chave)
+            if entrada is not None:
+                existe, expira_em = entrada
+                if expira_em > self._relogio():
+                    self._dados.move_to_end(chave)
+                    self.hits += 1
+                    return existe
+                del self._dados[chave]
+            self.misses += 1
+            return None
+
+    def guardar(self, chave, existe):
+        if self.tamanho <= 0:
+            return
+        ttl = self.ttl if existe else self.ttl_negativo
+        with self._lock:
+            self._conferir_geracao()
+            self._dados[chave] = (existe, self._relogio() + ttl)
+            self._dados.move_to_end(chave)
+            while len(self._dados) > self.tamanho:
+                self._dados.popitem(last=False)
+
+    def limpar(self):
+        """Limpa o cache em todos os workers."""
+        with self._lock_geracao:
+            self._geracao.value += 1
+        with self._lock:
+            self._conferir_geracao()
+
+    def estatisticas(self):
+        with self._lock:
+            self._conferir_geracao()
+            return {
+                "tamanho": len(self._dados),
+                "capacidade": self.tamanho,
+                "hits": self.hits,
+                "misses": self.misses,
+                "geracao": self._geracao_vista,
+                "escopo": "processo",
+                "pid": os.getpid(),
+            }
+
+
+class GerenciamentoClient:
+    """
+    Cliente HTTP para o serviço de gerenciamento.
+
+    Usa uma única `requests.Session` com pool de conexões keep-alive, de modo
+    que as validações reutilizam a mesma conexão TCP em vez de abrir uma nova
+    a cada chamada. As respostas de `existe` ficam em um `CacheExistencia`.
+
+    A sessão (e o import do `requests`) só é criada na primeira chamada ao
+    gerenciamento, fora da partida do serviço.
+
+    Cada consulta que chega à rede é repassada às funções em `observadores`
+    como `(operacao, recurso, segundos, erro)`, com `erro` None, "indisponivel"
+    ou "http_4xx"/"http_5xx" (usado pelas métricas em GET /metrics).
+    """
+
+    def __init__(self, base_url=GERENCIAMENTO_URL, pool_size=POOL_SIZE,
+                 connect_timeout=CONNECT_TIMEOUT, read_timeout=READ_TIMEOUT, cache=None,
+                 max_workers=MAX_WORKERS):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = (connect_timeout, read_timeout)
+        self.cache = cache if cache is not None else CacheExistencia()
+        self.executor = ThreadPoolExecutor(max_workers=max_workers,
+                                           thread_name_prefix="gerenciamento")
+        self.pool_size = pool_size
+        self._session = None
+        self._lock = threading.Lock()
+        self.observadores = []
+
+    @property
+    def session(self):
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                    self._session = session
+        return self._session
+
+    def get(self, path, timeout=None):
+        import requests
+
+        try:
+            return self.session.get(f"{self.base_url}{path}", timeout=timeout or self.timeout)
+        except requests.RequestException as e:
+            raise GerenciamentoIndisponivel(str(e)) from e
+
+    def existe(self, recurso, id, timeout=None):
+        """
+        Retorna True se `GET /<recurso>/<id>` responde 200.
+
+        Apenas 200 e 404 são guardados em cache; outros status (ex: 500) são
+        reconsultados na próxima chamada.
+        """
+        em_cache = self.cache.obter((recurso, str(id)))
+        if em_cache is not None:
+            return em_cache
+        return self._consultar(recurso, id, timeout)
+
+    def _observar(self, operacao, recurso, inicio, erro=None):
+        segundos = time.perf_counter() - inicio
+        for observador in self.observadores:
+            observador(operacao, recurso, segundos, erro)
+
+    def _consultar(self, recurso, id, timeout=None):
+        inicio = time.perf_counter()
+        try:
+            status = self.get(f"/{recurso}/{id}", timeout=timeout).status_code
+        except GerenciamentoIndisponivel:
+            self._observar("existe", recurso, inicio, "indisponivel")
+            raise
+        self._observar("existe", recurso, inicio, None if status in (200, 404) else erro_de_status(status))
+        if status in (200, 404):
+            self.cache.guardar((recurso, str(id)), status == 200)
+        return status == 200
+
+    def verificar(self, verificacoes, timeout=None):
+        """
+        Executa várias verificações de existência independentes.
+
+        `verificacoes` é uma lista de `(recurso, id, mensagem_de_erro)`.
+        Retorna a mensagem da primeira verificação que falhar, ou None se
+        todas passarem. Acertos de cache são resolvidos na hora; as demais
+        consultas rodam em paralelo no executor e a primeira falha cancela
+        as que ainda não começaram.
+        """
+        pendentes = []
+        for recurso, id, mensagem in verificacoes:
+            em_cache = self.cache.obter((recurso, str(id)))
+            if em_cache is False:
+                return mensagem
+            if em_cache is None:
+                pendentes.append((recurso, id, mensagem))
+
+        if len(pendentes) == 1:
+            recurso, id, mensagem = pendentes[0]
+            return None if self._consultar(recurso, id, timeout) else mensagem
+
+        futuros = {
+            self.executor.submit(self._consultar, recurso, id, timeout): mensagem
+            for recurso, id, mensagem in pendentes
+        }
+        try:
+            for futuro in as_completed(futuros):
+                if not futuro.result():
+                    return futuros[futuro]
+        finally:
+            for futuro in futuros:
+                futuro.cancel()
+        return None
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+
+
+gerenciamento = GerenciamentoClient()
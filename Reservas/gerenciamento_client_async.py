@@ -0,0 +1,124 @@
+import asyncio
+import os
+import time
+
+import aiohttp
+
+from gerenciamento_client import (
+    CONNECT_TIMEOUT,
+    GERENCIAMENTO_URL,
+    READ_TIMEOUT,
+    GerenciamentoIndisponivel,
+    erro_de_status,
+    gerenciamento,
+)
+
+ASYNC_POOL_SIZE = int(os.environ.get("GERENCIAMENTO_ASYNC_POOL_SIZE", "100"))
+
+
+class AsyncGerenciamentoClient:
+    """
+    Versão asyncio do `GerenciamentoClient`, usada pela variante ASGI (asgi.py).
+
+    Usa uma `aiohttp.ClientSession` com pool de conexões keep-alive limitado a
+    `pool_size`; requisições além do limite esperam na fila do conector, e
+    enquanto esperam o gerenciamento não ocupam nenhuma thread. Por padrão
+    compartilha o cache de existência do cliente síncrono, então
+    GET/DELETE /cache/gerenciamento valem para os dois; da mesma forma, usa a
+    lista de `observadores` do cliente síncrono.
+
+    A sessão fica presa ao event loop em que é criada; por isso é aberta em
+    `abrir()` (startup do ASGI) e fechada em `fechar()`. Sem o lifespan (ex:
+    uvicorn --lifespan off) ela é aberta na primeira consulta, já dentro do
+    loop que atende as requisições.
+    """
+
+    def __init__(self, base_url=GERENCIAMENTO_URL, pool_size=ASYNC_POOL_SIZE,
+                 connect_timeout=CONNECT_TIMEOUT, read_timeout=READ_TIMEOUT, cache=None,
+                 observadores=None):
+        self.base_url = base_url.rstrip("/")
+        self.pool_size = pool_size
+        self.timeout = aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout)
+        self.cache = cache if cache is not None else gerenciamento.cache
+        self.observadores = observadores if observadores is not None else gerenciamento.observadores
+        self.session = None
+
+    def abrir(self):
+        self.session = aiohttp.ClientSession(
+            self.base_url,
+            timeout=self.timeout,
+            connector=aiohttp.TCPConnector(limit=self.pool_size),
+        )
+
+    async def fechar(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def status(self, path):
+        """Faz `GET path` e retorna o status HTTP (o corpo é descartado)."""
+        if self.session is None:
+            self.abrir()
+        try:
+            async with self.session.get(path) as resposta:
+                await resposta.read()
+                return resposta.status
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise GerenciamentoIndisponivel(str(e) or type(e).__name__) from e
+
+    async def existe(self, recurso, id):
+        em_cache = self.cache.obter((recurso, str(id)))
+        if em_cache is not None:
+            return em_cache
+        return await self._consultar(recurso, id)
+
+    def _observar(self, recurso, inicio, erro=None):
+        segundos = time.perf_counter() - inicio
+        for observador in self.observadores:
+            observador("existe", recurso, segundos, erro)
+
+    async def _consultar(self, recurso, id):
+        inicio = time.perf_counter()
+        try:
+            status = await self.status(f"/{recurso}/{id}")
+        except GerenciamentoIndisponivel:
+            self._observar(recurso, inicio, "indisponivel")
+            raise
+        self._observar(recurso, inicio, None if status in (200, 404) else erro_de_status(status))
+        if status in (200, 404):
+            self.cache.guardar((recurso, str(id)), status == 200)
+        return status == 200
+
+    async def verificar(self, verificacoes):
+        """
+        Mesmo contrato de `GerenciamentoClient.verificar`: retorna a mensagem
+        da primeira verificação que falhar, ou None. As consultas fora do
+        cache rodam concorrentemente; a primeira falha cancela as demais.
+        """
+        pendentes = []
+        for recurso, id, mensagem in verificacoes:
+            em_cache = self.cache.obter((recurso, str(id)))
+            if em_cache is False:
+                return mensagem
+            if em_cache is None:
+                pendentes.append((recurso, id, mensagem))
+
+        if len(pendentes) == 1:
+            recurso, id, mensagem = pendentes[0]
+            return None if await self._consultar(recurso, id) else mensagem
+
+        tarefas = {
+            asyncio.ensure_future(self._consultar(recurso, id)): mensagem
+            for recurso, id, mensagem in pendentes
+        }
+        aguardando = set(tarefas)
+        try:
+            while aguardando:
+                prontas, aguardando = await asyncio.wait(aguardando, return_when=asyncio.FIRST_COMPLETED)
+                for tarefa in prontas:
+                    if not tarefa.result():
+                        return tarefas[tarefa]
+        finally:
+            for tarefa in tarefas:
+                tarefa.cancel()
+        return None
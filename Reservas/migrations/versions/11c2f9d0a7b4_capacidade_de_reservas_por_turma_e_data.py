@@ -0,0 +1,61 @@
+"""capacidade de reservas por turma e data
+
+Cria a tabela reservas_configuracao (capacidade padrão = 1) e triggers que
+impedem INSERT/UPDATE de ultrapassar a capacidade para a mesma turma na mesma
+data. Reservas duplicadas já existentes são mantidas e podem ser consultadas
+em GET /reservas/conflitos.
+
+Revision ID: 11c2f9d0a7b4
+Revises: ca9347975983
+Create Date: 2026-10-18 09:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '11c2f9d0a7b4'
+down_revision = 'ca9347975983'
+branch_labels = None
+depends_on = None
+
+TRIGGER_INSERT = """
+CREATE TRIGGER IF NOT EXISTS reservas_capacidade_insert
+BEFORE INSERT ON reservas
+WHEN (SELECT COUNT(*) FROM reservas
+      WHERE turma_id = NEW.turma_id AND data_reserva = NEW.data_reserva)
+     >= (SELECT capacidade_por_data FROM reservas_configuracao WHERE id = 1)
+BEGIN
+    SELECT RAISE(ABORT, 'capacidade de reservas excedida para a turma na data');
+END
+"""
+
+TRIGGER_UPDATE = """
+CREATE TRIGGER IF NOT EXISTS reservas_capacidade_update
+BEFORE UPDATE OF turma_id, data_reserva ON reservas
+WHEN (NEW.turma_id != OLD.turma_id OR NEW.data_reserva != OLD.data_reserva)
+ AND (SELECT COUNT(*) FROM reservas
+      WHERE turma_id = NEW.turma_id AND data_reserva = NEW.data_reserva AND id != NEW.id)
+     >= (SELECT capacidade_por_data FROM reservas_configuracao WHERE id = 1)
+BEGIN
+    SELECT RAISE(ABORT, 'capacidade de reservas excedida para a turma na data');
+END
+"""
+
+
+def upgrade():
+    op.create_table('reservas_configuracao',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('capacidade_por_data', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.execute("INSERT INTO reservas_configuracao (id, capacidade_por_data) VALUES (1, 1)")
+    op.execute(TRIGGER_INSERT)
+    op.execute(TRIGGER_UPDATE)
+
+
+def downgrade():
+    op.execute("DROP TRIGGER IF EXISTS reservas_capacidade_update")
+    op.execute("DROP TRIGGER IF EXISTS reservas_capacidade_insert")
+    op.drop_table('reservas_configuracao')
@@ -0,0 +1,38 @@
+"""esquema inicial
+
+Cria as tabelas apenas se ainda não existirem, para que bancos criados
+anteriormente com db.create_all() possam entrar no controle de migrations.
+
+Revision ID: 5f03b9def556
+Revises: 
+Create Date: 2026-10-18 08:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5f03b9def556'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    tabelas = sa.inspect(op.get_bind()).get_table_names()
+
+    if 'reservas' not in tabelas:
+        op.create_table('reservas',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('turma_id', sa.Integer(), nullable=False),
+        sa.Column('professor_id', sa.Integer(), nullable=False),
+        sa.Column('professor_nome', sa.String(length=100), nullable=False),
+        sa.Column('materia', sa.String(length=100), nullable=False),
+        sa.Column('data_reserva', sa.String(length=10), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+        )
+
+
+def downgrade():
+    op.drop_table('reservas')
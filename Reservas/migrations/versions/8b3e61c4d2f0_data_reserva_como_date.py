@@ -0,0 +1,106 @@
+"""data_reserva como DATE
+
+Converte os valores existentes (DD/MM/AAAA ou AAAA-MM-DD) para o formato ISO
+e altera a coluna para DATE, permitindo consultas por intervalo de datas
+usando os índices (turma_id, data_reserva) e (data_reserva).
+
+A recriação da tabela (batch mode do SQLite) descarta os triggers de
+capacidade, que são recriados ao final. O tipo novo é informado via
+reflect_args em vez de alter_column(type_=...): o alter_column copiaria os
+dados com CAST(data_reserva AS DATE), que no SQLite transforma '2025-08-12'
+no número 2025.
+
+Revision ID: 8b3e61c4d2f0
+Revises: 11c2f9d0a7b4
+Create Date: 2026-10-18 09:40:00.000000
+
+"""
+from datetime import datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b3e61c4d2f0'
+down_revision = '11c2f9d0a7b4'
+branch_labels = None
+depends_on = None
+
+FORMATOS = ("%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y")
+
+TRIGGER_INSERT = """
+CREATE TRIGGER IF NOT EXISTS reservas_capacidade_insert
+BEFORE INSERT ON reservas
+WHEN (SELECT COUNT(*) FROM reservas
+      WHERE turma_id = NEW.turma_id AND data_reserva = NEW.data_reserva)
+     >= (SELECT capacidade_por_data FROM reservas_configuracao WHERE id = 1)
+BEGIN
+    SELECT RAISE(ABORT, 'capacidade de reservas excedida para a turma na data');
+END
+"""
+
+TRIGGER_UPDATE = """
+CREATE TRIGGER IF NOT EXISTS reservas_capacidade_update
+BEFORE UPDATE OF turma_id, data_reserva ON reservas
+WHEN (NEW.turma_id != OLD.turma_id OR NEW.data_reserva != OLD.data_reserva)
+ AND (SELECT COUNT(*) FROM reservas
+      WHERE turma_id = NEW.turma_id AND data_reserva = NEW.data_reserva AND id != NEW.id)
+     >= (SELECT capacidade_por_data FROM reservas_configuracao WHERE id = 1)
+BEGIN
+    SELECT RAISE(ABORT, 'capacidade de reservas excedida para a turma na data');
+END
+"""
+
+
+def _converter(valor):
+    for formato in FORMATOS:
+        try:
+            return datetime.strptime(valor.strip(), formato).date().isoformat()
+        except ValueError:
+            continue
+    return None
+
+
+def _remover_triggers():
+    op.execute("DROP TRIGGER IF EXISTS reservas_capacidade_update")
+    op.execute("DROP TRIGGER IF EXISTS reservas_capacidade_insert")
+
+
+def _criar_triggers():
+    op.execute(TRIGGER_INSERT)
+    op.execute(TRIGGER_UPDATE)
+
+
+def _recriar_tabela(tipo):
+    with op.batch_alter_table('reservas', schema=None, recreate='always',
+                              reflect_args=[sa.Column('data_reserva', tipo, nullable=False)]):
+        pass
+
+
+def upgrade():
+    conexao = op.get_bind()
+    _remover_triggers()
+
+    invalidas = []
+    for id, valor in conexao.execute(sa.text("SELECT id, data_reserva FROM reservas")).all():
+        convertida = _converter(valor)
+        if convertida is None:
+            invalidas.append((id, valor))
+        elif convertida != valor:
+            conexao.execute(sa.text("UPDATE reservas SET data_reserva = :data WHERE id = :id"),
+                            {"data": convertida, "id": id})
+    if invalidas:
+        raise RuntimeError(
+            "Reservas com data_reserva inválida (id, valor): "
+            + ", ".join(f"({id}, {valor!r})" for id, valor in invalidas[:20])
+        )
+
+    _recriar_tabela(sa.Date())
+    _criar_triggers()
+
+
+def downgrade():
+    _remover_triggers()
+    _recriar_tabela(sa.String(length=10))
+    _criar_triggers()
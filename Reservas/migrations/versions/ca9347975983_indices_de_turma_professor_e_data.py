@@ -0,0 +1,29 @@
+"""índices de turma, professor e data
+
+Revision ID: ca9347975983
+Revises: 5f03b9def556
+Create Date: 2026-10-18 08:31:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'ca9347975983'
+down_revision = '5f03b9def556'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # (turma_id, data_reserva) também atende buscas só por turma_id
+    op.create_index('ix_reservas_turma_id_data_reserva', 'reservas', ['turma_id', 'data_reserva'], unique=False, if_not_exists=True)
+    op.create_index('ix_reservas_professor_id', 'reservas', ['professor_id'], unique=False, if_not_exists=True)
+    op.create_index('ix_reservas_data_reserva', 'reservas', ['data_reserva'], unique=False, if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index('ix_reservas_data_reserva', table_name='reservas')
+    op.drop_index('ix_reservas_professor_id', table_name='reservas')
+    op.drop_index('ix_reservas_turma_id_data_reserva', table_name='reservas')
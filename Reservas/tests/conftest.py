@@ -0,0 +1,26 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from run import create_app
+
+
+@pytest.fixture
+def criar_app(tmp_path):
+    def criar(**config):
+        return create_app({
+            "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'reservas.db'}",
+            "APISPEC_ARQUIVO": "",
+            "CONSULTAS_ESTRITO": 1,
+            "TESTING": True,
+            **config,
+        })
+    return criar
+
+
+@pytest.fixture
+def app(criar_app):
+    return criar_app()
@@ -0,0 +1,27 @@
+import os
+
+from gerenciamento_client import CacheExistencia
+
+
+def test_limpar_em_outro_processo_invalida_o_cache():
+    cache = CacheExistencia()
+    cache.guardar(("turmas", "1"), True)
+
+    pid = os.fork()
+    if pid == 0:
+        # "outro worker": mesma memória compartilhada, entradas próprias
+        cache.limpar()
+        os._exit(0)
+    os.waitpid(pid, 0)
+
+    assert cache.obter(("turmas", "1")) is None
+    assert cache.estatisticas()["geracao"] == 1
+
+
+def test_delete_limpa_o_cache(app):
+    from gerenciamento_client import gerenciamento
+
+    gerenciamento.cache.guardar(("turmas", "1"), True)
+    cliente = app.test_client()
+    assert cliente.delete("/cache/gerenciamento").status_code == 200
+    assert cliente.get("/cache/gerenciamento").get_json()["tamanho"] == 0
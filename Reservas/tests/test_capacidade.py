@@ -0,0 +1,63 @@
+import pytest
+
+from gerenciamento_client import gerenciamento
+
+RESERVA = {"turma_id": 1, "professor_id": 1, "professor_nome": "Ana", "materia": "Matemática",
+           "data_reserva": "2025-03-10"}
+
+
+@pytest.fixture(autouse=True)
+def gerenciamento_sem_rede(monkeypatch):
+    # turmas e professores existem no gerenciamento
+    monkeypatch.setattr(gerenciamento, "verificar", lambda verificacoes: None)
+
+
+def test_reserva_acima_da_capacidade_na_criacao(app):
+    cliente = app.test_client()
+    assert cliente.post("/reservas", json=RESERVA).status_code == 201
+
+    resposta = cliente.post("/reservas", json=RESERVA | {"professor_id": 2})
+    assert resposta.status_code == 409
+    corpo = resposta.get_json()
+    assert corpo["capacidade"] == 1
+    assert [r["id"] for r in corpo["conflitos"]] == [1]
+    assert len(cliente.get("/reservas").get_json()) == 1
+
+
+def test_outra_turma_ou_data_nao_conflita(app):
+    cliente = app.test_client()
+    assert cliente.post("/reservas", json=RESERVA).status_code == 201
+    assert cliente.post("/reservas", json=RESERVA | {"turma_id": 2}).status_code == 201
+    assert cliente.post("/reservas", json=RESERVA | {"data_reserva": "2025-03-11"}).status_code == 201
+
+
+def test_reservas_ate_a_capacidade_sao_aceitas(criar_app):
+    cliente = criar_app(RESERVAS_CAPACIDADE_POR_DATA=2).test_client()
+    assert cliente.post("/reservas", json=RESERVA).status_code == 201
+    assert cliente.post("/reservas", json=RESERVA | {"professor_id": 2}).status_code == 201
+
+    resposta = cliente.post("/reservas", json=RESERVA | {"professor_id": 3})
+    assert resposta.status_code == 409
+    assert resposta.get_json()["capacidade"] == 2
+
+
+def test_reserva_acima_da_capacidade_na_atualizacao(app):
+    cliente = app.test_client()
+    assert cliente.post("/reservas", json=RESERVA).status_code == 201
+    assert cliente.post("/reservas", json=RESERVA | {"data_reserva": "2025-03-11"}).status_code == 201
+
+    resposta = cliente.put("/reservas/2", json={"data_reserva": "2025-03-10"})
+    assert resposta.status_code == 409
+    assert [r["id"] for r in resposta.get_json()["conflitos"]] == [1]
+    assert cliente.get("/reservas/2").get_json()["data_reserva"] == "2025-03-11"
+
+    resposta = cliente.put("/reservas/2", json={"turma_id": 2, "data_reserva": "2025-03-10"})
+    assert resposta.status_code == 200
+
+
+def test_atualizacao_sem_mudar_turma_e_data_na_capacidade(app):
+    cliente = app.test_client()
+    assert cliente.post("/reservas", json=RESERVA).status_code == 201
+    resposta = cliente.put("/reservas/1", json={"materia": "História", "data_reserva": "2025-03-10"})
+    assert resposta.status_code == 200
+    assert resposta.get_json()["materia"] == "História"
@@ -0,0 +1,34 @@
+import pytest
+
+from config import db
+from consultas import ConsultasRepetidas, OrcamentoExcedido, orcamento_consultas
+from Models.Reserva import Reserva
+
+
+def test_rota_dentro_do_orcamento(app):
+    cliente = app.test_client()
+    assert cliente.get("/reservas").status_code == 200
+    assert cliente.get("/reservas/1").status_code == 404
+
+
+def test_n_mais_1_levanta_no_modo_estrito(app):
+    @app.route("/teste/n-mais-1")
+    def n_mais_1():
+        for reserva_id in range(1, 6):
+            db.session.get(Reserva, reserva_id)
+        return "", 204
+
+    with pytest.raises(ConsultasRepetidas):
+        app.test_client().get("/teste/n-mais-1")
+
+
+def test_orcamento_estourado_levanta_no_modo_estrito(app):
+    @app.route("/teste/orcamento")
+    @orcamento_consultas(1)
+    def orcamento():
+        db.session.get(Reserva, 1)
+        db.session.execute(db.select(Reserva).limit(1)).all()
+        return "", 204
+
+    with pytest.raises(OrcamentoExcedido):
+        app.test_client().get("/teste/orcamento")
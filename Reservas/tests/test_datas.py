@@ -0,0 +1,85 @@
+import pytest
+from alembic import command
+from sqlalchemy import text
+
+from config import db
+from gerenciamento_client import gerenciamento
+
+RESERVA = {"turma_id": 1, "professor_id": 1, "professor_nome": "Ana", "materia": "Matemática"}
+DATAS = ["2025-03-09", "2025-03-10", "2025-03-11", "2025-03-12"]
+
+
+@pytest.fixture
+def cliente(app, monkeypatch):
+    monkeypatch.setattr(gerenciamento, "verificar", lambda verificacoes: None)
+    cliente = app.test_client()
+    for turma_id, data in enumerate(DATAS, start=1):
+        assert cliente.post("/reservas", json=RESERVA | {"turma_id": turma_id, "data_reserva": data}).status_code == 201
+    return cliente
+
+
+def _datas(resposta):
+    assert resposta.status_code == 200
+    return [r["data_reserva"] for r in resposta.get_json()]
+
+
+@pytest.mark.parametrize("filtros, esperadas", [
+    ("de=2025-03-10&ate=2025-03-11", DATAS[1:3]),
+    ("de=2025-03-10&ate=2025-03-10", DATAS[1:2]),
+    ("de=2025-03-11", DATAS[2:]),
+    ("ate=2025-03-10", DATAS[:2]),
+    ("de=10/03/2025&ate=11/03/2025", DATAS[1:3]),
+    ("de=2025-03-13", []),
+    ("de=2025-03-10&turma_id=3", DATAS[2:3]),
+])
+def test_filtro_por_intervalo(cliente, filtros, esperadas):
+    assert _datas(cliente.get(f"/reservas?{filtros}")) == esperadas
+
+
+@pytest.mark.parametrize("filtros", ["de=2025-13-01", "ate=ontem", "de=", "de=2025-03-32",
+                                     "de=2025-03-11&ate=2025-03-10"])
+def test_filtro_invalido(cliente, filtros):
+    resposta = cliente.get(f"/reservas?{filtros}")
+    assert resposta.status_code == 400
+    assert "erro" in resposta.get_json()
+
+
+def _alembic(app):
+    # o alembic direto: o flask_migrate troca as exceções da migration por sys.exit
+    return app.extensions["migrate"].migrate.get_config()
+
+
+def _voltar_para_texto(app):
+    # revisão anterior à 8b3e61c4d2f0: data_reserva ainda é texto livre
+    command.downgrade(_alembic(app), "11c2f9d0a7b4")
+
+
+def test_migration_converte_datas_legadas(app):
+    with app.app_context():
+        _voltar_para_texto(app)
+        for id, valor in [(1, "2025-03-09"), (2, "10/03/2025"), (3, " 11-03-2025 "), (4, "12/03/2025")]:
+            db.session.execute(text(
+                "INSERT INTO reservas (id, turma_id, professor_id, professor_nome, materia, data_reserva) "
+                "VALUES (:id, :id, 1, 'Ana', 'Matemática', :data)"), {"id": id, "data": valor})
+        db.session.commit()
+
+        command.upgrade(_alembic(app), "head")
+        salvas = db.session.execute(text("SELECT data_reserva FROM reservas ORDER BY id")).scalars().all()
+        assert salvas == DATAS
+        # os triggers de capacidade voltam após a recriação da tabela
+        gatilhos = db.session.execute(text("SELECT name FROM sqlite_master WHERE type = 'trigger'")).scalars()
+        assert sorted(gatilhos) == ["reservas_capacidade_insert", "reservas_capacidade_update"]
+
+    assert _datas(app.test_client().get("/reservas?de=2025-03-10&ate=2025-03-11")) == DATAS[1:3]
+
+
+def test_migration_recusa_datas_invalidas(app):
+    with app.app_context():
+        _voltar_para_texto(app)
+        db.session.execute(text(
+            "INSERT INTO reservas (turma_id, professor_id, professor_nome, materia, data_reserva) "
+            "VALUES (1, 1, 'Ana', 'Matemática', '31/02/2025')"))
+        db.session.commit()
+
+        with pytest.raises(RuntimeError, match="31/02/2025"):
+            command.upgrade(_alembic(app), "head")
@@ -0,0 +1,82 @@
+"""
+Mede, para cada serviço, o custo da especificação OpenAPI com e sem o
+artefato pré-compilado (apispec.json, ver apispec.py de cada serviço):
+
+- partida a frio: importar o app + create_app(), num processo novo;
+- primeira GET /apispec_1.json (sem artefato o flasgger interpreta todas as
+  docstrings aqui);
+- GETs seguintes.
+
+O artefato é gerado num diretório temporário pelo próprio compilar_apispec
+de cada serviço; nada é gravado nas pastas do repositório.
+
+Uso (a partir da raiz do repositório):
+
+    python benchmarks/bench_apispec.py --repeticoes 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+SERVICOS = {
+    # nome: (diretório de trabalho, import do create_app, comando de build)
+    "gerenciamento": (RAIZ, "from gerenciamento import create_app", ["-m", "gerenciamento.compilar_apispec"]),
+    "reservas": (os.path.join(RAIZ, "Reservas"), "from run import create_app", ["compilar_apispec.py"]),
+    "atividades": (os.path.join(RAIZ, "Atividades"), "from run import create_app", ["compilar_apispec.py"]),
+}
+
+MEDICAO = """
+import json, logging, sys, time
+logging.disable(logging.WARNING)
+sys.path.insert(0, ".")
+inicio = time.perf_counter()
+{importacao}
+app = create_app({{"SQLALCHEMY_DATABASE_URI": "sqlite://"}})
+partida = time.perf_counter() - inicio
+cliente = app.test_client()
+inicio = time.perf_counter()
+assert cliente.get("/apispec_1.json").status_code == 200
+primeira = time.perf_counter() - inicio
+inicio = time.perf_counter()
+for _ in range(20):
+    cliente.get("/apispec_1.json")
+seguintes = (time.perf_counter() - inicio) / 20
+print(json.dumps({{"partida": partida, "primeira": primeira, "seguintes": seguintes}}))
+"""
+
+
+def medir(pasta, importacao, arquivo, repeticoes):
+    ambiente = dict(os.environ, APISPEC_ARQUIVO=arquivo)
+    medidas = []
+    for _ in range(repeticoes):
+        saida = subprocess.run([sys.executable, "-c", MEDICAO.format(importacao=importacao)], cwd=pasta,
+                               env=ambiente, capture_output=True, text=True, check=True).stdout
+        medidas.append(json.loads(saida.strip().splitlines()[-1]))
+    return {chave: round(statistics.median(m[chave] for m in medidas) * 1000, 2) for chave in medidas[0]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeticoes", type=int, default=5)
+    args = parser.parse_args()
+
+    resultado = {}
+    with tempfile.TemporaryDirectory() as temporario:
+        for nome, (pasta, importacao, build) in SERVICOS.items():
+            arquivo = os.path.join(temporario, f"{nome}.json")
+            subprocess.run([sys.executable, *build, arquivo], cwd=pasta, capture_output=True, check=True)
+            resultado[nome] = {
+                "docstrings_ms": medir(pasta, importacao, "", args.repeticoes),
+                "pre_compilada_ms": medir(pasta, importacao, arquivo, args.repeticoes),
+            }
+    print(json.dumps(resultado, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,598 @@
+"""
+Benchmark de ponta a ponta das rotas dos três serviços.
+
+Para cada tamanho de base (por padrão 1k, 100k e 1M linhas nas tabelas
+principais) o script:
+
+1. cria os bancos school.db, reservas.db e atividade.db num diretório
+   temporário, com as migrations de cada serviço (create_app)
+   e popula tudo com o gerador determinístico de gerar_dados.py;
+2. para cada rota dos blueprints alunos, professores, turmas, reserva_bp,
+   atividade_bp, notatividade_bp, media_bp e estatistica_bp, sobe um processo
+   novo com o app do serviço (create_app) sobre uma cópia do banco e dispara
+   as requisições com concorrência fixa, chamando o app WSGI diretamente
+   (sem rede). Nos serviços de Reservas e Atividades as chamadas ao
+   gerenciamento vão para um app do gerenciamento no mesmo processo, montado
+   na sessão do `gerenciamento_client`;
+3. grava latência p50/p95/p99, vazão, status das respostas, instruções SQL
+   por requisição, chamadas ao gerenciamento e o pico de RSS de cada rota
+   num JSON. Um cenário com respostas fora de 2xx (além das previstas em
+   `status_aceitos`, como o 404 dos DELETEs repetidos) é reprovado: fica
+   no JSON sem as medidas e o script termina com erro.
+
+Um processo por rota mantém o pico de RSS de uma rota independente das
+outras, e a cópia do banco faz todas partirem dos mesmos dados. Listagens sem
+filtro ("[completa]") devolvem a tabela inteira; acima de
+--limite-listagem-completa linhas ficam de fora (registradas como ignoradas).
+
+Uso (a partir da raiz do repositório):
+
+    python benchmarks/bench_endpoints.py --tamanhos 1000 100000 --saida antes.json
+    python benchmarks/bench_endpoints.py --tamanhos 1000 --cenarios alunos reserva_bp
+    python benchmarks/bench_endpoints.py --comparar antes.json depois.json
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import re
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter, namedtuple
+from datetime import date, datetime, timedelta, timezone
+
+from gerar_dados import DATA_REFERENCIA, MATERIAS, dimensionar, popular
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+SERVICOS = {
+    # nome: (diretório de trabalho, banco, blueprints medidos)
+    "gerenciamento": (RAIZ, "school.db", ("alunos", "professores", "turmas")),
+    "reservas": (os.path.join(RAIZ, "Reservas"), "reservas.db", ("reserva_bp",)),
+    "atividades": (os.path.join(RAIZ, "Atividades"), "atividade.db",
+                   ("atividade_bp", "notatividade_bp", "media_bp", "estatistica_bp")),
+}
+
+
+def dimensoes(linhas):
+    """Quantidade de registros por tabela (ver gerar_dados.dimensionar) para uma base de `linhas` linhas."""
+    return dimensionar(linhas, turmas=max(10, linhas // 100), professores=max(10, linhas // 200),
+                       notas_por_aluno=1, reservas=linhas)
+
+
+def _data_aleatoria(rng, inicio, fim):
+    return date.fromordinal(rng.randint(inicio.toordinal(), fim.toordinal())).isoformat()
+
+
+# ---------------------------------------------------------------------------
+# Cenários: uma fábrica de requisições por rota
+# ---------------------------------------------------------------------------
+
+# status_aceitos: status fora de 2xx esperados no cenário (os demais o reprovam)
+Cenario = namedtuple("Cenario", "servico endpoint variante fabrica tabela_completa status_aceitos",
+                     defaults=((),))
+
+
+def _id(rng, d, tabela):
+    return rng.randint(1, d[tabela])
+
+
+def _cada(montar):
+    """Fábrica que chama `montar(rng, d, i)` para cada requisição (aquecimento incluído)."""
+    return lambda rng, d, quantidade, aquecimento: [montar(rng, d, i) for i in range(aquecimento + quantidade)]
+
+
+def _obter(caminho, tabela):
+    return _cada(lambda rng, d, i: ("GET", f"{caminho}/{_id(rng, d, tabela)}", None))
+
+
+def _deletar(caminho, tabela):
+    # o aquecimento usa IDs inexistentes, para não gastar registros; as
+    # medidas usam IDs distintos enquanto houver registros (em tabelas menores
+    # que a quantidade de requisições os IDs se repetem e as seguintes medem o 404)
+    def fabrica(rng, d, quantidade, aquecimento):
+        ids = rng.sample(range(1, d[tabela] + 1), min(quantidade, d[tabela]))
+        return ([("DELETE", f"{caminho}/{d[tabela] + 1 + i}", None) for i in range(aquecimento)]
+                + [("DELETE", f"{caminho}/{ids[i % len(ids)]}", None) for i in range(quantidade)])
+    return fabrica
+
+
+def _lookup(caminho, tabela):
+    return _cada(lambda rng, d, i: (
+        "POST", f"{caminho}/lookup", {"ids": [_id(rng, d, tabela) for _ in range(50)]}))
+
+
+def _aluno(rng, d, i):
+    return {
+        "nome": f"Aluno Bench {i}",
+        "idade": rng.randint(6, 17),
+        "turma_id": _id(rng, d, "turmas"),
+        "data_nascimento": _data_aleatoria(rng, date(2007, 1, 1), date(2019, 12, 31)),
+        "nota_semestre1": round(rng.uniform(0, 10), 1),
+        "nota_semestre2": round(rng.uniform(0, 10), 1),
+    }
+
+
+def _professor(rng, d, i):
+    return {"nome": f"Professor Bench {i}", "idade": rng.randint(25, 65),
+            "materia": rng.choice(MATERIAS), "observacoes": ""}
+
+
+def _reserva(rng, d, i):
+    professor = _id(rng, d, "professores")
+    # datas além das reservas já existentes: nenhuma criação esbarra na capacidade
+    return {"turma_id": _id(rng, d, "turmas"), "professor_id": professor,
+            "professor_nome": f"Professor {professor}", "materia": rng.choice(MATERIAS),
+            "data_reserva": (date(2100, 1, 1) + timedelta(days=i)).isoformat()}
+
+
+def _atividade(rng, d, i):
+    return {"nome_atividade": f"Atividade Bench {i}", "descricao": "", "peso_porcento": 20,
+            "data_entrega": _data_aleatoria(rng, date(2024, 2, 1), date(2024, 12, 15)),
+            "turma_id": _id(rng, d, "turmas"), "professor_id": _id(rng, d, "professores")}
+
+
+def _pagina(caminho, tabela):
+    return _cada(lambda rng, d, i: ("GET", f"{caminho}?limit=100&after={_id(rng, d, tabela) - 1}", None))
+
+
+def _completa(caminho):
+    return _cada(lambda rng, d, i: ("GET", caminho, None))
+
+
+def _cenarios_gerenciamento(recurso, singular, corpo, alteracao):
+    caminho = f"/{recurso}"
+    return [
+        Cenario("gerenciamento", f"{recurso}.criar_{singular}", None,
+                _cada(lambda rng, d, i: ("POST", caminho, corpo(rng, d, i))), None),
+        Cenario("gerenciamento", f"{recurso}.listar_{recurso}", "pagina", _pagina(caminho, recurso), None),
+        Cenario("gerenciamento", f"{recurso}.listar_{recurso}", "completa", _completa(caminho), recurso),
+        Cenario("gerenciamento", f"{recurso}.obter_{singular}", None, _obter(caminho, recurso), None),
+        Cenario("gerenciamento", f"{recurso}.atualizar_{singular}", None, _cada(
+            lambda rng, d, i: ("PUT", f"{caminho}/{_id(rng, d, recurso)}", alteracao(rng, d))), None),
+        Cenario("gerenciamento", f"{recurso}.deletar_{singular}", None, _deletar(caminho, recurso), None, (404,)),
+        Cenario("gerenciamento", f"{recurso}.buscar_{recurso}_por_ids", None, _lookup(caminho, recurso), None),
+    ]
+
+
+CENARIOS = [
+    *_cenarios_gerenciamento("alunos", "aluno", _aluno, lambda rng, d: {
+        "nota_semestre1": round(rng.uniform(0, 10), 1), "nota_semestre2": round(rng.uniform(0, 10), 1)}),
+    Cenario("gerenciamento", "alunos.importar_alunos", None, _cada(
+        lambda rng, d, i: ("POST", "/alunos/bulk", [_aluno(rng, d, i * 100 + j) for j in range(100)])), None),
+    *_cenarios_gerenciamento("professores", "professor", _professor, lambda rng, d: {
+        "materia": rng.choice(MATERIAS)}),
+    *_cenarios_gerenciamento("turmas", "turma", lambda rng, d, i: {
+        "descricao": f"Turma Bench {i}", "ativo": True, "professor_id": _id(rng, d, "professores")},
+        lambda rng, d: {"professor_id": _id(rng, d, "professores")}),
+
+    Cenario("reservas", "reserva_bp.criar_reserva", None,
+            _cada(lambda rng, d, i: ("POST", "/reservas", _reserva(rng, d, i))), None),
+    Cenario("reservas", "reserva_bp.listar_reservas", "turma",
+            _cada(lambda rng, d, i: ("GET", f"/reservas?turma_id={_id(rng, d, 'turmas')}", None)), None),
+    Cenario("reservas", "reserva_bp.listar_reservas", "completa", _completa("/reservas"), "reservas"),
+    Cenario("reservas", "reserva_bp.listar_conflitos", None, _completa("/reservas/conflitos"), None),
+    Cenario("reservas", "reserva_bp.buscar_reserva", None, _obter("/reservas", "reservas"), None),
+    Cenario("reservas", "reserva_bp.atualizar_reserva", None, _cada(lambda rng, d, i: (
+        "PUT", f"/reservas/{_id(rng, d, 'reservas')}",
+        {"materia": rng.choice(MATERIAS), "professor_id": _id(rng, d, "professores")})), None),
+    Cenario("reservas", "reserva_bp.deletar_reserva", None, _deletar("/reservas", "reservas"), None, (404,)),
+
+    Cenario("atividades", "atividade_bp.criar_atividade", None,
+            _cada(lambda rng, d, i: ("POST", "/atividades", _atividade(rng, d, i))), None),
+    Cenario("atividades", "atividade_bp.listar_atividades", "turma",
+            _cada(lambda rng, d, i: ("GET", f"/atividades?turma_id={_id(rng, d, 'turmas')}", None)), None),
+    Cenario("atividades", "atividade_bp.listar_atividades", "completa", _completa("/atividades"), "atividades"),
+    Cenario("atividades", "atividade_bp.obter_atividade", None, _obter("/atividades", "atividades"), None),
+    Cenario("atividades", "atividade_bp.atualizar_atividade", None, _cada(lambda rng, d, i: (
+        "PUT", f"/atividades/{_id(rng, d, 'atividades')}",
+        {"descricao": f"Revisada {i}", "turma_id": _id(rng, d, "turmas")})), None),
+    Cenario("atividades", "atividade_bp.deletar_atividade", None, _deletar("/atividades", "atividades"), None, (404,)),
+
+    Cenario("atividades", "notatividade_bp.criar_nota", None, _cada(lambda rng, d, i: ("POST", "/notas", {
+        "nota": round(rng.uniform(0, 10), 1), "aluno_id": _id(rng, d, "alunos"),
+        "atividade_id": _id(rng, d, "atividades")})), None),
+    Cenario("atividades", "notatividade_bp.listar_notas", "aluno",
+            _cada(lambda rng, d, i: ("GET", f"/notas?aluno_id={_id(rng, d, 'alunos')}", None)), None),
+    Cenario("atividades", "notatividade_bp.listar_notas", "completa", _completa("/notas"), "notas"),
+    Cenario("atividades", "notatividade_bp.obter_nota", None, _obter("/notas", "notas"), None),
+    Cenario("atividades", "notatividade_bp.atualizar_nota", None, _cada(lambda rng, d, i: (
+        "PUT", f"/notas/{_id(rng, d, 'notas')}",
+        {"nota": round(rng.uniform(0, 10), 1), "aluno_id": _id(rng, d, "alunos")})), None),
+    Cenario("atividades", "notatividade_bp.deletar_nota", None, _deletar("/notas", "notas"), None, (404,)),
+
+    Cenario("atividades", "media_bp.medias_da_turma", None, _cada(
+        lambda rng, d, i: ("GET", f"/turmas/{_id(rng, d, 'turmas')}/medias", None)), None),
+    Cenario("atividades", "media_bp.media_do_aluno", None, _cada(
+        lambda rng, d, i: ("GET", f"/alunos/{_id(rng, d, 'alunos')}/media", None)), None),
+    Cenario("atividades", "estatistica_bp.estatisticas_notas", "turma", _cada(
+        lambda rng, d, i: ("GET", f"/notas/estatisticas?turma_id={_id(rng, d, 'turmas')}", None)), None),
+    Cenario("atividades", "estatistica_bp.estatisticas_notas", "completa",
+            _completa("/notas/estatisticas"), None),
+]
+
+
+def nome_cenario(cenario):
+    return f"{cenario.endpoint}[{cenario.variante}]" if cenario.variante else cenario.endpoint
+
+
+# ---------------------------------------------------------------------------
+# Processo de medição (um por cenário)
+# ---------------------------------------------------------------------------
+
+def _rss_atual_mb():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+def _ambiente_wsgi(metodo, caminho, corpo, cabecalhos, dados=None):
+    from werkzeug.test import EnvironBuilder
+
+    construtor = EnvironBuilder(path=caminho, method=metodo, headers=cabecalhos, data=dados,
+                                **({"json": corpo} if corpo is not None else {}))
+    try:
+        return construtor.get_environ()
+    finally:
+        construtor.close()
+
+
+def conectar_em_processo(cliente, app):
+    """
+    Faz o `GerenciamentoClient` falar com `app` (o gerenciamento) no mesmo
+    processo: um adapter do requests montado em `cliente.base_url` chama o
+    app WSGI em vez de abrir uma conexão. Retorna o contador de chamadas.
+    """
+    import requests
+    from requests.adapters import BaseAdapter
+    from requests.structures import CaseInsensitiveDict
+    from requests.utils import get_encoding_from_headers
+    from werkzeug.test import run_wsgi_app
+
+    chamadas = Counter()
+
+    class AdaptadorWsgi(BaseAdapter):
+        def send(self, request, **kwargs):
+            url = requests.utils.urlparse(request.url)
+            # sem Accept-Encoding: a resposta volta sem compressão, como o
+            # urllib3 entregaria depois de descomprimir
+            cabecalhos = {k: v for k, v in request.headers.items() if k.lower() != "accept-encoding"}
+            corpo = request.body.encode() if isinstance(request.body, str) else request.body
+            ambiente = _ambiente_wsgi(request.method, url.path + (f"?{url.query}" if url.query else ""),
+                                      None, cabecalhos, corpo)
+            iterador, status, headers = run_wsgi_app(app, ambiente, buffered=True)
+
+            resposta = requests.Response()
+            resposta.status_code = int(status.split(" ", 1)[0])
+            resposta.reason = status.split(" ", 1)[-1]
+            resposta.headers = CaseInsensitiveDict(headers.items())
+            resposta.encoding = get_encoding_from_headers(resposta.headers)
+            resposta._content = b"".join(iterador)
+            resposta.url, resposta.request = request.url, request
+            chamadas[f"{request.method} {re.sub(r'/[0-9]+', '/<id>', url.path)}"] += 1
+            return resposta
+
+        def close(self):
+            pass
+
+    sessao = requests.Session()
+    sessao.mount(cliente.base_url, AdaptadorWsgi())
+    cliente._session = sessao
+    return chamadas
+
+
+def _montar_app(servico, pasta, banco, banco_gerenciamento):
+    config = {"SQLALCHEMY_DATABASE_URI": f"sqlite:///{banco}", "APISPEC_ARQUIVO": ""}
+    if servico == "gerenciamento":
+        from gerenciamento import create_app
+        return create_app(config), None
+
+    from gerenciamento import create_app as criar_gerenciamento
+    upstream = criar_gerenciamento({"SQLALCHEMY_DATABASE_URI": f"sqlite:///{banco_gerenciamento}",
+                                    "APISPEC_ARQUIVO": ""})
+    sys.path.insert(0, pasta)
+    import run
+    from gerenciamento_client import gerenciamento
+    chamadas = conectar_em_processo(gerenciamento, upstream)
+    return run.create_app(config), chamadas
+
+
+def percentil(ordenados, p):
+    """Percentil por posto mais próximo de uma lista já ordenada."""
+    if not ordenados:
+        return None
+    return ordenados[min(len(ordenados) - 1, max(0, round(p / 100 * len(ordenados)) - 1))]
+
+
+def medir(app, requisicoes, concorrencia, aquecimento, duracao, cabecalhos):
+    """
+    Executa `requisicoes` contra `app` com `concorrencia` threads, até
+    esgotá-las ou passar `duracao` segundos. As `aquecimento` primeiras rodam
+    antes, sem medição.
+    """
+    from werkzeug.test import run_wsgi_app
+
+    def chamar(requisicao):
+        ambiente = _ambiente_wsgi(*requisicao, cabecalhos)
+        inicio = time.perf_counter()
+        iterador, status, _ = run_wsgi_app(app, ambiente, buffered=True)
+        tamanho = sum(len(parte) for parte in iterador)
+        return time.perf_counter() - inicio, int(status.split(" ", 1)[0]), tamanho
+
+    for requisicao in requisicoes[:aquecimento]:
+        chamar(requisicao)
+
+    pendentes = iter(requisicoes[aquecimento:])
+    lock = threading.Lock()
+    resultados = [[] for _ in range(concorrencia)]
+    limite = time.perf_counter() + duracao
+
+    def laco(saida):
+        while time.perf_counter() < limite:
+            with lock:
+                requisicao = next(pendentes, None)
+            if requisicao is None:
+                return
+            saida.append(chamar(requisicao))
+
+    threads = [threading.Thread(target=laco, args=(saida,)) for saida in resultados]
+    inicio = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    decorrido = time.perf_counter() - inicio
+
+    medidas = [m for saida in resultados for m in saida]
+    latencias = sorted(m[0] * 1000 for m in medidas)
+    return {
+        "requisicoes": len(medidas),
+        "duracao_s": round(decorrido, 3),
+        "vazao_rps": round(len(medidas) / decorrido, 1) if decorrido else None,
+        "latencia_ms": {
+            "p50": _arredondar(percentil(latencias, 50)),
+            "p95": _arredondar(percentil(latencias, 95)),
+            "p99": _arredondar(percentil(latencias, 99)),
+            "max": _arredondar(latencias[-1] if latencias else None),
+        },
+        "status": {str(s): n for s, n in sorted(Counter(m[1] for m in medidas).items())},
+        "bytes_por_resposta": round(sum(m[2] for m in medidas) / len(medidas)) if medidas else None,
+    }
+
+
+def _arredondar(valor):
+    return round(valor, 3) if valor is not None else None
+
+
+def trabalhador(spec):
+    logging.disable(logging.WARNING)
+    servico = spec["servico"]
+    pasta = SERVICOS[servico][0]
+    sys.path.insert(0, RAIZ)
+    cenario = next(c for c in CENARIOS if nome_cenario(c) == spec["cenario"])
+
+    app, chamadas = _montar_app(servico, pasta, spec["banco"], spec["banco_gerenciamento"])
+    rng = random.Random(f"{spec['semente']}:{spec['cenario']}")
+    requisicoes = cenario.fabrica(rng, dimensoes(spec["linhas"]), spec["requisicoes"], spec["aquecimento"])
+
+    # instruções SQL de cada requisição (consultas.py), lidas antes do
+    # after_request que confere o orçamento da rota
+    instrucoes = []
+    consultas = app.extensions["consultas"]
+
+    @app.after_request
+    def contar_instrucoes(resposta):
+        instrucoes.append(consultas.instrucoes())
+        return resposta
+
+    rss_inicial = _rss_atual_mb()
+    resultado = medir(app, requisicoes, spec["concorrencia"], spec["aquecimento"], spec["duracao"],
+                      {"Accept-Encoding": spec["accept_encoding"]})
+    resultado["rss_inicial_mb"] = round(rss_inicial, 1)
+    # ru_maxrss em KB no Linux
+    resultado["rss_pico_mb"] = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    if instrucoes:
+        resultado["instrucoes_sql"] = {"max": max(instrucoes),
+                                       "media": round(sum(instrucoes) / len(instrucoes), 2)}
+    if chamadas is not None:
+        resultado["chamadas_gerenciamento"] = dict(sorted(chamadas.items()))
+    print(json.dumps(resultado))
+
+
+def preparar(servico, banco):
+    """Aplica as migrations em `banco` e lista as rotas dos blueprints medidos."""
+    logging.disable(logging.WARNING)
+    pasta, _, blueprints = SERVICOS[servico]
+    sys.path.insert(0, RAIZ)
+    config = {"SQLALCHEMY_DATABASE_URI": f"sqlite:///{banco}", "APISPEC_ARQUIVO": ""}
+    if servico == "gerenciamento":
+        from gerenciamento import create_app
+        app = create_app(config)
+    else:
+        sys.path.insert(0, pasta)
+        import run
+        app = run.create_app(config)
+    endpoints = sorted({regra.endpoint for regra in app.url_map.iter_rules()
+                        if regra.endpoint.split(".", 1)[0] in blueprints})
+    print(json.dumps(endpoints))
+
+
+# ---------------------------------------------------------------------------
+# Orquestração
+# ---------------------------------------------------------------------------
+
+def _executar(servico, argumentos):
+    pasta = SERVICOS[servico][0]
+    processo = subprocess.run([sys.executable, os.path.abspath(__file__), *argumentos], cwd=pasta,
+                              capture_output=True, text=True)
+    if processo.returncode != 0:
+        raise RuntimeError(f"{servico}: {argumentos[0]} falhou\n{processo.stderr[-3000:]}")
+    return json.loads(processo.stdout.strip().splitlines()[-1])
+
+
+def _conferir_cobertura(endpoints_por_servico):
+    # toda rota dos blueprints precisa de um cenário: rota nova sem fábrica
+    # de requisições quebra o benchmark em vez de sumir do relatório
+    cobertos = {(c.servico, c.endpoint) for c in CENARIOS}
+    faltando = [f"{servico}: {endpoint}" for servico, endpoints in endpoints_por_servico.items()
+                for endpoint in endpoints if (servico, endpoint) not in cobertos]
+    if faltando:
+        raise SystemExit("Rotas sem cenário em bench_endpoints.py:\n  " + "\n  ".join(faltando))
+
+
+def _selecionar(filtros):
+    if not filtros:
+        return CENARIOS
+    return [c for c in CENARIOS if any(f == c.servico or f in nome_cenario(c) for f in filtros)]
+
+
+def _commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=RAIZ, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def medir_tamanho(linhas, args, cenarios, temporario):
+    pasta = os.path.join(temporario, f"base_{linhas}")
+    os.makedirs(pasta)
+    endpoints = {servico: _executar(servico, ["--preparar", servico, os.path.join(pasta, banco)])
+                 for servico, (_, banco, _) in SERVICOS.items()}
+    _conferir_cobertura(endpoints)
+
+    inicio = time.perf_counter()
+    popular({servico: os.path.join(pasta, banco) for servico, (_, banco, _) in SERVICOS.items()},
+            dimensoes(linhas), args.semente, DATA_REFERENCIA)
+    print(f"[{linhas}] bases populadas em {time.perf_counter() - inicio:.1f}s", file=sys.stderr)
+
+    d = dimensoes(linhas)
+    resultados = {}
+    for cenario in cenarios:
+        nome = nome_cenario(cenario)
+        if cenario.tabela_completa and d[cenario.tabela_completa] > args.limite_listagem_completa:
+            resultados[nome] = {"ignorado": f"{cenario.tabela_completa} com mais de "
+                                            f"{args.limite_listagem_completa} linhas"}
+            continue
+
+        # cada cenário parte de uma cópia do banco do serviço; o do
+        # gerenciamento chamado em processo só é lido
+        execucao = os.path.join(temporario, "execucao")
+        shutil.rmtree(execucao, ignore_errors=True)
+        os.makedirs(execucao)
+        banco = SERVICOS[cenario.servico][1]
+        shutil.copy(os.path.join(pasta, banco), os.path.join(execucao, banco))
+
+        spec = {
+            "servico": cenario.servico, "cenario": nome, "linhas": linhas, "semente": args.semente,
+            "banco": os.path.join(execucao, banco),
+            "banco_gerenciamento": os.path.join(pasta, SERVICOS["gerenciamento"][1]),
+            "requisicoes": args.requisicoes, "aquecimento": args.aquecimento,
+            "concorrencia": args.concorrencia, "duracao": args.duracao,
+            "accept_encoding": args.accept_encoding,
+        }
+        r = _executar(cenario.servico, ["--trabalhador", json.dumps(spec)])
+        inesperados = {s: n for s, n in r["status"].items()
+                       if not 200 <= int(s) < 300 and int(s) not in cenario.status_aceitos}
+        if inesperados:
+            # latência de respostas de erro não mede a rota: o cenário é reprovado
+            resultados[nome] = {"falhou": f"status inesperados: {inesperados}", "status": r["status"]}
+            print(f"[{linhas}] {nome}: FALHOU status={r['status']}", file=sys.stderr)
+            continue
+        resultados[nome] = r
+        print(f"[{linhas}] {nome}: p50={r['latencia_ms']['p50']}ms p99={r['latencia_ms']['p99']}ms "
+              f"{r['vazao_rps']} req/s status={r['status']}", file=sys.stderr)
+    shutil.rmtree(pasta)
+    return resultados
+
+
+def comparar(base, atual, tolerancia):
+    """
+    Compara dois arquivos de resultado rota a rota. Retorna as linhas do
+    relatório e se houve regressão acima de `tolerancia` (fração) em p95,
+    p99 ou vazão.
+    """
+    linhas, regressao = [], False
+    for tamanho, cenarios in atual["resultados"].items():
+        for nome, depois in cenarios.items():
+            antes = base["resultados"].get(tamanho, {}).get(nome)
+            if not antes or not antes.get("requisicoes") or not depois.get("requisicoes"):
+                continue
+            partes = []
+            for chave in ("p50", "p95", "p99"):
+                a, b = antes["latencia_ms"][chave], depois["latencia_ms"][chave]
+                variacao = (b - a) / a if a else 0.0
+                marca = "!" if chave != "p50" and variacao > tolerancia else ""
+                regressao |= bool(marca)
+                partes.append(f"{chave} {a:.2f}->{b:.2f}ms ({variacao:+.0%}){marca}")
+            a, b = antes["vazao_rps"], depois["vazao_rps"]
+            variacao = (b - a) / a if a else 0.0
+            marca = "!" if -variacao > tolerancia else ""
+            regressao |= bool(marca)
+            partes.append(f"vazao {a}->{b} req/s ({variacao:+.0%}){marca}")
+            partes.append(f"rss {antes['rss_pico_mb']}->{depois['rss_pico_mb']}MB")
+            linhas.append(f"[{tamanho}] {nome}: " + ", ".join(partes))
+    return linhas, regressao
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    parser.add_argument("--cenarios", nargs="+", help="serviços, blueprints ou rotas a medir (por trecho do nome)")
+    parser.add_argument("--concorrencia", type=int, default=8)
+    parser.add_argument("--requisicoes", type=int, default=200, help="requisições medidas por rota")
+    parser.add_argument("--aquecimento", type=int, default=10)
+    parser.add_argument("--duracao", type=float, default=10.0, help="tempo máximo por rota (s)")
+    parser.add_argument("--limite-listagem-completa", type=int, default=100_000)
+    parser.add_argument("--accept-encoding", default="gzip")
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--saida", default="bench_endpoints.json")
+    parser.add_argument("--diretorio", help="onde criar os bancos temporários (padrão: TMPDIR)")
+    parser.add_argument("--comparar", nargs=2, metavar=("BASE", "ATUAL"))
+    parser.add_argument("--tolerancia", type=float, default=0.10)
+    parser.add_argument("--trabalhador", help=argparse.SUPPRESS)
+    parser.add_argument("--preparar", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.trabalhador:
+        return trabalhador(json.loads(args.trabalhador))
+    if args.preparar:
+        return preparar(*args.preparar)
+    if args.comparar:
+        with open(args.comparar[0]) as f, open(args.comparar[1]) as g:
+            linhas, regressao = comparar(json.load(f), json.load(g), args.tolerancia)
+        print("\n".join(linhas))
+        sys.exit(1 if regressao else 0)
+
+    cenarios = _selecionar(args.cenarios)
+    relatorio = {
+        "commit": _commit(),
+        "gerado_em": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "cpus": os.cpu_count(),
+        "parametros": {chave: getattr(args, chave) for chave in (
+            "concorrencia", "requisicoes", "aquecimento", "duracao", "limite_listagem_completa",
+            "accept_encoding", "semente")},
+        "resultados": {},
+    }
+    with tempfile.TemporaryDirectory(dir=args.diretorio) as temporario:
+        for linhas in args.tamanhos:
+            relatorio["resultados"][str(linhas)] = medir_tamanho(linhas, args, cenarios, temporario)
+            # gravado a cada tamanho: uma execução interrompida no 1M mantém os anteriores
+            with open(args.saida, "w", encoding="utf-8") as f:
+                json.dump(relatorio, f, indent=2, ensure_ascii=False)
+    print(args.saida)
+    falhas = [f"[{tamanho}] {nome}: {r['falhou']}" for tamanho, cenarios in relatorio["resultados"].items()
+              for nome, r in cenarios.items() if "falhou" in r]
+    if falhas:
+        raise SystemExit("Cenários com status inesperados:\n  " + "\n  ".join(falhas))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Compara as duas formas de ler uma listagem de alunos:
+
+- "orm": select(Aluno) → instâncias no identity map → Aluno.to_dict;
+- "projecao": select(*Aluno.projecao) → linhas (tuplas) → Aluno.linha_to_dict,
+  o caminho usado hoje por GET /alunos, /professores, /turmas, /reservas,
+  /atividades e /notas.
+
+Para cada um mede o tempo por linha (melhor de N execuções, sessão limpa a
+cada execução) e a memória por linha (pico do tracemalloc durante a leitura
+e serialização, dividido pelo número de linhas).
+
+Uso (a partir da raiz do repositório):
+
+    python benchmarks/bench_leitura.py --linhas 100000
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from sqlalchemy import select
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from bench_serializacao import cronometrar, popular  # noqa: E402
+from gerenciamento import create_app, db  # noqa: E402
+from gerenciamento.Models.Aluno import Aluno  # noqa: E402
+
+
+def ler_orm():
+    return [Aluno.to_dict(aluno) for aluno in db.session.execute(select(Aluno)).scalars().all()]
+
+
+def ler_projecao():
+    return [Aluno.linha_to_dict(linha) for linha in db.session.execute(select(*Aluno.projecao)).all()]
+
+
+def pico_memoria(funcao):
+    db.session.expunge_all()
+    tracemalloc.start()
+    resultado = funcao()
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del resultado
+    return pico
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--linhas", type=int, default=100_000)
+    parser.add_argument("--repeticoes", type=int, default=3)
+    args = parser.parse_args()
+
+    resultado = {"linhas": args.linhas}
+    with tempfile.TemporaryDirectory() as pasta:
+        app = create_app({"SQLALCHEMY_DATABASE_URI": f"sqlite:///{os.path.join(pasta, 'bench.db')}"})
+        with app.app_context():
+            popular(args.linhas)
+            assert ler_orm() == ler_projecao()
+
+            for nome, funcao in (("orm", ler_orm), ("projecao", ler_projecao)):
+                def executar():
+                    db.session.expunge_all()
+                    funcao()
+                tempo = cronometrar(executar, args.repeticoes)
+                pico = pico_memoria(funcao)
+                resultado[nome] = {
+                    "total_s": round(tempo, 4),
+                    "us_por_linha": round(tempo / args.linhas * 1e6, 2),
+                    "pico_mb": round(pico / 2**20, 1),
+                    "bytes_por_linha": round(pico / args.linhas),
+                }
+
+    resultado["ganho_tempo"] = round(resultado["orm"]["total_s"] / resultado["projecao"]["total_s"], 2)
+    resultado["ganho_memoria"] = round(resultado["orm"]["pico_mb"] / resultado["projecao"]["pico_mb"], 2)
+    print(json.dumps(resultado, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Tempo de partida dos três serviços, cada medição num processo novo:
+
+- importacao: importar o módulo do app (Flask, SQLAlchemy, controllers...);
+- create_app: montar o app como na produção, incluindo a checagem/aplicação
+  das migrations (no gerenciamento, importar gerenciamento.run);
+- primeira_requisicao: a primeira GET de uma listagem pelo test client;
+- total: do início do processo até a resposta da primeira requisição.
+
+Dois cenários: "reinicio" (banco já migrado, o caso comum de restart e
+autoscaling) e "banco_novo" (arquivo SQLite inexistente). Também lista
+quais módulos pesados foram carregados até a primeira resposta.
+
+Uso (a partir da raiz do repositório):
+
+    python benchmarks/bench_partida.py --repeticoes 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+SERVICOS = {
+    # nome: (diretório de trabalho, import, montagem do app, rota)
+    "gerenciamento": (RAIZ, "import gerenciamento", "from gerenciamento.run import app", "/alunos"),
+    "reservas": (os.path.join(RAIZ, "Reservas"), "import run", "app = run.create_app()", "/reservas"),
+    "atividades": (os.path.join(RAIZ, "Atividades"), "import run", "app = run.create_app()", "/atividades"),
+}
+
+MODULOS_PESADOS = ("flask_migrate", "alembic", "flasgger", "requests", "numpy", "aiohttp")
+
+MEDICAO = """
+import json, logging, sys, time
+logging.disable(logging.WARNING)
+sys.path.insert(0, ".")
+inicio = time.perf_counter()
+{importacao}
+importado = time.perf_counter()
+{montagem}
+montado = time.perf_counter()
+app.test_client().get("{rota}")
+respondido = time.perf_counter()
+print(json.dumps({{
+    "importacao": importado - inicio,
+    "create_app": montado - importado,
+    "primeira_requisicao": respondido - montado,
+    "total": respondido - inicio,
+    "modulos": [m for m in {modulos!r} if m in sys.modules],
+}}))
+"""
+
+
+def medir(servico, banco, novo, repeticoes):
+    pasta, importacao, montagem, rota = SERVICOS[servico]
+    codigo = MEDICAO.format(importacao=importacao, montagem=montagem, rota=rota, modulos=MODULOS_PESADOS)
+    ambiente = dict(os.environ, DATABASE_URL=f"sqlite:///{banco}")
+    medidas = []
+    for _ in range(repeticoes):
+        if novo and os.path.exists(banco):
+            os.remove(banco)
+        saida = subprocess.run([sys.executable, "-c", codigo], cwd=pasta, env=ambiente,
+                               capture_output=True, text=True, check=True).stdout
+        medidas.append(json.loads(saida.strip().splitlines()[-1]))
+
+    resultado = {chave: round(statistics.median(m[chave] for m in medidas) * 1000, 1)
+                 for chave in ("importacao", "create_app", "primeira_requisicao", "total")}
+    resultado["modulos_carregados"] = medidas[-1]["modulos"]
+    return resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeticoes", type=int, default=5)
+    args = parser.parse_args()
+
+    resultado = {}
+    with tempfile.TemporaryDirectory() as temporario:
+        for servico in SERVICOS:
+            banco = os.path.join(temporario, f"{servico}.db")
+            resultado[servico] = {
+                "banco_novo_ms": medir(servico, banco, True, args.repeticoes),
+                "reinicio_ms": medir(servico, banco, False, args.repeticoes),
+            }
+    print(json.dumps(resultado, indent=2))
+
+
+if __name__ == "__main__":
+    main()
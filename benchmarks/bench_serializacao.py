@@ -0,0 +1,117 @@
+"""
+Compara a serialização das listagens antes e depois do ProvedorJson e dos
+serializadores compilados (gerenciamento/serializacao.py).
+
+- "antigo": to_dict escrito à mão (strftime na data) + provider JSON padrão
+  do Flask (json da biblioteca padrão);
+- "novo": to_dict compilado (datas nativas) + ProvedorJson (orjson).
+
+Os alunos são carregados uma vez pelo ORM; só a serialização (montar os
+dicts + gerar os bytes da resposta) é cronometrada. Ao final, mede também
+GET /alunos completo pelo test client com cada provider (a leitura do banco
+é comparada em bench_leitura.py).
+
+Uso (a partir da raiz do repositório):
+
+    python benchmarks/bench_serializacao.py --linhas 100000
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import date
+
+from flask.json.provider import DefaultJSONProvider
+from sqlalchemy import insert
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from gerenciamento import create_app, db  # noqa: E402
+from gerenciamento.Models.Aluno import Aluno  # noqa: E402
+from gerenciamento.Models.Professor import Professor  # noqa: E402
+from gerenciamento.Models.Turma import Turma  # noqa: E402
+from gerenciamento.serializacao import ProvedorJson, orjson  # noqa: E402
+
+
+def to_dict_antigo(aluno):
+    return {
+        "id": aluno.id,
+        "nome": aluno.nome,
+        "idade": aluno.idade,
+        "turma_id": aluno.turma_id,
+        "data_nascimento": aluno.data_nascimento.strftime("%Y-%m-%d"),
+        "nota_semestre1": aluno.nota_semestre1,
+        "nota_semestre2": aluno.nota_semestre2,
+        "media_final": aluno.media_final
+    }
+
+
+def popular(linhas):
+    db.create_all()
+    db.session.execute(insert(Professor), [
+        {"id": 1, "nome": "Prof", "idade": 40, "materia": "Mat", "observacoes": ""}])
+    db.session.execute(insert(Turma), [{"id": 1, "descricao": "T1", "professor_id": 1, "ativo": True}])
+    db.session.execute(insert(Aluno), [
+        {"nome": f"Aluno {i}", "idade": 10 + i % 8, "turma_id": 1,
+         "data_nascimento": date(2010, 1 + i % 12, 1 + i % 28),
+         "nota_semestre1": (i % 100) / 10, "nota_semestre2": (i % 70) / 10,
+         "media_final": (i % 85) / 10}
+        for i in range(linhas)
+    ])
+    db.session.commit()
+
+
+def cronometrar(funcao, repeticoes):
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--linhas", type=int, default=100_000)
+    parser.add_argument("--repeticoes", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        app = create_app({"SQLALCHEMY_DATABASE_URI": f"sqlite:///{os.path.join(pasta, 'bench.db')}"})
+        padrao, rapido = DefaultJSONProvider(app), ProvedorJson(app)
+
+        with app.app_context():
+            popular(args.linhas)
+            alunos = db.session.execute(db.select(Aluno).order_by(Aluno.id)).scalars().all()
+
+            def antigo():
+                return padrao.response([to_dict_antigo(a) for a in alunos]).get_data()
+
+            def novo():
+                return rapido.response([Aluno.to_dict(a) for a in alunos]).get_data()
+
+            assert json.loads(antigo()) == json.loads(novo())
+            t_antigo = cronometrar(antigo, args.repeticoes)
+            t_novo = cronometrar(novo, args.repeticoes)
+
+        cliente = app.test_client()
+        requisicao = {}
+        for nome, provider in (("antigo", padrao), ("novo", rapido)):
+            app.json = provider
+            requisicao[nome] = cronometrar(lambda: cliente.get("/alunos").get_data(), args.repeticoes)
+
+    resultado = {
+        "linhas": args.linhas,
+        "orjson": orjson is not None,
+        "serializacao_s": {"antigo": round(t_antigo, 4), "novo": round(t_novo, 4),
+                           "ganho": round(t_antigo / t_novo, 2)},
+        "get_alunos_s": {"antigo": round(requisicao["antigo"], 4), "novo": round(requisicao["novo"], 4),
+                         "ganho": round(requisicao["antigo"] / requisicao["novo"], 2)},
+    }
+    print(json.dumps(resultado, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Compara a vazão de leitura/escrita do SQLite com os PRAGMAs padrão e com o
+perfil usado pelos serviços (`SQLITE_PRAGMAS` em config.py).
+
+Uso (a partir da raiz do repositório):
+
+    python benchmarks/bench_sqlite_pragmas.py --leitores 8 --escritores 2 --segundos 5
+"""
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from gerenciamento.config import SQLITE_PRAGMAS, aplicar_pragmas  # noqa: E402
+
+LINHAS_INICIAIS = 50_000
+
+
+def preparar_banco(caminho, pragmas):
+    conn = sqlite3.connect(caminho)
+    if pragmas:
+        aplicar_pragmas(conn, pragmas)
+    conn.execute("CREATE TABLE alunos (id INTEGER PRIMARY KEY, nome TEXT, turma_id INTEGER, media REAL)")
+    conn.executemany(
+        "INSERT INTO alunos (nome, turma_id, media) VALUES (?, ?, ?)",
+        ((f"Aluno {i}", i % 100, (i % 10) + 0.5) for i in range(LINHAS_INICIAIS))
+    )
+    conn.commit()
+    conn.close()
+
+
+def conectar(caminho, pragmas):
+    # timeout=0 desliga a espera do módulo sqlite3; a espera por lock fica
+    # só por conta do PRAGMA busy_timeout de cada perfil.
+    conn = sqlite3.connect(caminho, timeout=0, check_same_thread=False)
+    if pragmas:
+        aplicar_pragmas(conn, pragmas)
+    return conn
+
+
+def leitor(caminho, pragmas, parar, contadores):
+    conn = conectar(caminho, pragmas)
+    ops = erros = 0
+    i = 0
+    while not parar.is_set():
+        i += 1
+        try:
+            conn.execute("SELECT * FROM alunos WHERE id = ?", (i % LINHAS_INICIAIS + 1,)).fetchone()
+            conn.execute("SELECT * FROM alunos WHERE id BETWEEN ? AND ?",
+                         (i % LINHAS_INICIAIS, i % LINHAS_INICIAIS + 50)).fetchall()
+            ops += 1
+        except sqlite3.OperationalError:
+            erros += 1
+    conn.close()
+    contadores.append(("leitura", ops, erros))
+
+
+def escritor(caminho, pragmas, parar, contadores):
+    conn = conectar(caminho, pragmas)
+    ops = erros = 0
+    while not parar.is_set():
+        try:
+            conn.execute("INSERT INTO alunos (nome, turma_id, media) VALUES (?, ?, ?)", ("Novo", ops % 100, 7.5))
+            conn.commit()
+            ops += 1
+        except sqlite3.OperationalError:
+            conn.rollback()
+            erros += 1
+    conn.close()
+    contadores.append(("escrita", ops, erros))
+
+
+def executar(nome, pragmas, args):
+    with tempfile.TemporaryDirectory() as tmp:
+        caminho = os.path.join(tmp, "bench.db")
+        preparar_banco(caminho, pragmas)
+
+        parar = threading.Event()
+        contadores = []
+        threads = [threading.Thread(target=leitor, args=(caminho, pragmas, parar, contadores))
+                   for _ in range(args.leitores)]
+        threads += [threading.Thread(target=escritor, args=(caminho, pragmas, parar, contadores))
+                    for _ in range(args.escritores)]
+        for t in threads:
+            t.start()
+        time.sleep(args.segundos)
+        parar.set()
+        for t in threads:
+            t.join()
+
+    resultado = {"perfil": nome}
+    for tipo in ("leitura", "escrita"):
+        ops = sum(c[1] for c in contadores if c[0] == tipo)
+        erros = sum(c[2] for c in contadores if c[0] == tipo)
+        resultado[f"{tipo}_ops_s"] = round(ops / args.segundos, 1)
+        resultado[f"{tipo}_erros_lock"] = erros
+    return resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--leitores", type=int, default=8)
+    parser.add_argument("--escritores", type=int, default=2)
+    parser.add_argument("--segundos", type=float, default=5)
+    parser.add_argument("--json", help="grava o resultado neste arquivo")
+    args = parser.parse_args()
+
+    resultados = [
+        executar("padrao", {"busy_timeout": SQLITE_PRAGMAS["busy_timeout"]}, args),
+        executar("otimizado", SQLITE_PRAGMAS, args),
+    ]
+
+    print(f"{'perfil':<10} {'leituras/s':>12} {'erros':>7} {'escritas/s':>12} {'erros':>7}")
+    for r in resultados:
+        print(f"{r['perfil']:<10} {r['leitura_ops_s']:>12} {r['leitura_erros_lock']:>7} "
+              f"{r['escrita_ops_s']:>12} {r['escrita_erros_lock']:>7}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(resultados, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,374 @@
+"""
+Gera uma base escolar sintética e determinística para testes de carga,
+gravando direto em school.db (gerenciamento), atividade.db (Atividades) e
+reservas.db (Reservas).
+
+A mesma semente e os mesmos parâmetros produzem sempre os mesmos dados:
+
+- turmas do 1º ao 9º ano, cada uma com um professor;
+- alunos distribuídos entre as turmas, com data_nascimento compatível com o
+  ano da turma e idade calculada a partir dela (na --data-referencia);
+- atividades por turma cujos peso_porcento somam 100;
+- notas de cada aluno nas atividades da sua turma, em torno de um
+  "desempenho" do aluno (coerente com nota_semestre1/nota_semestre2);
+- reservas em dias úteis, no máximo uma por turma e data (a capacidade
+  padrão do serviço de Reservas).
+
+Os bancos são criados/migrados pelo create_app de cada serviço e preenchidos
+com executemany em uma única transação por banco, com PRAGMAs de carga
+(journal_mode=OFF, synchronous=OFF, locking_mode=EXCLUSIVE) e com os índices
+e triggers das tabelas removidos durante a carga e recriados no final.
+
+Por padrão os bancos são os dos serviços (instance/ de cada um); --diretorio
+grava os três em outra pasta. Tabelas que já têm dados só são substituídas
+com --limpar. Sem journal durante a carga, uma geração interrompida deixa as
+tabelas pela metade: rode de novo com --limpar.
+
+Uso (a partir da raiz do repositório):
+
+    python benchmarks/gerar_dados.py --alunos 300000 --turmas 10000 --reservas 10000000
+    python benchmarks/gerar_dados.py --alunos 1000000 --diretorio /tmp/carga --limpar
+"""
+import argparse
+import json
+import math
+import os
+import random
+import sqlite3
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from datetime import date, timedelta
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+SERVICOS = {
+    # nome: (diretório de trabalho, pasta padrão do banco, arquivo, tabelas, migração)
+    "gerenciamento": (RAIZ, os.path.join(RAIZ, "instance"), "school.db", ("professores", "turmas", "alunos"),
+                      "from gerenciamento import create_app\ncreate_app(config)"),
+    "atividades": (os.path.join(RAIZ, "Atividades"), os.path.join(RAIZ, "Atividades", "instance"), "atividade.db",
+                   ("atividades", "notas"), "from run import create_app\ncreate_app(config)"),
+    "reservas": (os.path.join(RAIZ, "Reservas"), os.path.join(RAIZ, "Reservas", "instance"), "reservas.db",
+                 ("reservas",), "from run import create_app\ncreate_app(config)"),
+}
+
+MIGRACAO = """
+import logging, sys
+logging.disable(logging.WARNING)
+sys.path[:0] = [".", {raiz!r}]
+config = {{"SQLALCHEMY_DATABASE_URI": "sqlite:///{banco}", "APISPEC_ARQUIVO": ""}}
+{codigo}
+"""
+
+PRAGMAS_CARGA = {
+    "journal_mode": "OFF",
+    "synchronous": "OFF",
+    "locking_mode": "EXCLUSIVE",
+    "temp_store": "MEMORY",
+    "cache_size": -262144,      # ~256 MB
+}
+
+LOTE_ALUNOS = 20_000
+DATA_REFERENCIA = date(2025, 3, 1)
+SERIES = 9                      # 1º ao 9º ano
+MATERIAS = ("Matemática", "Português", "História", "Geografia", "Ciências", "Inglês", "Artes",
+            "Educação Física")
+NOMES = ("Ana", "Bruno", "Carla", "Daniel", "Eduarda", "Felipe", "Gabriela", "Heitor", "Isabela", "João",
+         "Larissa", "Miguel", "Natália", "Otávio", "Paula", "Rafael", "Sofia", "Thiago", "Valentina", "Yuri")
+SOBRENOMES = ("Silva", "Santos", "Oliveira", "Souza", "Rodrigues", "Ferreira", "Alves", "Pereira", "Lima",
+              "Gomes", "Costa", "Ribeiro", "Martins", "Carvalho", "Almeida", "Lopes", "Soares", "Barbosa")
+
+
+def dimensionar(alunos, turmas=None, professores=None, atividades_por_turma=5, notas_por_aluno=None,
+                reservas=None):
+    """
+    Quantidade de registros por tabela. Sem valores explícitos: ~30 alunos
+    por turma, um professor para cada 3 turmas, nota em todas as atividades
+    da turma e uma reserva por aluno.
+    """
+    turmas = turmas or max(1, alunos // 30)
+    if not 1 <= atividades_por_turma <= 100:
+        raise ValueError("atividades_por_turma deve estar entre 1 e 100 (os pesos somam 100).")
+    notas_por_aluno = atividades_por_turma if notas_por_aluno is None else notas_por_aluno
+    if not 0 <= notas_por_aluno <= atividades_por_turma:
+        raise ValueError("notas_por_aluno deve estar entre 0 e atividades_por_turma.")
+    return {
+        "alunos": alunos,
+        "turmas": turmas,
+        "professores": professores or max(1, turmas // 3),
+        "atividades": turmas * atividades_por_turma,
+        "atividades_por_turma": atividades_por_turma,
+        "notas": alunos * notas_por_aluno,
+        "notas_por_aluno": notas_por_aluno,
+        "reservas": alunos if reservas is None else reservas,
+    }
+
+
+def idade_em(nascimento, referencia):
+    return referencia.year - nascimento.year - ((referencia.month, referencia.day) < (nascimento.month, nascimento.day))
+
+
+def _anos_antes(referencia, anos):
+    try:
+        return referencia.replace(year=referencia.year - anos)
+    except ValueError:  # 29/02
+        return referencia.replace(year=referencia.year - anos, day=28)
+
+
+def _limitar(nota):
+    return round(min(10.0, max(0.0, nota)), 1)
+
+
+def _pesos(rng, quantidade):
+    """`quantidade` pesos inteiros positivos que somam 100."""
+    cortes = sorted(rng.sample(range(1, 100), quantidade - 1))
+    return [b - a for a, b in zip([0, *cortes], [*cortes, 100])]
+
+
+def _dias_uteis(inicio):
+    dia = inicio
+    while True:
+        if dia.weekday() < 5:
+            yield dia
+        dia += timedelta(days=1)
+
+
+# ---------------------------------------------------------------------------
+# Geração (geradores de tuplas na ordem das colunas)
+# ---------------------------------------------------------------------------
+
+class Escola:
+    """
+    Estrutura fixa da base (professores e turmas), mantida em memória por ser
+    pequena; alunos, notas e reservas são gerados em fluxo a partir dela.
+    """
+
+    def __init__(self, d, semente, referencia):
+        self.d = d
+        self.semente = semente
+        self.referencia = referencia
+        rng = self.rng("estrutura")
+        self.professores = [
+            (p, f"{rng.choice(NOMES)} {rng.choice(SOBRENOMES)}", rng.randint(24, 65), rng.choice(MATERIAS))
+            for p in range(1, d["professores"] + 1)
+        ]
+        self.professor_da_turma = [None] + [rng.randint(1, d["professores"]) for _ in range(d["turmas"])]
+        # faixa de nascimento (ordinais) de quem tem a idade da série na data
+        # de referência: 6 anos no 1º ano, 14 no 9º
+        self.nascimentos = [None] + [
+            (_anos_antes(referencia, 6 + serie).toordinal() + 1, _anos_antes(referencia, 5 + serie).toordinal())
+            for serie in range(1, SERIES + 1)
+        ]
+
+    def rng(self, etapa):
+        # um gerador por etapa: mudar a quantidade de uma tabela não altera as outras
+        return random.Random(f"{self.semente}:{etapa}")
+
+    def serie(self, turma):
+        return (turma - 1) % SERIES + 1
+
+    def linhas_professores(self):
+        return ((p, nome, idade, materia, "") for p, nome, idade, materia in self.professores)
+
+    def linhas_turmas(self):
+        for t in range(1, self.d["turmas"] + 1):
+            yield (t, f"{self.serie(t)}º ano - turma {(t - 1) // SERIES + 1}", self.professor_da_turma[t], 1)
+
+    def linhas_atividades(self):
+        rng = self.rng("atividades")
+        k = self.d["atividades_por_turma"]
+        inicio_letivo = date(self.referencia.year, 2, 1).toordinal()
+        fim_letivo = date(self.referencia.year, 12, 10).toordinal()
+        for t in range(1, self.d["turmas"] + 1):
+            entregas = sorted(rng.randint(inicio_letivo, fim_letivo) for _ in range(k))
+            for i, (peso, entrega) in enumerate(zip(_pesos(rng, k), entregas)):
+                yield ((t - 1) * k + i + 1, f"Atividade {i + 1} - {self.serie(t)}º ano", None, peso,
+                       date.fromordinal(entrega).isoformat(), t, self.professor_da_turma[t])
+
+    def lotes_alunos_e_notas(self):
+        """
+        Alunos e as notas de cada um, em lotes de LOTE_ALUNOS alunos: as
+        notas dependem do desempenho do aluno e das atividades da turma dele.
+        """
+        rng = self.rng("alunos")
+        d = self.d
+        k, n = d["atividades_por_turma"], d["notas_por_aluno"]
+        nota_id = 0
+        for inicio in range(1, d["alunos"] + 1, LOTE_ALUNOS):
+            alunos, notas = [], []
+            for a in range(inicio, min(inicio + LOTE_ALUNOS, d["alunos"] + 1)):
+                turma = (a - 1) % d["turmas"] + 1
+                nascimento = date.fromordinal(rng.randint(*self.nascimentos[self.serie(turma)]))
+                desempenho = rng.gauss(7.0, 1.5)
+                nota1, nota2 = _limitar(rng.gauss(desempenho, 1.0)), _limitar(rng.gauss(desempenho, 1.0))
+                alunos.append((a, f"{rng.choice(NOMES)} {rng.choice(SOBRENOMES)} {rng.choice(SOBRENOMES)}",
+                               idade_em(nascimento, self.referencia), turma, nascimento.isoformat(),
+                               nota1, nota2, (nota1 + nota2) / 2))
+
+                primeira = (turma - 1) * k + 1
+                atividades = range(primeira, primeira + k) if n == k else sorted(
+                    rng.sample(range(primeira, primeira + k), n))
+                for atividade in atividades:
+                    nota_id += 1
+                    notas.append((nota_id, _limitar(rng.gauss(desempenho, 1.5)), a, atividade))
+            yield alunos, notas
+
+    def linhas_reservas(self):
+        """
+        Reservas em dias úteis a partir de fevereiro do ano de referência,
+        espalhadas por ~200 dias letivos; cada turma reserva no máximo uma
+        vez por dia.
+        """
+        rng = self.rng("reservas")
+        d = self.d
+        por_dia = min(d["turmas"], max(1, math.ceil(d["reservas"] / 200)))
+        restantes, r = d["reservas"], 0
+        for dia in _dias_uteis(date(self.referencia.year, 2, 1)):
+            if restantes <= 0:
+                return
+            data_reserva = dia.isoformat()
+            for turma in rng.sample(range(1, d["turmas"] + 1), min(por_dia, restantes)):
+                r += 1
+                _, nome, _, materia = self.professores[self.professor_da_turma[turma] - 1]
+                yield (r, turma, self.professor_da_turma[turma], nome, materia, data_reserva)
+            restantes = d["reservas"] - r
+
+
+# ---------------------------------------------------------------------------
+# Carga
+# ---------------------------------------------------------------------------
+
+def migrar(servico, banco):
+    """Cria/atualiza o esquema de `banco` pelo create_app do serviço (migrations)."""
+    pasta, _, _, _, codigo = SERVICOS[servico]
+    subprocess.run([sys.executable, "-c", MIGRACAO.format(raiz=RAIZ, banco=banco, codigo=codigo)],
+                   cwd=pasta, check=True)
+
+
+@contextmanager
+def carga_rapida(conn, tabelas):
+    """
+    PRAGMAs de carga e, durante o bloco, as tabelas sem índices secundários
+    nem triggers (recriados a partir do próprio sqlite_master no final).
+    """
+    for nome, valor in PRAGMAS_CARGA.items():
+        conn.execute(f"PRAGMA {nome}={valor}")
+    marcadores = ", ".join("?" * len(tabelas))
+    objetos = conn.execute(
+        f"SELECT type, name, sql FROM sqlite_master WHERE tbl_name IN ({marcadores}) "
+        "AND type IN ('index', 'trigger') AND sql IS NOT NULL ORDER BY type, name", tabelas).fetchall()
+    for tipo, nome, _ in objetos:
+        conn.execute(f'DROP {tipo.upper()} "{nome}"')
+    try:
+        yield
+    finally:
+        for _, _, sql in objetos:
+            conn.execute(sql)
+        conn.commit()
+    conn.execute("ANALYZE")
+
+
+def _inserir(conn, tabela, colunas, linhas):
+    marcadores = ", ".join("?" * len(colunas))
+    conn.executemany(f"INSERT INTO {tabela} ({', '.join(colunas)}) VALUES ({marcadores})", linhas)
+
+
+def preparar_tabelas(conn, tabelas, limpar):
+    for tabela in tabelas:
+        if conn.execute(f"SELECT EXISTS (SELECT 1 FROM {tabela})").fetchone()[0]:
+            if not limpar:
+                raise SystemExit(f"A tabela {tabela} já tem dados; use --limpar para substituí-los.")
+            conn.execute(f"DELETE FROM {tabela}")
+
+
+def popular(bancos, d, semente, referencia, limpar=False):
+    """
+    Preenche os bancos já migrados (`bancos`: serviço -> caminho) e retorna
+    o tempo de carga de cada tabela, em segundos.
+    """
+    escola = Escola(d, semente, referencia)
+    conexoes = {servico: sqlite3.connect(caminho, isolation_level="DEFERRED") for servico, caminho in bancos.items()}
+    tempos = {}
+
+    def cronometrar(tabela, funcao):
+        inicio = time.perf_counter()
+        funcao()
+        tempos[tabela] = round(time.perf_counter() - inicio, 2)
+
+    try:
+        for servico, conn in conexoes.items():
+            preparar_tabelas(conn, SERVICOS[servico][3], limpar)
+            conn.commit()
+
+        school, atividade, reservas = (conexoes["gerenciamento"], conexoes["atividades"], conexoes["reservas"])
+        with carga_rapida(school, SERVICOS["gerenciamento"][3]), \
+                carga_rapida(atividade, SERVICOS["atividades"][3]):
+            cronometrar("professores", lambda: _inserir(
+                school, "professores", ("id", "nome", "idade", "materia", "observacoes"),
+                escola.linhas_professores()))
+            cronometrar("turmas", lambda: _inserir(
+                school, "turmas", ("id", "descricao", "professor_id", "ativo"), escola.linhas_turmas()))
+            cronometrar("atividades", lambda: _inserir(
+                atividade, "atividades", ("id", "nome_atividade", "descricao", "peso_porcento", "data_entrega",
+                                          "turma_id", "professor_id"), escola.linhas_atividades()))
+
+            def alunos_e_notas():
+                for alunos, notas in escola.lotes_alunos_e_notas():
+                    _inserir(school, "alunos", ("id", "nome", "idade", "turma_id", "data_nascimento",
+                                                "nota_semestre1", "nota_semestre2", "media_final"), alunos)
+                    _inserir(atividade, "notas", ("id", "nota", "aluno_id", "atividade_id"), notas)
+            cronometrar("alunos_e_notas", alunos_e_notas)
+
+        with carga_rapida(reservas, SERVICOS["reservas"][3]):
+            cronometrar("reservas", lambda: _inserir(
+                reservas, "reservas", ("id", "turma_id", "professor_id", "professor_nome", "materia",
+                                       "data_reserva"), escola.linhas_reservas()))
+    finally:
+        for conn in conexoes.values():
+            conn.close()
+    return tempos
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--alunos", type=int, default=100_000)
+    parser.add_argument("--turmas", type=int, help="padrão: alunos / 30")
+    parser.add_argument("--professores", type=int, help="padrão: turmas / 3")
+    parser.add_argument("--atividades-por-turma", type=int, default=5)
+    parser.add_argument("--notas-por-aluno", type=int, help="padrão: todas as atividades da turma")
+    parser.add_argument("--reservas", type=int, help="padrão: uma por aluno")
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--data-referencia", type=date.fromisoformat, default=DATA_REFERENCIA,
+                        help="data usada para calcular a idade e o ano letivo (AAAA-MM-DD)")
+    parser.add_argument("--diretorio", help="grava school.db, atividade.db e reservas.db nesta pasta")
+    parser.add_argument("--limpar", action="store_true", help="apaga os dados existentes das tabelas geradas")
+    args = parser.parse_args()
+
+    d = dimensionar(args.alunos, args.turmas, args.professores, args.atividades_por_turma,
+                    args.notas_por_aluno, args.reservas)
+    bancos = {}
+    for servico, (_, pasta, arquivo, _, _) in SERVICOS.items():
+        pasta = args.diretorio or pasta
+        os.makedirs(pasta, exist_ok=True)
+        bancos[servico] = os.path.abspath(os.path.join(pasta, arquivo))
+
+    inicio = time.perf_counter()
+    for servico, banco in bancos.items():
+        migrar(servico, banco)
+    tempos = popular(bancos, d, args.semente, args.data_referencia, args.limpar)
+    total = time.perf_counter() - inicio
+
+    linhas = sum(d[tabela] for tabela in ("professores", "turmas", "alunos", "atividades", "notas", "reservas"))
+    print(json.dumps({
+        "bancos": bancos,
+        "linhas": {tabela: d[tabela] for tabela in ("professores", "turmas", "alunos", "atividades", "notas",
+                                                    "reservas")},
+        "tempos_s": tempos,
+        "total_s": round(total, 1),
+        "linhas_por_segundo": round(linhas / total),
+    }, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
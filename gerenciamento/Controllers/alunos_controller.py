@@ -2,12 +2,18 @@ from flask import request, jsonify
 from datetime import datetime
 from ..config import db
 from gerenciamento.Models.Aluno import Aluno
+from ..pagination import listar_paginado
+from ..lookup import buscar_por_ids, ler_ids_corpo, ler_ids_query
+from ..importacao import inserir_em_lotes, ler_linhas, validar_alunos
 from flask import Blueprint
 from sqlalchemy.exc import IntegrityError
+from ..versoes import condicional
+from ..consultas import orcamento_consultas
 
 alunos_bp = Blueprint("alunos", __name__)
 
 @alunos_bp.route("/alunos", methods=["POST"])
+@orcamento_consultas(1)
 def criar_aluno():
     """
     Cria um novo aluno
@@ -103,7 +109,119 @@ def criar_aluno():
         return jsonify({"error": "Não foi possível cadastrar aluno. Verifique os dados fornecidos."}), 400
 
 
+@alunos_bp.route("/alunos/bulk", methods=["POST"])
+def importar_alunos():
+    """
+    Importa vários alunos de uma vez
+    ---
+    tags:
+    - Alunos
+    description: Recebe um array JSON de alunos ou um arquivo CSV (campo `arquivo`, ou corpo text/csv) com as colunas nome, idade, turma_id, data_nascimento, nota_semestre1 e nota_semestre2, separado por ',' ou ';' (as notas aceitam vírgula decimal, como 7,5). Todas as linhas são validadas antes da inserção, que é feita em lotes dentro de uma única transação. Por padrão nenhuma linha é inserida se houver erros; com `parcial=true` as linhas válidas são inseridas e as inválidas reportadas.
+    consumes:
+    - application/json
+    - multipart/form-data
+    - text/csv
+    produces:
+    - application/json
+    parameters:
+        - in: query
+          name: parcial
+          type: boolean
+          required: false
+          description: Insere as linhas válidas mesmo que outras tenham erros
+        - in: body
+          name: alunos
+          description: Lista de alunos a serem criados
+          required: false
+          schema:
+            type: array
+            items:
+                type: object
+                properties:
+                    nome:
+                        type: string
+                        example: Maria Silva
+                    idade:
+                        type: integer
+                        example: 20
+                    turma_id:
+                        type: integer
+                        example: 1
+                    data_nascimento:
+                        type: string
+                        format: date
+                        example: 2005-05-15
+                    nota_semestre1:
+                        type: number
+                        format: float
+                        example: 8.5
+                    nota_semestre2:
+                        type: number
+                        format: float
+                        example: 5.0
+    responses:
+        200:
+            description: Alunos importados
+            schema:
+                type: object
+                properties:
+                    message:
+                        type: string
+                        example: 2 alunos importados com sucesso!
+                    inseridos:
+                        type: integer
+                        example: 2
+                    erros:
+                        type: array
+                        items:
+                            type: object
+        400:
+            description: Há linhas inválidas; nada foi inserido
+            schema:
+                type: object
+                properties:
+                    error:
+                        type: string
+                        example: Nenhum aluno importado. Corrija as linhas com erro.
+                    erros:
+                        type: array
+                        items:
+                            type: object
+                            properties:
+                                linha:
+                                    type: integer
+                                    example: 3
+                                erros:
+                                    type: array
+                                    items:
+                                        type: string
+                                    example: ["Campo 'idade' é obrigatório."]
+    """
+    try:
+        linhas = ler_linhas()
+    except (ValueError, UnicodeDecodeError) as e:
+        return jsonify({"error": str(e)}), 400
+
+    validos, erros = validar_alunos(linhas)
+    parcial = request.args.get("parcial", "").lower() in ("1", "true")
+    if erros and not parcial:
+        return jsonify({"error": "Nenhum aluno importado. Corrija as linhas com erro.", "erros": erros}), 400
+
+    try:
+        inserir_em_lotes(Aluno, validos)
+    except IntegrityError:
+        return jsonify({"error": "Não foi possível importar os alunos. Verifique os dados fornecidos."}), 400
+
+    return jsonify({
+        "message": f"{len(validos)} alunos importados com sucesso!",
+        "inseridos": len(validos),
+        "erros": erros
+    }), 200
+
+
 @alunos_bp.route("/alunos", methods=["GET"])
+@condicional("alunos")
+@orcamento_consultas(1)
 def listar_alunos():
     
     """
@@ -114,6 +232,28 @@ def listar_alunos():
     description: Retorna uma lista com todos os alunos existentes.
     produces:
     - application/json
+    - application/x-ndjson
+    parameters:
+        - in: query
+          name: limit
+          type: integer
+          required: false
+          description: Quantidade máxima de alunos por página (1 a 1000)
+        - in: query
+          name: after
+          type: integer
+          required: false
+          description: Cursor de paginação; retorna apenas alunos com ID maior que este valor
+        - in: query
+          name: ids
+          type: string
+          required: false
+          description: "Lista de IDs separados por vírgula (ex: 1,2,3). Retorna {encontrados, faltando} com uma única consulta"
+        - in: query
+          name: somente_ids
+          type: boolean
+          required: false
+          description: Usado com ids; retorna apenas os IDs encontrados, sem os demais campos
     responses:
         200:
             description: Lista de alunos
@@ -160,25 +300,19 @@ def listar_alunos():
                         example: Não foi possível listar os alunos
     """
     try:
-        alunos = Aluno.query.all()
-        resultado = []
-        for aluno in alunos:
-            resultado.append({
-                "id": aluno.id,
-                "nome": aluno.nome,
-                "idade": aluno.idade,
-                "turma_id": aluno.turma_id,
-                "data_nascimento": aluno.data_nascimento.strftime("%Y-%m-%d"),
-                "nota_semestre1": aluno.nota_semestre1,
-                "nota_semestre2": aluno.nota_semestre2,
-                "media_final": aluno.media_final
-            })
-        return jsonify(resultado), 200
+        if "ids" in request.args:
+            ids, somente_ids = ler_ids_query()
+            return buscar_por_ids(Aluno, ids, somente_ids), 200
+        return listar_paginado(Aluno), 200
+    except ValueError as e:
+        return jsonify({"error": f"Parâmetros inválidos: {e}"}), 400
     except Exception:
         return jsonify({"error": "Não foi possível listar os alunos"}), 400
 
 
 @alunos_bp.route("/alunos/<int:aluno_id>", methods=["GET"])
+@condicional("alunos")
+@orcamento_consultas(1)
 def obter_aluno(aluno_id):
 
     """
@@ -242,19 +376,10 @@ def obter_aluno(aluno_id):
     aluno = Aluno.query.get(aluno_id)
     if not aluno:
         return jsonify({"error": "Aluno não encontrado"}), 404
-    resultado = {
-        "id": aluno.id,
-        "nome": aluno.nome,
-        "idade": aluno.idade,      
-        "turma_id": aluno.turma_id,
-        "data_nascimento": aluno.data_nascimento.strftime("%Y-%m-%d"),
-        "nota_semestre1": aluno.nota_semestre1,
-        "nota_semestre2": aluno.nota_semestre2,
-        "media_final": aluno.media_final
-    }
-    return jsonify(resultado), 200
+    return jsonify(aluno.to_dict()), 200
 
 @alunos_bp.route("/alunos/<int:aluno_id>", methods=["PUT"])
+@orcamento_consultas(2)
 def atualizar_aluno(aluno_id):
     """
     Atualiza as informações de um aluno com base em seu ID.
@@ -352,6 +477,7 @@ def atualizar_aluno(aluno_id):
         return jsonify({"error": "Não foi possível atualizar o aluno. Verifique os dados fornecidos."}), 400
     
 @alunos_bp.route("/alunos/<int:aluno_id>", methods=["DELETE"])
+@orcamento_consultas(2)
 def deletar_aluno(aluno_id):
     """
     Exclui um aluno da base de dados baseado em seu ID.
@@ -391,3 +517,64 @@ def deletar_aluno(aluno_id):
     db.session.delete(aluno)
     db.session.commit()
     return jsonify({"message": "Aluno deletado com sucesso!"}), 200
+
+@alunos_bp.route("/alunos/lookup", methods=["POST"])
+@orcamento_consultas(1)
+def buscar_alunos_por_ids():
+    """
+    Busca vários alunos de uma vez a partir de uma lista de IDs.
+    ---
+    tags:
+    - Alunos
+    description: Consulta todos os IDs informados em uma única query e informa quais foram encontrados e quais estão faltando.
+    consumes:
+    - application/json
+    produces:
+    - application/json
+    parameters:
+        - in: body
+          name: ids
+          description: IDs que serão buscados (máximo 1000)
+          required: true
+          schema:
+            type: object
+            required:
+                - ids
+            properties:
+                ids:
+                    type: array
+                    items:
+                        type: integer
+                    example: [1, 2, 3]
+                somente_ids:
+                    type: boolean
+                    example: false
+    responses:
+        200:
+            description: Resultado da busca
+            schema:
+                type: object
+                properties:
+                    encontrados:
+                        type: array
+                        items:
+                            type: object
+                    faltando:
+                        type: array
+                        items:
+                            type: integer
+                        example: [3]
+        400:
+            description: Lista de IDs inválida
+            schema:
+                type: object
+                properties:
+                    error:
+                        type: string
+                        example: "'ids' deve conter apenas números inteiros."
+    """
+    try:
+        ids, somente_ids = ler_ids_corpo()
+        return buscar_por_ids(Aluno, ids, somente_ids), 200
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
@@ -1,13 +1,21 @@
+import logging
+
 from flask import request, jsonify, Blueprint
 from ..config import db
 from gerenciamento.Models.Professor import Professor
+from ..pagination import listar_paginado
+from ..lookup import buscar_por_ids, ler_ids_corpo, ler_ids_query
 from sqlalchemy.exc import IntegrityError
 from werkzeug.exceptions import BadRequest 
+from ..versoes import condicional
+from ..consultas import orcamento_consultas
 
 professores_bp = Blueprint("professores", __name__)
+logger = logging.getLogger(__name__)
 
 
 @professores_bp.route("/professores", methods=["POST"])
+@orcamento_consultas(1)
 def criar_professor():
     """
     Cria um novo professor
@@ -96,15 +104,17 @@ def criar_professor():
     
     except BadRequest as e:
         
-        print(f"Erro de decodificação de JSON: {e}")
+        logger.warning("Erro de decodificação de JSON: %s", e)
         return jsonify({"error": f"Erro de sintaxe no JSON: {e.description}"}), 400
 
     except Exception as e:
         db.session.rollback()
-        print(f"Erro ao criar professor: {e}")
+        logger.exception("Erro ao criar professor")
         return jsonify({"error": "Erro interno do servidor."}), 500
 
 @professores_bp.route("/professores", methods=["GET"])
+@condicional("professores")
+@orcamento_consultas(1)
 def listar_professores():
     """
     Lista todos os professores existentes na base de dados.
@@ -114,6 +124,28 @@ def listar_professores():
     description: Retorna uma lista de todos os professores cadastrados
     produces:
     - application/json
+    - application/x-ndjson
+    parameters:
+        - in: query
+          name: limit
+          type: integer
+          required: false
+          description: Quantidade máxima de professores por página (1 a 1000)
+        - in: query
+          name: after
+          type: integer
+          required: false
+          description: Cursor de paginação; retorna apenas professores com ID maior que este valor
+        - in: query
+          name: ids
+          type: string
+          required: false
+          description: "Lista de IDs separados por vírgula (ex: 1,2,3). Retorna {encontrados, faltando} com uma única consulta"
+        - in: query
+          name: somente_ids
+          type: boolean
+          required: false
+          description: Usado com ids; retorna apenas os IDs encontrados, sem os demais campos
     responses:
         200:
             description: Lista de professores
@@ -147,24 +179,21 @@ def listar_professores():
                         example: Não foi possível listar os professores.
     """
     try:
-        professores = Professor.query.all()
-        resultado = []
-        for professor in professores:
-            resultado.append({
-                "id": professor.id,
-                "nome": professor.nome,
-                "idade": professor.idade,
-                "materia": professor.materia,
-                "observacoes": professor.observacoes if hasattr(professor, 'observacoes') else None # Garante que observacoes é incluído
-            })
-        return jsonify(resultado), 200
+        if "ids" in request.args:
+            ids, somente_ids = ler_ids_query()
+            return buscar_por_ids(Professor, ids, somente_ids), 200
+        return listar_paginado(Professor), 200
+    except ValueError as e:
+        return jsonify({"error": f"Parâmetros inválidos: {e}"}), 400
     except Exception as e:
-        print(f"Erro ao listar professores: {e}")
+        logger.exception("Erro ao listar professores")
         return jsonify({"error": "Não foi possível listar os professores."}), 500
 
 
 
 @professores_bp.route("/professores/<int:professor_id>", methods=["GET"])
+@condicional("professores")
+@orcamento_consultas(1)
 def obter_professor(professor_id):
     
     """
@@ -216,19 +245,13 @@ def obter_professor(professor_id):
         if not professor:
             return jsonify({"error": "Professor não encontrado."}), 404
 
-        resultado = {
-            "id": professor.id,
-            "nome": professor.nome,
-            "idade": professor.idade,
-            "materia": professor.materia,
-            "observacoes": professor.observacoes
-        }
-        return jsonify(resultado), 200
+        return jsonify(professor.to_dict()), 200
     except Exception as e:
-        print(f"Erro ao obter professor por ID: {e}")
+        logger.exception("Erro ao obter professor por ID")
         return jsonify({"error": "Erro interno do servidor."}), 500
 
 @professores_bp.route("/professores/<int:professor_id>", methods=["PUT"])
+@orcamento_consultas(2)
 def atualizar_professor(professor_id):
 
     """
@@ -314,15 +337,16 @@ def atualizar_professor(professor_id):
 
     except BadRequest as e:
         # Captura o erro de sintaxe do JSON (o que estava te dando dor de cabeça)
-        print(f"Erro de decodificação de JSON: {e}")
+        logger.warning("Erro de decodificação de JSON: %s", e)
         return jsonify({"error": f"Erro de sintaxe no JSON: {e.description}"}), 400
         
     except Exception as e:
         db.session.rollback()
-        print(f"Erro (PUT /professores/{professor_id}) ao atualizar professor: {e}")
+        logger.exception("Erro (PUT /professores/%s) ao atualizar professor", professor_id)
         return jsonify({"error": "Erro interno do servidor."}), 500
 
 @professores_bp.route("/professores/<int:professor_id>", methods=["DELETE"])
+@orcamento_consultas(2)
 def deletar_professor(professor_id):
     
     """
@@ -368,8 +392,66 @@ def deletar_professor(professor_id):
         
     except Exception as e:
         db.session.rollback()
-        print(f"Erro ao deletar professor: {e}")
+        logger.exception("Erro ao deletar professor")
         return jsonify({"error": "Erro interno do servidor ao tentar deletar o professor."}), 500
 
-
-
+@professores_bp.route("/professores/lookup", methods=["POST"])
+@orcamento_consultas(1)
+def buscar_professores_por_ids():
+    """
+    Busca vários professores de uma vez a partir de uma lista de IDs.
+    ---
+    tags:
+    - Professores
+    description: Consulta todos os IDs informados em uma única query e informa quais foram encontrados e quais estão faltando.
+    consumes:
+    - application/json
+    produces:
+    - application/json
+    parameters:
+        - in: body
+          name: ids
+          description: IDs que serão buscados (máximo 1000)
+          required: true
+          schema:
+            type: object
+            required:
+                - ids
+            properties:
+                ids:
+                    type: array
+                    items:
+                        type: integer
+                    example: [1, 2, 3]
+                somente_ids:
+                    type: boolean
+                    example: false
+    responses:
+        200:
+            description: Resultado da busca
+            schema:
+                type: object
+                properties:
+                    encontrados:
+                        type: array
+                        items:
+                            type: object
+                    faltando:
+                        type: array
+                        items:
+                            type: integer
+                        example: [3]
+        400:
+            description: Lista de IDs inválida
+            schema:
+                type: object
+                properties:
+                    error:
+                        type: string
+                        example: "'ids' deve conter apenas números inteiros."
+    """
+    try:
+        ids, somente_ids = ler_ids_corpo()
+        return buscar_por_ids(Professor, ids, somente_ids), 200
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
@@ -2,13 +2,18 @@ from flask import request, jsonify
 from datetime import datetime
 from ..config import db
 from gerenciamento.Models.Turma import Turma
+from ..pagination import listar_paginado
+from ..lookup import buscar_por_ids, ler_ids_corpo, ler_ids_query
 from flask import Blueprint
 from sqlalchemy.exc import IntegrityError
 from gerenciamento.Models.Professor import Professor # Importe o Professor para checar a FK
+from ..versoes import condicional
+from ..consultas import orcamento_consultas
 
 turmas_bp = Blueprint("turmas", __name__)
 
 @turmas_bp.route("/turmas", methods=["POST"])
+@orcamento_consultas(2)
 def criar_turma():
 
     """
@@ -85,6 +90,8 @@ def criar_turma():
         return jsonify({"error": f"Erro inesperado ao criar turma: {str(e)}"}), 400
     
 @turmas_bp.route("/turmas", methods=["GET"])
+@condicional("turmas")
+@orcamento_consultas(1)
 def listar_turmas():
 
     """
@@ -95,6 +102,28 @@ def listar_turmas():
     description: Retorna uma lista com todas as turmas cadastradas na base de dados
     produces:
     - application/json
+    - application/x-ndjson
+    parameters:
+        - in: query
+          name: limit
+          type: integer
+          required: false
+          description: Quantidade máxima de turmas por página (1 a 1000)
+        - in: query
+          name: after
+          type: integer
+          required: false
+          description: Cursor de paginação; retorna apenas turmas com ID maior que este valor
+        - in: query
+          name: ids
+          type: string
+          required: false
+          description: "Lista de IDs separados por vírgula (ex: 1,2,3). Retorna {encontrados, faltando} com uma única consulta"
+        - in: query
+          name: somente_ids
+          type: boolean
+          required: false
+          description: Usado com ids; retorna apenas os IDs encontrados, sem os demais campos
     responses:
         200:
             description: Lista das turmas
@@ -125,20 +154,18 @@ def listar_turmas():
                         example: Não foi possível listar as turmas.
     """
     try:
-        turmas = Turma.query.all()
-        resultado = []
-        for turma in turmas:
-            resultado.append({
-                "id": turma.id,
-                "descricao": turma.descricao,
-                "ativo": turma.ativo,
-                "professor_id": turma.professor_id
-            })
-        return jsonify(resultado), 200
+        if "ids" in request.args:
+            ids, somente_ids = ler_ids_query()
+            return buscar_por_ids(Turma, ids, somente_ids), 200
+        return listar_paginado(Turma), 200
+    except ValueError as e:
+        return jsonify({"error": f"Parâmetros inválidos: {e}"}), 400
     except Exception:
         return jsonify({"error": "Não foi possível listar as turmas."}), 400
 
 @turmas_bp.route("/turmas/<int:turma_id>", methods=["GET"])
+@condicional("turmas")
+@orcamento_consultas(1)
 def obter_turma(turma_id):
     
     """
@@ -187,15 +214,10 @@ def obter_turma(turma_id):
     if not turma:
         return jsonify({"error": "Turma não encontrada."}), 404
 
-    resultado = {
-        "id": turma.id,
-        "descricao": turma.descricao,
-        "ativo": turma.ativo,
-        "professor_id": turma.professor_id
-    }
-    return jsonify(resultado), 200
+    return jsonify(turma.to_dict()), 200
 
 @turmas_bp.route("/turmas/<int:turma_id>", methods=["PUT"])
+@orcamento_consultas(3)
 def atualizar_turma(turma_id):
     
     """
@@ -268,6 +290,7 @@ def atualizar_turma(turma_id):
     return jsonify({"message": "Turma atualizada com sucesso!"}), 200
 
 @turmas_bp.route("/turmas/<int:turma_id>", methods=["DELETE"])
+@orcamento_consultas(2)
 def deletar_turma(turma_id):
 
     """
@@ -310,3 +333,64 @@ def deletar_turma(turma_id):
     db.session.delete(turma)
     db.session.commit()
     return jsonify({"message": "Turma excluída com sucesso!"}), 200
+
+@turmas_bp.route("/turmas/lookup", methods=["POST"])
+@orcamento_consultas(1)
+def buscar_turmas_por_ids():
+    """
+    Busca várias turmas de uma vez a partir de uma lista de IDs.
+    ---
+    tags:
+    - Turmas
+    description: Consulta todos os IDs informados em uma única query e informa quais foram encontrados e quais estão faltando.
+    consumes:
+    - application/json
+    produces:
+    - application/json
+    parameters:
+        - in: body
+          name: ids
+          description: IDs que serão buscados (máximo 1000)
+          required: true
+          schema:
+            type: object
+            required:
+                - ids
+            properties:
+                ids:
+                    type: array
+                    items:
+                        type: integer
+                    example: [1, 2, 3]
+                somente_ids:
+                    type: boolean
+                    example: false
+    responses:
+        200:
+            description: Resultado da busca
+            schema:
+                type: object
+                properties:
+                    encontrados:
+                        type: array
+                        items:
+                            type: object
+                    faltando:
+                        type: array
+                        items:
+                            type: integer
+                        example: [3]
+        400:
+            description: Lista de IDs inválida
+            schema:
+                type: object
+                properties:
+                    error:
+                        type: string
+                        example: "'ids' deve conter apenas números inteiros."
+    """
+    try:
+        ids, somente_ids = ler_ids_corpo()
+        return buscar_por_ids(Turma, ids, somente_ids), 200
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
@@ -1,17 +1,19 @@
 from ..config import db
+from ..serializacao import serializavel
 from sqlalchemy import ForeignKey
 
+@serializavel
 class Aluno (db.Model):
     __tablename__ = "alunos"
    
     id = db.Column(db.Integer, primary_key = True)
     nome = db.Column(db.String(100), nullable = False)
     idade = db.Column(db.Integer, nullable = False)
-    turma_id = db.Column(db.Integer, ForeignKey("turmas.id"),nullable=False)
+    turma_id = db.Column(db.Integer, ForeignKey("turmas.id"),nullable=False, index=True)
     data_nascimento = db.Column(db.Date, nullable=False)
     nota_semestre1 = db.Column(db.Float, nullable=False)
     nota_semestre2 = db.Column(db.Float, nullable=False)
     media_final = db.Column(db.Float, nullable=True)
 
     def __repr__(self):
-        return f"<Aluno {self.nome}>"
\ No newline at end of file
+        return f"<Aluno {self.nome}>"
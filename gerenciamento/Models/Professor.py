@@ -1,6 +1,8 @@
 from ..config import db
+from ..serializacao import serializavel
 from sqlalchemy import ForeignKey
 
+@serializavel
 class Professor (db.Model):
     __tablename__ = "professores"
     id = db.Column(db.Integer, primary_key = True)
@@ -10,4 +12,4 @@ class Professor (db.Model):
     observacoes = db.Column(db.String(120), nullable = False)
 
     def __repr__(self):
-        return f"<Professor {self.nome}>"
\ No newline at end of file
+        return f"<Professor {self.nome}>"
@@ -1,13 +1,15 @@
 from ..config import db
+from ..serializacao import serializavel
 from sqlalchemy import ForeignKey, Integer, String, Boolean
 
+@serializavel
 class Turma(db.Model):
     __tablename__ ="turmas"
 
     id = db.Column(Integer, primary_key = True)
     descricao = db.Column(String(100), nullable=False)
-    professor_id = db.Column(Integer, ForeignKey("professores.id"), nullable=False)
+    professor_id = db.Column(Integer, ForeignKey("professores.id"), nullable=False, index=True)
     ativo = db.Column(Boolean, default=True, nullable=False)
 
     def __repr__(self):
-        return f"<Turma {self.descricao}>"
\ No newline at end of file
+        return f"<Turma {self.descricao}>"
@@ -1,15 +1,26 @@
+import os
+
 from flask import Flask
-from .config import db, migrate, swagger
+from .config import db, swagger, configurar_banco
 from .Controllers.main_controller import main_bp
 from .Controllers.alunos_controller import alunos_bp 
 from .Controllers.professor_controller import professores_bp
 from .Controllers.turmas_controller import turmas_bp
+from .versoes import registrar_versoes
+from .compressao import registrar_compressao
+from .metricas import registrar_metricas
+from .consultas import registrar_consultas
+from .serializacao import registrar_json
+from .apispec import carregar_apispec
+from .esquema import garantir_esquema, registrar_migrations
 
-def create_app():
+def create_app(config=None):
     app = Flask(__name__)
     
-    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///school.db" 
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False 
+    if config:
+        app.config.update(config)
+    registrar_json(app)
 
     app.config['SWAGGER'] = {
         'title': 'SISTEMASCOLA-API',
@@ -28,15 +39,24 @@ def create_app():
     }
     
 
-    db.init_app(app)
-    migrate.init_app(app, db)
+    configurar_banco(app, "sqlite:///school.db")
+    registrar_migrations(app, db, os.path.join(app.root_path, "migrations"))
 
     app.register_blueprint(main_bp)
     app.register_blueprint(alunos_bp)
     app.register_blueprint(professores_bp)
     app.register_blueprint(turmas_bp)
-    
+    registrar_versoes(app, db)
+    registrar_compressao(app)
+    registrar_consultas(app, db)
+
+    # confere a revisão do esquema; migrations só rodam se houver pendentes
+    # (ou se o banco for novo)
+    garantir_esquema(app)
+
     swagger.init_app(app)
+    registrar_metricas(app, db)
+    carregar_apispec(app, swagger)
     return app
 
 __all__ = ["create_app", "db"]
@@ -0,0 +1,115 @@
+import logging
+import os
+import re
+
+import click
+from flask.cli import ScriptInfo
+from sqlalchemy import inspect, text
+
+logger = logging.getLogger(__name__)
+
+EXTENSAO = "esquema"
+
+_REVISAO = re.compile(r"^revision\s*=\s*['\"](\w+)['\"]", re.MULTILINE)
+_ANTERIOR = re.compile(r"^down_revision\s*=\s*(.+)$", re.MULTILINE)
+
+
+def revisoes_head(diretorio):
+    """
+    Revisões head das migrations em `diretorio`, lidas das linhas
+    `revision = ...` / `down_revision = ...` dos arquivos de versions/, sem
+    importar o alembic.
+    """
+    revisoes, anteriores = set(), set()
+    pasta = os.path.join(diretorio, "versions")
+    for nome in os.listdir(pasta):
+        if not nome.endswith(".py"):
+            continue
+        with open(os.path.join(pasta, nome), encoding="utf-8") as f:
+            conteudo = f.read()
+        revisao = _REVISAO.search(conteudo)
+        if revisao is None:
+            continue
+        revisoes.add(revisao.group(1))
+        anterior = _ANTERIOR.search(conteudo)
+        if anterior:
+            anteriores.update(re.findall(r"\w+", anterior.group(1)))
+    return revisoes - anteriores
+
+
+def revisoes_aplicadas(db):
+    """Revisões gravadas na tabela alembic_version (vazio em banco novo)."""
+    with db.engine.connect() as conn:
+        if not inspect(conn).has_table("alembic_version"):
+            return set()
+        return set(conn.execute(text("SELECT version_num FROM alembic_version")).scalars())
+
+
+class ComandosMigracao(click.Group):
+    """
+    Grupo `flask db` carregado sob demanda: o Flask-Migrate (e com ele o
+    alembic) só é importado quando um comando de migração é usado.
+    """
+
+    def __init__(self):
+        super().__init__("db", help="Migrations do banco (Flask-Migrate).")
+
+    def _grupo(self, ctx):
+        iniciar_migrate(ctx.ensure_object(ScriptInfo).load_app())
+        from flask_migrate.cli import db as grupo
+        # opções (-d, -x) e callback do grupo original, que prepara o `g`
+        # lido pelos comandos do Flask-Migrate
+        self.params, self.callback = grupo.params, grupo.callback
+        return grupo
+
+    def parse_args(self, ctx, args):
+        self._grupo(ctx)
+        return super().parse_args(ctx, args)
+
+    def list_commands(self, ctx):
+        return self._grupo(ctx).list_commands(ctx)
+
+    def get_command(self, ctx, nome):
+        return self._grupo(ctx).get_command(ctx, nome)
+
+
+def registrar_migrations(app, db, diretorio):
+    """Substitui `migrate.init_app`, adiando o import do Flask-Migrate."""
+    app.extensions[EXTENSAO] = {"db": db, "diretorio": diretorio}
+    app.cli.add_command(ComandosMigracao())
+
+
+def iniciar_migrate(app):
+    """Registra o Flask-Migrate no app (necessário para upgrade/CLI)."""
+    if "migrate" not in app.extensions:
+        from flask_migrate import Migrate
+        config = app.extensions[EXTENSAO]
+        Migrate(app, config["db"], directory=config["diretorio"], render_as_batch=True)
+
+
+def garantir_esquema(app):
+    """
+    Confere se o banco está na revisão head das migrations: um SELECT em
+    alembic_version e a leitura dos arquivos de versions/. Só quando há
+    diferença (banco novo ou migration pendente) o alembic é carregado e o
+    upgrade() aplicado; com MIGRAR_NA_INICIALIZACAO=0 levanta RuntimeError
+    em vez de migrar. Retorna True se aplicou migrations.
+    """
+    config = app.extensions[EXTENSAO]
+    migrar = str(app.config.get("MIGRAR_NA_INICIALIZACAO", os.environ.get("MIGRAR_NA_INICIALIZACAO", "1")))
+
+    with app.app_context():
+        esperadas = revisoes_head(config["diretorio"])
+        aplicadas = revisoes_aplicadas(config["db"])
+        if aplicadas == esperadas:
+            return False
+        if migrar == "0":
+            raise RuntimeError(
+                f"Esquema do banco desatualizado (revisão {sorted(aplicadas) or 'nenhuma'}, "
+                f"esperada {sorted(esperadas)}). Rode `flask db upgrade`.")
+
+        logger.info("Aplicando migrations: %s -> %s", sorted(aplicadas) or "banco novo", sorted(esperadas))
+        iniciar_migrate(app)
+        from flask_migrate import upgrade
+        upgrade()
+        return True
@@ -0,0 +1,149 @@
+import csv
+import io
+import math
+from datetime import datetime
+
+from flask import request
+from sqlalchemy import insert, select
+
+from .config import db
+from .Models.Turma import Turma
+
+TAMANHO_LOTE = 5000
+DELIMITADORES = ",;"
+
+
+def _ler_csv(texto):
+    # o delimitador vem do cabeçalho: planilhas exportadas em pt-BR usam ';'
+    cabecalho = texto.split("\n", 1)[0]
+    try:
+        delimitador = csv.Sniffer().sniff(cabecalho, delimiters=DELIMITADORES).delimiter
+    except csv.Error:
+        delimitador = ","
+    return list(csv.DictReader(io.StringIO(texto), delimiter=delimitador))
+
+
+def ler_linhas():
+    """
+    Lê os registros da requisição: array JSON, arquivo CSV enviado como
+    `multipart/form-data` (campo `arquivo`) ou corpo `text/csv`. O CSV pode
+    ser separado por ',' ou ';' (detectado pelo cabeçalho).
+    Lança ValueError se o formato não for reconhecido.
+    """
+    if "arquivo" in request.files:
+        return _ler_csv(request.files["arquivo"].read().decode("utf-8-sig"))
+    if request.mimetype == "text/csv":
+        return _ler_csv(request.get_data(as_text=True))
+
+    data = request.get_json(silent=True)
+    if not isinstance(data, list):
+        raise ValueError("Envie um array JSON de alunos ou um arquivo CSV no campo 'arquivo'.")
+    return data
+
+
+def _converter(linha, campo, tipo, erros):
+    valor = linha.get(campo)
+    if valor is None or valor == "":
+        erros.append(f"Campo '{campo}' é obrigatório.")
+        return None
+    try:
+        return tipo(valor)
+    except (TypeError, ValueError):
+        erros.append(f"Campo '{campo}' inválido: {valor!r}.")
+        return None
+
+
+def _inteiro(valor):
+    # int() truncaria 10.5 (JSON) e aceitaria True; só valores inteiros passam
+    if isinstance(valor, bool) or (isinstance(valor, float) and not valor.is_integer()):
+        raise ValueError(valor)
+    return int(valor)
+
+
+def _decimal(valor):
+    # aceita vírgula decimal ("7,5"), como nas planilhas em pt-BR
+    if isinstance(valor, bool):
+        raise ValueError(valor)
+    if isinstance(valor, str):
+        valor = valor.strip().replace(",", ".")
+    numero = float(valor)
+    if not math.isfinite(numero):
+        raise ValueError(valor)
+    return numero
+
+
+def _data(valor):
+    return datetime.strptime(valor, "%Y-%m-%d").date()
+
+
+def validar_alunos(linhas):
+    """
+    Valida todas as linhas antes de qualquer INSERT e já calcula `media_final`.
+
+    Retorna `(validos, erros)`, onde `validos` é uma lista de dicts prontos
+    para o INSERT e `erros` é uma lista de `{"linha": n, "erros": [...]}`
+    (linhas numeradas a partir de 1).
+    """
+    validos = []
+    erros = []
+    linhas_por_turma = {}
+
+    for numero, linha in enumerate(linhas, start=1):
+        if not isinstance(linha, dict):
+            erros.append({"linha": numero, "erros": ["Registro deve ser um objeto."]})
+            continue
+
+        erros_linha = []
+        nome = linha.get("nome")
+        if not isinstance(nome, str) or not nome.strip():
+            erros_linha.append("Campo 'nome' é obrigatório.")
+        idade = _converter(linha, "idade", _inteiro, erros_linha)
+        turma_id = _converter(linha, "turma_id", _inteiro, erros_linha)
+        data_nascimento = _converter(linha, "data_nascimento", _data, erros_linha)
+        nota1 = _converter(linha, "nota_semestre1", _decimal, erros_linha)
+        nota2 = _converter(linha, "nota_semestre2", _decimal, erros_linha)
+
+        if erros_linha:
+            erros.append({"linha": numero, "erros": erros_linha})
+            continue
+
+        linhas_por_turma.setdefault(turma_id, []).append(numero)
+        validos.append({
+            "nome": nome.strip(),
+            "idade": idade,
+            "turma_id": turma_id,
+            "data_nascimento": data_nascimento,
+            "nota_semestre1": nota1,
+            "nota_semestre2": nota2,
+            "media_final": (nota1 + nota2) / 2,
+            "_linha": numero
+        })
+
+    # valida todas as turmas referenciadas com uma única consulta
+    if linhas_por_turma:
+        existentes = set(db.session.execute(
+            select(Turma.id).where(Turma.id.in_(list(linhas_por_turma)))
+        ).scalars())
+        invalidas = set()
+        for turma_id, numeros in linhas_por_turma.items():
+            if turma_id not in existentes:
+                invalidas.update(numeros)
+                erros.extend({"linha": n, "erros": [f"Turma {turma_id} não existe."]} for n in numeros)
+        if invalidas:
+            validos = [v for v in validos if v["_linha"] not in invalidas]
+
+    for valido in validos:
+        del valido["_linha"]
+    erros.sort(key=lambda e: e["linha"])
+    return validos, erros
+
+
+def inserir_em_lotes(model, registros, tamanho_lote=TAMANHO_LOTE):
+    """Insere `registros` com executemany, em lotes, numa única transação."""
+    try:
+        for inicio in range(0, len(registros), tamanho_lote):
+            db.session.execute(insert(model), registros[inicio:inicio + tamanho_lote])
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
@@ -0,0 +1,62 @@
+from flask import jsonify, request
+from sqlalchemy import select
+
+from .config import db
+
+MAXIMO_IDS = 1000
+
+
+def _validar_ids(ids):
+    if not isinstance(ids, list):
+        raise ValueError("'ids' deve ser uma lista de inteiros.")
+    try:
+        ids = [int(id) for id in ids]
+    except (TypeError, ValueError):
+        raise ValueError("'ids' deve conter apenas números inteiros.")
+    if not ids:
+        raise ValueError("Informe ao menos um ID.")
+    if len(ids) > MAXIMO_IDS:
+        raise ValueError(f"No máximo {MAXIMO_IDS} IDs por consulta.")
+    # remove duplicados preservando a ordem recebida
+    return list(dict.fromkeys(ids))
+
+
+def ler_ids_query():
+    """Lê `?ids=1,2,3` (e `somente_ids=true`, opcional) da query string."""
+    ids = [id for id in request.args["ids"].split(",") if id.strip()]
+    somente_ids = request.args.get("somente_ids", "").lower() in ("1", "true")
+    return _validar_ids(ids), somente_ids
+
+
+def ler_ids_corpo():
+    """Lê `{"ids": [1, 2, 3]}` do corpo JSON."""
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict) or "ids" not in data:
+        raise ValueError("Corpo JSON deve conter o campo 'ids'.")
+    return _validar_ids(data["ids"]), bool(data.get("somente_ids", False))
+
+
+def buscar_por_ids(model, ids, somente_ids=False):
+    """
+    Busca vários registros de `model` com um único `WHERE id IN (...)`.
+
+    Retorna `{"encontrados": [...], "faltando": [...]}`. Os registros são
+    lidos como linhas de `model.projecao`, sem instanciar o model. Com
+    `somente_ids` apenas a coluna `id` é lida e `encontrados` é uma lista de IDs.
+    """
+    if somente_ids:
+        encontrados = db.session.execute(
+            select(model.id).where(model.id.in_(ids)).order_by(model.id)
+        ).scalars().all()
+        achados = set(encontrados)
+    else:
+        linhas = db.session.execute(
+            select(*model.projecao).where(model.id.in_(ids)).order_by(model.id)
+        ).all()
+        encontrados = [model.linha_to_dict(linha) for linha in linhas]
+        achados = {linha.id for linha in linhas}
+
+    return jsonify({
+        "encontrados": encontrados,
+        "faltando": [id for id in ids if id not in achados]
+    })
@@ -0,0 +1,63 @@
+"""esquema inicial
+
+Cria as tabelas apenas se ainda não existirem, para que bancos criados
+anteriormente com db.create_all() possam entrar no controle de migrations.
+
+Revision ID: 11a0485005e7
+Revises: 
+Create Date: 2026-10-18 08:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '11a0485005e7'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    tabelas = sa.inspect(op.get_bind()).get_table_names()
+
+    if 'professores' not in tabelas:
+        op.create_table('professores',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('nome', sa.String(length=100), nullable=False),
+        sa.Column('idade', sa.Integer(), nullable=False),
+        sa.Column('materia', sa.String(length=100), nullable=False),
+        sa.Column('observacoes', sa.String(length=120), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'turmas' not in tabelas:
+        op.create_table('turmas',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('descricao', sa.String(length=100), nullable=False),
+        sa.Column('professor_id', sa.Integer(), nullable=False),
+        sa.Column('ativo', sa.Boolean(), nullable=False),
+        sa.ForeignKeyConstraint(['professor_id'], ['professores.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'alunos' not in tabelas:
+        op.create_table('alunos',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('nome', sa.String(length=100), nullable=False),
+        sa.Column('idade', sa.Integer(), nullable=False),
+        sa.Column('turma_id', sa.Integer(), nullable=False),
+        sa.Column('data_nascimento', sa.Date(), nullable=False),
+        sa.Column('nota_semestre1', sa.Float(), nullable=False),
+        sa.Column('nota_semestre2', sa.Float(), nullable=False),
+        sa.Column('media_final', sa.Float(), nullable=True),
+        sa.ForeignKeyConstraint(['turma_id'], ['turmas.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+
+
+def downgrade():
+    op.drop_table('alunos')
+    op.drop_table('turmas')
+    op.drop_table('professores')
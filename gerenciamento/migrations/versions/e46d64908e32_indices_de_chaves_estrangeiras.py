@@ -0,0 +1,26 @@
+"""índices de chaves estrangeiras
+
+Revision ID: e46d64908e32
+Revises: 11a0485005e7
+Create Date: 2026-10-18 08:31:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e46d64908e32'
+down_revision = '11a0485005e7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_alunos_turma_id', 'alunos', ['turma_id'], unique=False, if_not_exists=True)
+    op.create_index('ix_turmas_professor_id', 'turmas', ['professor_id'], unique=False, if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index('ix_turmas_professor_id', table_name='turmas')
+    op.drop_index('ix_alunos_turma_id', table_name='alunos')
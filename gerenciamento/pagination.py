@@ -0,0 +1,78 @@
+from urllib.parse import urlencode
+
+from flask import Response, current_app, jsonify, request, stream_with_context
+from sqlalchemy import select
+
+from .config import db
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+LIMITE_MAXIMO = 1000
+YIELD_PER = 500
+
+
+def ler_parametros_paginacao():
+    """Lê `limit` e `after` da query string. Lança ValueError se inválidos."""
+    try:
+        limit = request.args.get("limit")
+        limit = int(limit) if limit is not None else None
+        after = request.args.get("after")
+        after = int(after) if after is not None else None
+    except ValueError:
+        raise ValueError("'limit' e 'after' devem ser números inteiros.")
+
+    if limit is not None and (limit < 1 or limit > LIMITE_MAXIMO):
+        raise ValueError(f"O parâmetro 'limit' deve estar entre 1 e {LIMITE_MAXIMO}.")
+    return limit, after
+
+
+def quer_ndjson():
+    return request.accept_mimetypes.best == NDJSON_MIMETYPE
+
+
+def _consulta(model, limit, after):
+    stmt = select(*model.projecao).order_by(model.id)
+    if after is not None:
+        stmt = stmt.where(model.id > after)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return stmt
+
+
+def _link_proxima_pagina(ultimo_id, limit):
+    args = request.args.to_dict()
+    args["after"] = ultimo_id
+    args["limit"] = limit
+    return f'<{request.base_url}?{urlencode(args)}>; rel="next"'
+
+
+def listar_paginado(model):
+    """
+    Lista `model` ordenado por id.
+
+    Lê só as colunas de `model.projecao` e serializa as linhas com
+    `model.linha_to_dict`, sem instanciar o model nem passar pelo identity map.
+
+    - Sem `limit`/`after`: retorna o array completo (comportamento original).
+    - Com `limit`/`after`: paginação keyset em `id`; o cursor da próxima
+      página vai no header `Link` (rel="next").
+    - Com `Accept: application/x-ndjson`: faz streaming de uma linha JSON por
+      registro a partir de um cursor no servidor, sem montar a lista em memória.
+    """
+    limit, after = ler_parametros_paginacao()
+    stmt = _consulta(model, limit, after)
+    serializar = model.linha_to_dict
+
+    if quer_ndjson():
+        stmt = stmt.execution_options(yield_per=YIELD_PER)
+
+        def gerar():
+            for linha in db.session.execute(stmt):
+                yield current_app.json.dumps(serializar(linha)) + "\n"
+
+        return Response(stream_with_context(gerar()), mimetype=NDJSON_MIMETYPE)
+
+    linhas = db.session.execute(stmt).all()
+    resposta = jsonify([serializar(linha) for linha in linhas])
+    if limit is not None and len(linhas) == limit:
+        resposta.headers["Link"] = _link_proxima_pagina(linhas[-1].id, limit)
+    return resposta
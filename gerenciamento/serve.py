@@ -0,0 +1,72 @@
+"""
+Servidor de produção do gerenciamento: gunicorn com workers pré-forkados
+(gthread), app carregado uma vez no processo mestre e encerramento gracioso
+no SIGTERM (as requisições em andamento terminam antes de o worker sair).
+
+    python -m gerenciamento.serve
+
+Configuração por variáveis de ambiente:
+
+    SERVER_BIND              endereço (padrão 0.0.0.0:5000)
+    SERVER_WORKERS           processos (padrão 2 * núcleos + 1)
+    SERVER_THREADS           threads por processo (padrão 4)
+    SERVER_TIMEOUT           segundos até um worker travado ser reiniciado (padrão 30)
+    SERVER_GRACEFUL_TIMEOUT  segundos para concluir as requisições após SIGTERM (padrão 30)
+    LOG_LEVEL                debug, info, warning, error (padrão info)
+    ACCESS_LOG               arquivo do log de acesso ("-" = stdout, vazio desliga)
+    LOG_CONFIG               arquivo de configuração do logging (formato fileConfig)
+"""
+import logging
+import multiprocessing
+import os
+
+from gunicorn.app.base import BaseApplication
+
+from .config import db
+from .run import app
+
+
+def opcoes(bind_padrao):
+    opcoes = {
+        "bind": os.environ.get("SERVER_BIND", bind_padrao),
+        "workers": int(os.environ.get("SERVER_WORKERS", multiprocessing.cpu_count() * 2 + 1)),
+        "threads": int(os.environ.get("SERVER_THREADS", "4")),
+        "worker_class": "gthread",
+        "timeout": int(os.environ.get("SERVER_TIMEOUT", "30")),
+        "graceful_timeout": int(os.environ.get("SERVER_GRACEFUL_TIMEOUT", "30")),
+        "keepalive": 5,
+        "preload_app": True,
+        "loglevel": os.environ.get("LOG_LEVEL", "info"),
+        "accesslog": os.environ.get("ACCESS_LOG", "-") or None,
+        "errorlog": "-",
+    }
+    if os.environ.get("LOG_CONFIG"):
+        opcoes["logconfig"] = os.environ["LOG_CONFIG"]
+    return opcoes
+
+
+class Servidor(BaseApplication):
+    def __init__(self, app, opcoes):
+        self.app = app
+        self.opcoes = opcoes
+        super().__init__()
+
+    def load_config(self):
+        for nome, valor in self.opcoes.items():
+            self.cfg.set(nome, valor)
+
+    def load(self):
+        # logs do Flask saem pelos handlers/nível configurados no gunicorn
+        gunicorn_logger = logging.getLogger("gunicorn.error")
+        self.app.logger.handlers = gunicorn_logger.handlers
+        self.app.logger.setLevel(gunicorn_logger.level)
+
+        # fecha as conexões abertas pelo mestre (migrations) para que cada
+        # worker comece com o pool vazio em vez de herdar sockets/arquivos
+        with self.app.app_context():
+            db.engine.dispose()
+        return self.app
+
+
+if __name__ == "__main__":
+    Servidor(app, opcoes("0.0.0.0:5000")).run()
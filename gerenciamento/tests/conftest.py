@@ -0,0 +1,18 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from gerenciamento import create_app
+
+
+@pytest.fixture
+def app(tmp_path):
+    return create_app({
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'school.db'}",
+        "APISPEC_ARQUIVO": "",
+        "CONSULTAS_ESTRITO": 1,
+        "TESTING": True,
+    })
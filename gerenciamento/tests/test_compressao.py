@@ -0,0 +1,34 @@
+import os
+
+from gerenciamento import create_app
+
+
+def _respostas(estatisticas, codificacao):
+    return estatisticas["por_codificacao"].get(codificacao, {}).get("respostas", 0)
+
+
+def test_estatisticas_somam_os_workers(app):
+    cliente = app.test_client()
+    antes = _respostas(cliente.get("/compressao").get_json(), "identity")
+
+    pid = os.fork()
+    if pid == 0:
+        # "outro worker": as métricas ficam na memória compartilhada
+        app.test_client().get("/professores")
+        os._exit(0)
+    os.waitpid(pid, 0)
+
+    estatisticas = cliente.get("/compressao").get_json()
+    assert estatisticas["escopo"] == "todos os workers"
+    # a resposta do filho e o GET /compressao anterior
+    assert _respostas(estatisticas, "identity") == antes + 2
+
+
+def test_sem_metricas_responde_pelo_processo(tmp_path):
+    app = create_app({"SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'school.db'}",
+                      "APISPEC_ARQUIVO": "", "METRICAS": 0, "TESTING": True})
+    cliente = app.test_client()
+    cliente.get("/compressao")
+    estatisticas = cliente.get("/compressao").get_json()
+    assert estatisticas["escopo"] == "processo"
+    assert _respostas(estatisticas, "identity") == 1
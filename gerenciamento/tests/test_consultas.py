@@ -0,0 +1,34 @@
+import pytest
+
+from gerenciamento.config import db
+from gerenciamento.consultas import ConsultasRepetidas, OrcamentoExcedido, orcamento_consultas
+from gerenciamento.Models.Aluno import Aluno
+
+
+def test_rota_dentro_do_orcamento(app):
+    cliente = app.test_client()
+    assert cliente.get("/alunos").status_code == 200
+    assert cliente.get("/alunos/1").status_code == 404
+
+
+def test_n_mais_1_levanta_no_modo_estrito(app):
+    @app.route("/teste/n-mais-1")
+    def n_mais_1():
+        for aluno_id in range(1, 6):
+            db.session.get(Aluno, aluno_id)
+        return "", 204
+
+    with pytest.raises(ConsultasRepetidas):
+        app.test_client().get("/teste/n-mais-1")
+
+
+def test_orcamento_estourado_levanta_no_modo_estrito(app):
+    @app.route("/teste/orcamento")
+    @orcamento_consultas(1)
+    def orcamento():
+        db.session.get(Aluno, 1)
+        db.session.execute(db.select(Aluno).limit(1)).all()
+        return "", 204
+
+    with pytest.raises(OrcamentoExcedido):
+        app.test_client().get("/teste/orcamento")
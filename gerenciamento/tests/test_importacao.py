@@ -0,0 +1,43 @@
+import pytest
+
+from gerenciamento.config import db
+from gerenciamento.Models.Aluno import Aluno
+from gerenciamento.Models.Professor import Professor
+from gerenciamento.Models.Turma import Turma
+
+CABECALHO = "nome;idade;turma_id;data_nascimento;nota_semestre1;nota_semestre2\n"
+
+
+@pytest.fixture
+def cliente(app):
+    with app.app_context():
+        db.session.add(Professor(id=1, nome="Ana", idade=40, materia="Matemática", observacoes=""))
+        db.session.add(Turma(id=1, descricao="1A", professor_id=1))
+        db.session.commit()
+    return app.test_client()
+
+
+def test_csv_com_ponto_e_virgula_e_virgula_decimal(app, cliente):
+    corpo = CABECALHO + "Maria;15;1;2010-05-15;7,5;8\n"
+    resposta = cliente.post("/alunos/bulk", data=corpo, content_type="text/csv")
+    assert resposta.status_code == 200, resposta.get_json()
+    with app.app_context():
+        aluno = db.session.execute(db.select(Aluno)).scalar_one()
+        assert (aluno.nota_semestre1, aluno.media_final) == (7.5, 7.75)
+
+
+def test_csv_com_virgula(cliente):
+    corpo = CABECALHO.replace(";", ",") + 'Maria,15,1,2010-05-15,"7,5",8.5\n'
+    assert cliente.post("/alunos/bulk", data=corpo, content_type="text/csv").status_code == 200
+
+
+def test_inteiros_nao_sao_truncados(cliente):
+    corpo = CABECALHO + "Maria;15.5;1;2010-05-15;7;8\n"
+    resposta = cliente.post("/alunos/bulk", data=corpo, content_type="text/csv")
+    assert resposta.status_code == 400
+    assert resposta.get_json()["erros"] == [{"linha": 1, "erros": ["Campo 'idade' inválido: '15.5'."]}]
+
+    alunos = [{"nome": "Maria", "idade": 15, "turma_id": 1.5, "data_nascimento": "2010-05-15",
+               "nota_semestre1": 7, "nota_semestre2": 8}]
+    resposta = cliente.post("/alunos/bulk", json=alunos)
+    assert resposta.get_json()["erros"] == [{"linha": 1, "erros": ["Campo 'turma_id' inválido: 1.5."]}]
@@ -0,0 +1,35 @@
+"""
+Os módulos de infraestrutura são copiados em cada serviço (cada Dockerfile só
+enxerga a própria pasta). A cópia de referência é a do gerenciamento (do
+gerenciamento_client, a de Reservas); uma alteração precisa ir para todas.
+"""
+import os
+
+import pytest
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+COPIAS = {
+    "apispec.py": ("gerenciamento", "Reservas", "Atividades"),
+    "compressao.py": ("gerenciamento", "Reservas", "Atividades"),
+    "config.py": ("gerenciamento", "Reservas", "Atividades"),
+    "consultas.py": ("gerenciamento", "Reservas", "Atividades"),
+    "esquema.py": ("gerenciamento", "Reservas", "Atividades"),
+    "metricas.py": ("gerenciamento", "Reservas", "Atividades"),
+    "serializacao.py": ("gerenciamento", "Reservas", "Atividades"),
+    "versoes.py": ("gerenciamento", "Reservas", "Atividades"),
+    "gerenciamento_client.py": ("Reservas", "Atividades"),
+}
+
+
+def _ler(pasta, modulo):
+    with open(os.path.join(RAIZ, pasta, modulo), encoding="utf-8") as f:
+        return f.read()
+
+
+@pytest.mark.parametrize("modulo", sorted(COPIAS))
+def test_copias_identicas(modulo):
+    referencia, *copias = COPIAS[modulo]
+    esperado = _ler(referencia, modulo)
+    divergentes = [pasta for pasta in copias if _ler(pasta, modulo) != esperado]
+    assert not divergentes, f"{modulo} difere de {referencia}/{modulo} em: {', '.join(divergentes)}"
@@ -0,0 +1,97 @@
+import json
+import re
+
+import pytest
+
+from gerenciamento.config import db
+from gerenciamento.Models.Professor import Professor
+from gerenciamento.pagination import LIMITE_MAXIMO, NDJSON_MIMETYPE
+
+TOTAL = 25
+
+
+@pytest.fixture
+def cliente(app):
+    with app.app_context():
+        db.session.add_all(Professor(nome=f"Professor {i}", idade=30, materia="Matemática", observacoes="")
+                           for i in range(TOTAL))
+        db.session.commit()
+    return app.test_client()
+
+
+def _proxima(resposta):
+    link = resposta.headers.get("Link")
+    if link is None:
+        return None
+    return re.fullmatch(r'<http://localhost(/[^>]+)>; rel="next"', link).group(1)
+
+
+def test_cursor_percorre_todas_as_paginas(cliente):
+    ids, paginas = [], 0
+    caminho = "/professores?limit=10"
+    while caminho:
+        resposta = cliente.get(caminho)
+        assert resposta.status_code == 200
+        ids += [p["id"] for p in resposta.get_json()]
+        paginas += 1
+        caminho = _proxima(resposta)
+    assert ids == list(range(1, TOTAL + 1))
+    assert paginas == 3
+
+
+def test_cursor_mantem_os_demais_parametros(cliente):
+    resposta = cliente.get("/professores?limit=5&after=5")
+    assert [p["id"] for p in resposta.get_json()] == [6, 7, 8, 9, 10]
+    assert _proxima(resposta) == "/professores?limit=5&after=10"
+
+
+def test_sem_parametros_retorna_tudo_sem_link(cliente):
+    resposta = cliente.get("/professores")
+    assert len(resposta.get_json()) == TOTAL
+    assert "Link" not in resposta.headers
+
+
+@pytest.mark.parametrize("after", ["abc", "1.5", "", "0x10"])
+def test_cursor_invalido(cliente, after):
+    resposta = cliente.get(f"/professores?limit=10&after={after}")
+    assert resposta.status_code == 400
+    assert "after" in resposta.get_json()["error"]
+
+
+@pytest.mark.parametrize("after", [TOTAL, 10 ** 12])
+def test_cursor_alem_do_fim(cliente, after):
+    resposta = cliente.get(f"/professores?limit=10&after={after}")
+    assert resposta.status_code == 200
+    assert resposta.get_json() == []
+    assert "Link" not in resposta.headers
+
+
+def test_cursor_negativo_comeca_do_inicio(cliente):
+    assert cliente.get("/professores?limit=3&after=-7").get_json()[0]["id"] == 1
+
+
+@pytest.mark.parametrize("limit", [0, -1, LIMITE_MAXIMO + 1, "dez"])
+def test_limit_fora_dos_limites(cliente, limit):
+    assert cliente.get(f"/professores?limit={limit}").status_code == 400
+
+
+@pytest.mark.parametrize("limit", [1, LIMITE_MAXIMO])
+def test_limit_nos_limites(cliente, limit):
+    resposta = cliente.get(f"/professores?limit={limit}")
+    assert resposta.status_code == 200
+    assert len(resposta.get_json()) == min(limit, TOTAL)
+
+
+def test_ndjson(cliente):
+    resposta = cliente.get("/professores", headers={"Accept": NDJSON_MIMETYPE})
+    assert resposta.status_code == 200
+    assert resposta.mimetype == NDJSON_MIMETYPE
+    assert resposta.is_streamed
+    linhas = resposta.get_data(as_text=True).splitlines()
+    assert [json.loads(linha)["id"] for linha in linhas] == list(range(1, TOTAL + 1))
+
+
+def test_ndjson_respeita_o_cursor(cliente):
+    resposta = cliente.get("/professores?limit=4&after=20", headers={"Accept": NDJSON_MIMETYPE})
+    ids = [json.loads(linha)["id"] for linha in resposta.get_data(as_text=True).splitlines()]
+    assert ids == [21, 22, 23, 24]
@@ -0,0 +1,16 @@
+from datetime import date
+
+from gerenciamento.Models.Aluno import Aluno
+
+ALUNO = {"id": 1, "nome": "Maria", "idade": 15, "turma_id": 1, "data_nascimento": date(2010, 5, 15),
+         "nota_semestre1": 7.5, "nota_semestre2": 8.0, "media_final": 7.75}
+
+
+def test_to_dict_emite_datas_em_iso():
+    esperado = ALUNO | {"data_nascimento": "2010-05-15"}
+    assert Aluno.to_dict(Aluno(**ALUNO)) == esperado
+    assert Aluno.linha_to_dict(tuple(ALUNO[campo] for campo in Aluno.to_dict.campos)) == esperado
+
+
+def test_to_dict_mantem_datas_nulas():
+    assert Aluno.to_dict(Aluno(**ALUNO | {"data_nascimento": None}))["data_nascimento"] is None
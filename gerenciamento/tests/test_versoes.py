@@ -0,0 +1,34 @@
+from sqlalchemy import event
+
+from gerenciamento.config import db
+from gerenciamento.versoes import EXTENSAO
+
+PROFESSOR = {"nome": "Ana", "idade": 40, "materia": "Matemática", "observacoes": ""}
+
+
+def test_escrita_invalida_o_etag(app):
+    cliente = app.test_client()
+    primeira = cliente.get("/professores")
+    etag = primeira.headers["ETag"]
+    assert cliente.get("/professores", headers={"If-None-Match": etag}).status_code == 304
+
+    assert cliente.post("/professores", json=PROFESSOR).status_code == 200
+
+    resposta = cliente.get("/professores", headers={"If-None-Match": etag})
+    assert resposta.status_code == 200
+    assert resposta.headers["ETag"] != etag
+    assert [p["nome"] for p in resposta.get_json()] == ["Ana"]
+
+
+def test_contador_so_muda_depois_do_commit_no_driver(app):
+    versoes = app.extensions[EXTENSAO]
+    vistas = []
+
+    with app.app_context():
+        # o evento "commit" do engine dispara antes do COMMIT no driver
+        event.listen(db.engine, "commit", lambda conn: vistas.append(versoes.versao("professores")))
+        antes = versoes.versao("professores")
+        assert app.test_client().post("/professores", json=PROFESSOR).status_code == 200
+
+    assert vistas == [antes]
+    assert versoes.versao("professores") == antes + 1
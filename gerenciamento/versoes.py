@@ -0,0 +1,115 @@
+import ctypes
+import multiprocessing
+import secrets
+from functools import wraps
+
+from flask import current_app, make_response, request
+from sqlalchemy import event
+
+EXTENSAO = "versoes_tabelas"
+
+
+class VersoesTabelas:
+    """
+    Contador de alterações por tabela, usado como ETag fraca das respostas GET.
+
+    Os contadores ficam em memória compartilhada (RawArray) criada no
+    create_app(). Com o serve.py (preload_app) isso acontece no processo
+    mestre, antes do fork, então um commit em qualquer worker invalida o ETag
+    em todos. `instancia` muda a cada inicialização, para que um ETag emitido
+    antes de um restart não coincida com os contadores recomeçando do zero.
+
+    Escritas feitas por fora do app (outro processo abrindo o mesmo .db) não
+    são vistas.
+    """
+
+    def __init__(self, tabelas):
+        self._indices = {tabela: i for i, tabela in enumerate(tabelas)}
+        self._contadores = multiprocessing.RawArray(ctypes.c_uint64, max(len(tabelas), 1))
+        self._lock = multiprocessing.Lock()
+        self.instancia = secrets.token_hex(4)
+
+    def versao(self, tabela):
+        return self._contadores[self._indices[tabela]]
+
+    def incrementar(self, tabelas):
+        indices = [self._indices[t] for t in tabelas if t in self._indices]
+        if not indices:
+            return
+        with self._lock:
+            for i in indices:
+                self._contadores[i] += 1
+
+    def etag(self, *tabelas):
+        return f"{self.instancia}-" + ".".join(str(self.versao(t)) for t in tabelas)
+
+
+def _tabela_alterada(conn, cursor, statement, parameters, context, executemany):
+    compilado = getattr(context, "compiled", None)
+    if compilado is None or not (context.isinsert or context.isupdate or context.isdelete):
+        return
+    tabela = getattr(compilado.statement, "table", None)
+    if tabela is not None:
+        conn.info.setdefault("tabelas_alteradas", set()).add(tabela.name)
+
+
+def registrar_versoes(app, db):
+    """
+    Cria os contadores das tabelas do `db` e os incrementa a cada COMMIT que
+    tenha executado INSERT/UPDATE/DELETE nelas (ORM ou Core, inclusive os
+    INSERTs em lote). Chamar depois de registrar os blueprints, quando todos
+    os models já foram importados.
+
+    O incremento acontece depois do COMMIT no driver (dialect.do_commit), não
+    no evento "commit" do engine, que dispara antes dele: um GET concorrente
+    que lesse o ETag novo ainda enxergaria os dados antigos e os deixaria em
+    cache sob esse ETag.
+    """
+    versoes = VersoesTabelas(sorted(db.metadata.tables))
+
+    def rollback(conn):
+        conn.info.pop("tabelas_alteradas", None)
+
+    with app.app_context():
+        dialect = db.engine.dialect
+        do_commit = dialect.do_commit
+
+        def commit(dbapi_connection):
+            # dbapi_connection é a conexão do pool: mesmo `info` do Connection
+            do_commit(dbapi_connection)
+            tabelas = dbapi_connection.info.pop("tabelas_alteradas", None)
+            if tabelas:
+                versoes.incrementar(tabelas)
+
+        dialect.do_commit = commit
+        event.listen(db.engine, "after_cursor_execute", _tabela_alterada)
+        event.listen(db.engine, "rollback", rollback)
+
+    app.extensions[EXTENSAO] = versoes
+    return versoes
+
+
+def condicional(*tabelas):
+    """
+    GET condicional: responde 304 sem executar a view (e sem acessar o banco)
+    quando o If-None-Match bate com a versão atual de `tabelas`; caso
+    contrário executa a view e adiciona o ETag às respostas 200.
+
+    O ETag é lido antes da consulta: se houver um commit no meio, o cliente
+    recebe dados mais novos que o ETag e apenas refaz a consulta no próximo
+    GET, nunca o contrário.
+    """
+    def decorador(view):
+        @wraps(view)
+        def condicional_view(*args, **kwargs):
+            etag = current_app.extensions[EXTENSAO].etag(*tabelas)
+            if request.if_none_match.contains_weak(etag):
+                resposta = current_app.response_class(status=304)
+            else:
+                resposta = make_response(view(*args, **kwargs))
+                if resposta.status_code != 200:
+                    return resposta
+            resposta.set_etag(etag, weak=True)
+            return resposta
+        return condicional_view
+    return decorador